@@ -0,0 +1,173 @@
+# Import classes for loading and exporting data
+from convert_data_manager import DataManager, ExportData
+
+# Import the convert_to_bytes function to load and convert a file in one call
+from conversion_cache import convert_to_bytes
+
+# Import the executor classes for running the blocking work outside the event loop
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Import the asyncio module for the asynchronous API
+import asyncio
+
+# Import the os module for replacing the output file
+import os
+
+
+def export_file(input_file: str, output_format: str, output_file: str) -> int:
+    """
+    Loads the input file and exports it to the output file.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+        output_file (str): Path to the output file.
+
+    Returns:
+        int: Number of exported rows.
+
+    Raises:
+        ValueError: If the input file could not be loaded or the output file was not written.
+    """
+    df_load_data = DataManager(input_file).load_data()
+    if df_load_data is None:
+        raise ValueError(f"The input file could not be loaded: {input_file}")
+
+    # Removes the file being replaced, so a failed export is detected below
+    if os.path.exists(output_file):
+        os.remove(output_file)
+
+    ExportData(df_load_data, output_format, output_file).export_data()
+    if not os.path.exists(output_file):
+        raise ValueError(f"The input file could not be exported to {output_format}: {input_file}")
+    return len(df_load_data)
+
+
+def convert_file(input_file: str, output_format: str) -> bytes:
+    """
+    Loads the input file and converts it to the output format.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+
+    Returns:
+        bytes: The converted data.
+
+    Raises:
+        ValueError: If the input file could not be loaded or converted.
+    """
+    data = convert_to_bytes(input_file, output_format)
+    if data is None:
+        raise ValueError(f"The input file could not be converted to {output_format}: {input_file}")
+    return data
+
+
+class AsyncConverter:
+    """
+    The AsyncConverter class provides an asyncio API on top of DataManager, Converter and ExportData.
+
+    The blocking parse and serialize work runs in a thread or process pool, so the
+    event loop is never blocked. A semaphore limits the number of conversions that run
+    at the same time and every conversion can have a timeout.
+
+    A conversion that times out or is cancelled stops waiting at once. Work that has not
+    started yet is dropped, work already running in a thread or process finishes in the
+    background, because Python threads cannot be interrupted.
+
+    Args:
+        max_concurrency (int): Maximum number of conversions running at the same time.
+        use_processes (bool): Use a process pool instead of a thread pool.
+        max_workers (int, optional): Number of workers in the pool, max_concurrency if None.
+        timeout (float, optional): Default timeout of a conversion in seconds, no timeout if None.
+    """
+
+    def __init__(self, max_concurrency: int = 4, use_processes: bool = False, max_workers: int | None = None, timeout: float | None = None) -> None:
+        """
+        Initializes the AsyncConverter class with the concurrency limit and the worker pool.
+
+        Args:
+            max_concurrency (int): Maximum number of conversions running at the same time.
+            use_processes (bool): Use a process pool instead of a thread pool.
+            max_workers (int, optional): Number of workers in the pool, max_concurrency if None.
+            timeout (float, optional): Default timeout of a conversion in seconds, no timeout if None.
+        """
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=max_workers or max_concurrency)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        """
+        Returns the converter for use in an async with block.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """
+        Shuts down the worker pool at the end of an async with block.
+        """
+        self.close()
+
+    async def _run(self, timeout: float | None, function, *args):
+        """
+        Runs a blocking function in the worker pool within the concurrency limit.
+
+        Args:
+            timeout (float, optional): Timeout in seconds, the default timeout if None.
+            function: The blocking function.
+            *args: Arguments of the function.
+
+        Returns:
+            The return value of the function.
+
+        Raises:
+            asyncio.TimeoutError: If the function does not finish in time.
+        """
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, function, *args)
+            return await asyncio.wait_for(future, timeout if timeout is not None else self.timeout)
+
+    async def convert(self, input_file: str, output_format: str, timeout: float | None = None) -> bytes:
+        """
+        Loads the input file and converts it to the output format.
+
+        Args:
+            input_file (str): Path to the input file.
+            output_format (str): Desired output format.
+            timeout (float, optional): Timeout in seconds, the default timeout if None.
+
+        Returns:
+            bytes: The converted data.
+
+        Raises:
+            ValueError: If the input file could not be loaded or converted.
+            asyncio.TimeoutError: If the conversion does not finish in time.
+        """
+        return await self._run(timeout, convert_file, input_file, output_format)
+
+    async def export(self, input_file: str, output_format: str, output_file: str, timeout: float | None = None) -> int:
+        """
+        Loads the input file and exports it to the output file.
+
+        Args:
+            input_file (str): Path to the input file.
+            output_format (str): Desired output format.
+            output_file (str): Path to the output file.
+            timeout (float, optional): Timeout in seconds, the default timeout if None.
+
+        Returns:
+            int: Number of exported rows.
+
+        Raises:
+            ValueError: If the input file could not be loaded or the output file was not written.
+            asyncio.TimeoutError: If the export does not finish in time.
+        """
+        return await self._run(timeout, export_file, input_file, output_format, output_file)
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool, dropping the work that has not started yet.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,218 @@
+# Import classes for loading and exporting data
+from convert_data_manager import DataManager, ExportData
+
+# Import the ProcessPoolExecutor class for running conversions in parallel processes
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Import the codec_from_suffix function for naming the output of compressed input files
+from compressed_io import codec_from_suffix
+
+# Import modules for parsing command line arguments, matching paths and measuring time
+import argparse
+import glob
+import os
+import sys
+import time
+
+
+def collect_input_files(input_path: str) -> list[str]:
+    """
+    Collects the input files from a directory or a glob pattern.
+
+    Args:
+        input_path (str): Path to a directory or a glob pattern, e.g. 'dataset/*.csv'.
+
+    Returns:
+        list[str]: Sorted list of paths to the input files.
+    """
+    if os.path.isdir(input_path):
+        # All files directly in the directory, subdirectories are skipped
+        paths = [os.path.join(input_path, name) for name in os.listdir(input_path)]
+    else:
+        paths = glob.glob(input_path, recursive=True)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def output_paths_for(input_files: list[str], output_format: str, output_dir: str | None) -> list[str]:
+    """
+    Builds the output file paths from the input file names and the output format.
+
+    Input files with the same name but a different extension, e.g. iris.csv and
+    iris.json, get the input extension added to the output name (iris_csv.xml,
+    iris_json.xml), so they do not overwrite each other. The compression extension of
+    compressed input files is dropped, e.g. mock_data.csv.gz is written to mock_data.xml,
+    unless the name collides, then it is kept as well (a_csv.xml, a_csv_gz.xml). Output
+    paths that are still shared, e.g. by a.csv and a_csv.json, get a number appended.
+
+    Args:
+        input_files (list[str]): Paths to the input files.
+        output_format (str): Desired output format.
+        output_dir (str, optional): Output directory, the directory of each input file if None.
+
+    Returns:
+        list[str]: Paths to the output files, in the order of input_files.
+    """
+    stems = []
+    for input_file in input_files:
+        directory, name = os.path.split(input_file)
+        codec_suffix = ''
+        if codec_from_suffix(name) is not None:
+            name, codec_suffix = os.path.splitext(name)
+        stem, suffix = os.path.splitext(name)
+        stems.append((output_dir or directory, stem, suffix + codec_suffix))
+
+    # Counts the output names, so the colliding ones can be told apart
+    counts = {}
+    for directory, stem, _ in stems:
+        counts[(directory, stem)] = counts.get((directory, stem), 0) + 1
+
+    output_files = []
+    # Normalized output paths already taken
+    taken = set()
+    for directory, stem, suffix in stems:
+        if counts[(directory, stem)] > 1 and suffix:
+            stem = f"{stem}_{suffix.lstrip('.').replace('.', '_')}"
+        output_file = os.path.join(directory, f"{stem}.{output_format}")
+        number = 1
+        while os.path.normcase(os.path.abspath(output_file)) in taken:
+            number += 1
+            output_file = os.path.join(directory, f"{stem}_{number}.{output_format}")
+        taken.add(os.path.normcase(os.path.abspath(output_file)))
+        output_files.append(output_file)
+    return output_files
+
+
+def convert_file(input_file: str, output_format: str, output_file: str, overwrite: bool = False) -> dict:
+    """
+    Loads one input file and exports it in the output format.
+
+    Runs in a worker process, so every error is caught and returned in the status
+    instead of stopping the whole batch. An existing output file is only replaced
+    with overwrite, so e.g. the XML next to a CSV input is not lost by accident.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+        output_file (str): Path to the output file.
+        overwrite (bool): Replace the output file if it exists.
+
+    Returns:
+        dict: Status of the conversion with the keys input_file, output_file, status, rows, seconds and error.
+    """
+    start = time.perf_counter()
+    result = {'input_file': input_file, 'output_file': output_file, 'status': 'failed', 'rows': 0, 'seconds': 0.0, 'error': None}
+
+    try:
+        if os.path.abspath(output_file) == os.path.abspath(input_file):
+            raise ValueError("The output file would overwrite the input file.")
+        if os.path.exists(output_file) and not overwrite:
+            raise ValueError(f"The output file {output_file} already exists, use --overwrite to replace it.")
+
+        # Loads the data, DataManager prints the reason and returns None on failure
+        df_load_data = DataManager(input_file).load_data()
+        if df_load_data is None:
+            raise ValueError("The input file could not be loaded.")
+
+        # Removes the file being replaced, so a failed export is detected below
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+        ExportData(df_load_data, output_format, output_file).export_data()
+        if not os.path.exists(output_file):
+            raise ValueError("The output file was not written.")
+
+        result['status'] = 'ok'
+        result['rows'] = len(df_load_data)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def convert_batch(input_files: list[str], output_format: str, output_dir: str | None = None, max_workers: int | None = None,
+                  overwrite: bool = False) -> list[dict]:
+    """
+    Converts the input files in parallel using a pool of worker processes.
+
+    Args:
+        input_files (list[str]): Paths to the input files.
+        output_format (str): Desired output format.
+        output_dir (str, optional): Output directory, the directory of each input file if None.
+        max_workers (int, optional): Number of worker processes, the number of CPUs if None.
+        overwrite (bool): Replace existing output files, otherwise their conversions fail.
+
+    Returns:
+        list[dict]: Status of every conversion, in the order of input_files.
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    output_files = output_paths_for(input_files, output_format, output_dir)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(convert_file, input_file, output_format, output_file, overwrite): (input_file, output_file)
+            for input_file, output_file in zip(input_files, output_files)
+        }
+        for future in as_completed(futures):
+            input_file, output_file = futures[future]
+            try:
+                results[input_file] = future.result()
+            except Exception as e:
+                # A crashed worker process fails only its own file
+                results[input_file] = {'input_file': input_file, 'output_file': output_file, 'status': 'failed', 'rows': 0, 'seconds': 0.0, 'error': f"{type(e).__name__}: {e}"}
+    return [results[input_file] for input_file in input_files]
+
+
+def print_summary(results: list[dict], total_seconds: float) -> None:
+    """
+    Prints the status and timing of every conversion and the totals.
+
+    Args:
+        results (list[dict]): Status of every conversion returned by convert_batch().
+        total_seconds (float): Wall time of the whole batch in seconds.
+    """
+    for result in results:
+        line = f"{result['status'].upper():6} {result['seconds']:8.3f}s {result['rows']:>10} rows  {result['input_file']}"
+        if result['error']:
+            line += f"  ({result['error']})"
+        print(line)
+
+    failed = sum(1 for result in results if result['status'] != 'ok')
+    print(f"Converted {len(results) - failed} of {len(results)} files in {total_seconds:.3f}s, {failed} failed.")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the batch conversion from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 0 if all files were converted, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(description="Convert all files in a directory or matching a glob pattern.")
+    parser.add_argument('input_path', help="Directory or glob pattern of the input files, e.g. 'dataset/*.csv'.")
+    parser.add_argument('output_format', help="Output format: csv, json, jsonl, xml, xlsx, html, md or tex.")
+    parser.add_argument('-o', '--output-dir', help="Output directory, the directory of each input file by default.")
+    parser.add_argument('-w', '--workers', type=int, help="Number of worker processes, the number of CPUs by default.")
+    parser.add_argument('--overwrite', action='store_true', help="Replace existing output files, they are skipped as failed by default.")
+    args = parser.parse_args(argv)
+
+    input_files = collect_input_files(args.input_path)
+    if not input_files:
+        print(f"No input files found: {args.input_path}")
+        return 1
+
+    start = time.perf_counter()
+    results = convert_batch(input_files, args.output_format, args.output_dir, args.workers, args.overwrite)
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(result['status'] == 'ok' for result in results) else 1
+
+
+# Execute code only when script is run directly, not imported as a module
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# Import classes for loading, converting and exporting data
+from convert_data_manager import DataManager, Converter, ExportData
+
+# Import the BufferManager class to hold the converted data
+from io_buffer import BufferManager
+
+# Import the ProcessPoolExecutor class for running every case in a fresh process
+from concurrent.futures import ProcessPoolExecutor
+
+# Import modules for parsing command line arguments, working with files and measuring time
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+# Import pandas library for generating the scaled inputs
+import pandas as pd
+
+# The resource module is used for the peak RSS and is not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# Directory of the input fixtures, next to this script, so the benchmark runs from any working directory
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dataset')
+
+# Input fixtures from the dataset directory
+DATASET_FILES = [
+    os.path.join(DATASET_DIR, name) for name in (
+        'iris.csv', 'iris.html', 'iris.json', 'iris.xlsx', 'iris.xml',
+        'mock_data.csv', 'mock_data.html', 'mock_data.json', 'mock_data.xlsx', 'mock_data.xml',
+    )
+]
+
+# Timed stages of every case
+STAGES = ('load_seconds', 'convert_seconds', 'export_seconds')
+
+# Input formats of the scaled synthetic files
+INPUT_FORMATS = ['csv', 'html', 'json', 'xlsx', 'xml']
+
+# Output formats every input is converted to
+OUTPUT_FORMATS = ['csv', 'json', 'xml', 'xlsx', 'html', 'md', 'tex']
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Returns the peak resident set size of the current process.
+
+    Returns:
+        float or None: Peak RSS in megabytes, None if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def generate_scaled_inputs(scales: list[int], input_formats: list[str], output_dir: str) -> list[str]:
+    """
+    Writes copies of mock_data scaled to the given multiples of its rows.
+
+    Args:
+        scales (list[int]): Row multipliers, e.g. [10, 100, 1000].
+        input_formats (list[str]): Formats the scaled files are written in.
+        output_dir (str): Directory of the scaled files.
+
+    Returns:
+        list[str]: Paths to the scaled files.
+    """
+    df_mock_data = pd.read_csv(os.path.join(DATASET_DIR, 'mock_data.csv'))
+    paths = []
+    for scale in scales:
+        df_scaled = pd.concat([df_mock_data] * scale, ignore_index=True)
+        df_scaled['id'] = range(1, len(df_scaled) + 1)
+        for input_format in input_formats:
+            path = os.path.join(output_dir, f"mock_data_x{scale}.{input_format}")
+            ExportData(df_scaled, input_format, path).export_data()
+            paths.append(path)
+    return paths
+
+
+def run_case(input_file: str, output_format: str, output_dir: str, repeat: int = 5) -> dict:
+    """
+    Times the load, convert and export stages of one input to output format pair.
+
+    Runs in its own worker process, so the peak RSS belongs to this case only. Every
+    stage is run repeat times and its fastest time is kept, which is the time least
+    disturbed by other processes; the times of all runs are kept as well.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+        output_dir (str): Directory for the exported file.
+        repeat (int): Number of runs of the case.
+
+    Returns:
+        dict: Timings in seconds, row count, sizes, throughput and peak RSS of the case.
+    """
+    result = {'input_file': input_file, 'output_format': output_format, 'error': None}
+    runs = {stage: [] for stage in STAGES}
+
+    try:
+        input_bytes = os.path.getsize(input_file)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            df_load_data = DataManager(input_file).load_data()
+            runs['load_seconds'].append(time.perf_counter() - start)
+            if df_load_data is None:
+                raise ValueError("The input file could not be loaded.")
+
+            buffer_manager = BufferManager()
+            file_converter = Converter(df_load_data, output_format, buffer_manager=buffer_manager)
+            start = time.perf_counter()
+            file_converter.convert_data()
+            runs['convert_seconds'].append(time.perf_counter() - start)
+            output_bytes = len(file_converter.read_bytes())
+
+            output_file = os.path.join(output_dir, f"{os.getpid()}.{output_format}")
+            start = time.perf_counter()
+            ExportData(df_load_data, output_format, output_file).export_data()
+            runs['export_seconds'].append(time.perf_counter() - start)
+            if os.path.exists(output_file):
+                os.remove(output_file)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    load_seconds, convert_seconds, export_seconds = (min(runs[stage]) for stage in STAGES)
+    total_seconds = load_seconds + convert_seconds
+    rows = len(df_load_data)
+    result.update({
+        'rows': rows,
+        'input_bytes': input_bytes,
+        'output_bytes': output_bytes,
+        'load_seconds': load_seconds,
+        'convert_seconds': convert_seconds,
+        'export_seconds': export_seconds,
+        'runs': runs,
+        'rows_per_second': rows / total_seconds if total_seconds else None,
+        'mb_per_second': input_bytes / (1024 * 1024) / total_seconds if total_seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+    })
+    return result
+
+
+def case_key(result: dict) -> str:
+    """
+    Returns the key a case is matched by when comparing with the baseline.
+
+    Args:
+        result (dict): Result of run_case().
+
+    Returns:
+        str: The key, e.g. 'mock_data.csv->json'.
+    """
+    return f"{os.path.basename(result['input_file'])}->{result['output_format']}"
+
+
+def compare_with_baseline(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Compares the fastest load, convert and export times with a saved baseline.
+
+    Args:
+        results (list[dict]): Results of the current run.
+        baseline (list[dict]): Results of the baseline run.
+        threshold (float): Allowed slowdown, e.g. 0.1 for 10 %.
+
+    Returns:
+        list[str]: Descriptions of the cases that got slower than the threshold.
+    """
+    baseline_by_key = {case_key(result): result for result in baseline if not result['error']}
+    regressions = []
+    for result in results:
+        previous = baseline_by_key.get(case_key(result))
+        if result['error'] or previous is None:
+            continue
+        for stage in STAGES:
+            if previous[stage] and result[stage] > previous[stage] * (1 + threshold):
+                change = result[stage] / previous[stage] - 1
+                regressions.append(f"{case_key(result)} {stage}: {previous[stage]:.4f}s -> {result[stage]:.4f}s (+{change:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the benchmark from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 1 if a case got slower than the baseline, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark every input to output format pair.")
+    parser.add_argument('--scales', type=int, nargs='*', default=[10, 100, 1000], help="Row multipliers of the synthetic mock_data inputs.")
+    parser.add_argument('--input-formats', nargs='*', default=INPUT_FORMATS, help="Formats of the synthetic inputs.")
+    parser.add_argument('--output-formats', nargs='*', default=OUTPUT_FORMATS, help="Output formats to benchmark.")
+    parser.add_argument('--output', default='benchmark_results.json', help="File the results are written to.")
+    parser.add_argument('--baseline', help="Results of a previous run to compare with.")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs of every case, the fastest run is compared with the baseline.")
+    parser.add_argument('--threshold', type=float, default=0.1, help="Allowed slowdown against the baseline, 0.1 is 10 %%.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_files = DATASET_FILES + generate_scaled_inputs(args.scales, args.input_formats, temp_dir)
+
+        # Every case runs in a fresh process, so the peak RSS of one case does not affect the next
+        results = []
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+            futures = [executor.submit(run_case, input_file, output_format, temp_dir, args.repeat) for input_file in input_files for output_format in args.output_formats]
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                if result['error']:
+                    print(f"{case_key(result):40} ERROR {result['error']}")
+                else:
+                    print(f"{case_key(result):40} load {result['load_seconds']:8.4f}s  convert {result['convert_seconds']:8.4f}s  "
+                          f"export {result['export_seconds']:8.4f}s  {result['rows_per_second'] or 0:12.0f} rows/s  peak {result['peak_rss_mb'] or 0:8.1f} MB")
+
+    report = {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"SLOWER {regression}")
+        print(f"{len(regressions)} stages slower than the baseline by more than {args.threshold:.0%}.")
+        return 1 if regressions else 0
+    return 0
+
+
+# Execute code only when script is run directly, not imported as a module
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import the TableRenderer class for writing the Markdown chunks the same way as Converter
+from table_renderer import TableRenderer
+
+# Import the escape function for writing XML text content safely, it is much faster to import than xml.sax.saxutils
+from html import escape
+
+
+class ChunkWriter:
+    """
+    The ChunkWriter class writes DataFrame chunks one at a time to a text stream.
+
+    Only the current chunk is held in memory, so the peak memory use is bounded
+    by the chunk size and not by the size of the whole input file.
+
+    Args:
+        output_stream: Text stream (open file or StringIO) the chunks are written to.
+        output_format (str): Output format, one of the supported_formats.
+        fixed_width (int, optional): Width of the Markdown columns, the width of the headers if None.
+    """
+
+    # Output formats that can be written chunk by chunk
+    supported_formats = ('csv', 'jsonl', 'ndjson', 'xml', 'md')
+
+    # Output formats whose columns are given once by the header
+    header_formats = ('csv', 'md')
+
+    # Opening and closing part of XML documents
+    xml_header = "<?xml version='1.0' encoding='utf-8'?>\n<data>\n"
+    xml_footer = "</data>\n"
+
+    def __init__(self, output_stream, output_format: str, fixed_width: int | None = None) -> None:
+        """
+        Initializes the ChunkWriter class with the output stream and output format.
+
+        Args:
+            output_stream: Text stream the chunks are written to.
+            output_format (str): Desired output format.
+            fixed_width (int, optional): Width of the Markdown columns, the width of the headers if None.
+        """
+        if output_format not in self.supported_formats:
+            raise ValueError(f"Invalid chunked output format: {output_format}")
+
+        self.output_stream = output_stream
+        self.output_format = output_format
+        # Set to True once the header (csv/md columns, xml root) has been written
+        self.header_written = False
+        # Columns of the first chunk, the later chunks are written in the same order
+        self.columns = None
+        # The chunks of a Markdown table cannot be measured in advance, so the columns have a fixed width
+        self.table_renderer = TableRenderer(output_stream, 'md', fixed_width or 0) if output_format == 'md' else None
+
+    def write_chunk(self, df_chunk: pd.DataFrame) -> None:
+        """
+        Writes one DataFrame chunk to the output stream.
+
+        Args:
+            df_chunk (pd.DataFrame): The chunk of data to be written.
+
+        Raises:
+            ValueError: If a csv or md chunk has a column the first chunk did not have.
+        """
+        if self.output_format in self.header_formats:
+            df_chunk = self.align(df_chunk)
+        match self.output_format:
+            case 'csv':
+                # The column header is written only with the first chunk
+                df_chunk.to_csv(self.output_stream, index=False, header=not self.header_written)
+            case 'jsonl' | 'ndjson':
+                # Every record is written as one JSON object per line
+                df_chunk.to_json(self.output_stream, orient='records', lines=True)
+            case 'xml':
+                self._write_xml_chunk(df_chunk)
+            case 'md':
+                self.table_renderer.render_md_chunk(df_chunk, header=not self.header_written)
+        self.header_written = True
+
+    def align(self, df_chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Orders the columns of the chunk as in the first chunk, so they match the header.
+
+        Columns the chunk lacks are added with missing values.
+
+        Args:
+            df_chunk (pd.DataFrame): The chunk of data to be written.
+
+        Returns:
+            pd.DataFrame: The chunk with the columns of the first chunk.
+
+        Raises:
+            ValueError: If the chunk has a column the first chunk did not have.
+        """
+        if self.columns is None:
+            self.columns = list(df_chunk.columns)
+            return df_chunk
+        if list(df_chunk.columns) == self.columns:
+            return df_chunk
+        new_columns = [column for column in df_chunk.columns if column not in self.columns]
+        if new_columns:
+            raise ValueError(f"Columns not in the header of the first chunk: {', '.join(map(str, new_columns))}")
+        return df_chunk.reindex(columns=self.columns)
+
+    def close(self) -> None:
+        """
+        Finishes the document, writing the closing part of formats that need one.
+        """
+        if self.output_format == 'xml':
+            # An input without any chunk still produces a well-formed document
+            if not self.header_written:
+                self.output_stream.write(self.xml_header)
+                self.header_written = True
+            self.output_stream.write(self.xml_footer)
+
+    def _write_xml_chunk(self, df_chunk: pd.DataFrame) -> None:
+        """
+        Writes the rows of the chunk as <row> elements of the <data> root element.
+
+        Args:
+            df_chunk (pd.DataFrame): The chunk of data to be written.
+        """
+        if not self.header_written:
+            self.output_stream.write(self.xml_header)
+
+        # Element names cannot contain spaces, same as in Converter.convert_data
+        tags = [str(column).replace(' ', '_') for column in df_chunk.columns]
+        for row in df_chunk.itertuples(index=False, name=None):
+            lines = ["  <row>\n"]
+            for tag, value in zip(tags, row):
+                if pd.isna(value):
+                    lines.append(f"    <{tag}/>\n")
+                else:
+                    lines.append(f"    <{tag}>{escape(str(value), quote=False)}</{tag}>\n")
+            lines.append("  </row>\n")
+            self.output_stream.write(''.join(lines))
@@ -0,0 +1,206 @@
+# Import the bz2 and gzip modules for the compression codecs of the standard library
+import bz2
+import gzip
+
+# Import the nullcontext function for passing uncompressed file paths through unchanged
+from contextlib import nullcontext
+
+# Import BytesIO for compressing data held in memory
+from io import BytesIO
+
+# Import the lazy_import function for importing the zstandard package on first use
+from lazy_import import lazy_import
+
+# The zstandard package is optional and only needed for .zst files, None if it is not installed
+zstandard = lazy_import('zstandard', optional=True)
+
+
+# File name extension of every codec
+CODEC_SUFFIXES = {'gz': '.gz', 'bz2': '.bz2', 'zst': '.zst'}
+
+# Magic bytes at the beginning of a compressed file
+CODEC_SIGNATURES = {'gz': b'\x1f\x8b', 'bz2': b'BZh', 'zst': b'\x28\xb5\x2f\xfd'}
+
+# Default compression level of every codec
+DEFAULT_LEVELS = {'gz': 6, 'bz2': 9, 'zst': 3}
+
+
+def codec_from_suffix(file_name) -> str | None:
+    """
+    Returns the codec given by the extension of a file name.
+
+    Args:
+        file_name: The file name or path, other objects have no codec.
+
+    Returns:
+        str or None: 'gz', 'bz2' or 'zst', None if the file name has no compression extension.
+    """
+    if not isinstance(file_name, str):
+        return None
+    for codec, suffix in CODEC_SUFFIXES.items():
+        if file_name.lower().endswith(suffix):
+            return codec
+    return None
+
+
+def detect_codec(input_file) -> str | None:
+    """
+    Detects the codec of a file from its first bytes.
+
+    Args:
+        input_file: Path to the file, other objects are never compressed.
+
+    Returns:
+        str or None: 'gz', 'bz2' or 'zst', None if the file is not compressed.
+    """
+    if not isinstance(input_file, str):
+        return None
+    with open(input_file, 'rb') as f:
+        head = f.read(4)
+    for codec, signature in CODEC_SIGNATURES.items():
+        if head.startswith(signature):
+            return codec
+    return None
+
+
+def check_codec(codec: str) -> None:
+    """
+    Checks that the codec is supported and its library is installed.
+
+    Args:
+        codec (str): The codec.
+
+    Raises:
+        ValueError: If the codec is not supported or zstandard is not installed for 'zst'.
+    """
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(f"Invalid compression: {codec}, expected one of {', '.join(CODEC_SUFFIXES)}.")
+    if codec == 'zst' and zstandard is None:
+        raise ValueError("Compression zst requires the zstandard package.")
+
+
+def open_compressed(file_path: str, mode: str, codec: str, level: int | None = None, encoding: str = 'utf-8'):
+    """
+    Opens a compressed file, the data is compressed or decompressed while it is streamed.
+
+    Args:
+        file_path (str): Path to the file.
+        mode (str): 'rb', 'wb' or 'wt'.
+        codec (str): 'gz', 'bz2' or 'zst'.
+        level (int, optional): Compression level for writing, the codec default if None.
+        encoding (str): Encoding of text written in 'wt' mode.
+
+    Returns:
+        The file object.
+    """
+    check_codec(codec)
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    text_options = {'encoding': encoding, 'newline': ''} if 't' in mode else {}
+
+    match codec:
+        case 'gz':
+            if 'r' in mode:
+                return gzip.open(file_path, mode)
+            return gzip.open(file_path, mode, compresslevel=level, **text_options)
+        case 'bz2':
+            if 'r' in mode:
+                return bz2.open(file_path, mode)
+            return bz2.open(file_path, mode, compresslevel=level, **text_options)
+        case 'zst':
+            if 'r' in mode:
+                return zstandard.open(file_path, mode)
+            return zstandard.open(file_path, mode, cctx=zstandard.ZstdCompressor(level=level), **text_options)
+
+
+def open_binary(input_file: str):
+    """
+    Opens a file for reading in binary mode, decompressing it if it is compressed.
+
+    Args:
+        input_file (str): Path to the file.
+
+    Returns:
+        A binary file object with the decompressed data.
+    """
+    codec = detect_codec(input_file)
+    if codec is None:
+        return open(input_file, 'rb')
+    return open_compressed(input_file, 'rb', codec)
+
+
+def open_input(input_file):
+    """
+    Opens an input file for reading, decompressing it if it is compressed.
+
+    Uncompressed files are passed through as their path, so the readers can still
+    open them themselves.
+
+    Args:
+        input_file: Path to the input file or a file object.
+
+    Returns:
+        A context manager giving the path, or a binary file object with the decompressed data.
+    """
+    if detect_codec(input_file) is None:
+        return nullcontext(input_file)
+    return open_binary(input_file)
+
+
+def open_output(output_file, codec: str | None = None, level: int | None = None, binary: bool = False, encoding: str = 'utf-8'):
+    """
+    Opens an output file for writing, compressing it with the given codec.
+
+    Args:
+        output_file: Path to the output file or a file object.
+        codec (str, optional): 'gz', 'bz2' or 'zst', taken from the file extension if None.
+        level (int, optional): Compression level, the codec default if None.
+        binary (bool): Open a binary file for compressed output, otherwise a text file.
+        encoding (str): Encoding of compressed text output.
+
+    Returns:
+        A context manager giving the path if the output is not compressed, otherwise the file object.
+    """
+    codec = codec or codec_from_suffix(output_file)
+    if codec is None or not isinstance(output_file, str):
+        return nullcontext(output_file)
+    return open_compressed(output_file, 'wb' if binary else 'wt', codec, level, encoding)
+
+
+def compress_bytes(data: bytes, codec: str, level: int | None = None) -> bytes:
+    """
+    Compresses data held in memory.
+
+    Args:
+        data (bytes): The data.
+        codec (str): 'gz', 'bz2' or 'zst'.
+        level (int, optional): Compression level, the codec default if None.
+
+    Returns:
+        bytes: The compressed data.
+    """
+    check_codec(codec)
+    level = DEFAULT_LEVELS[codec] if level is None else level
+
+    match codec:
+        case 'gz':
+            # mtime=0 makes the output of the same data identical
+            return gzip.compress(data, compresslevel=level, mtime=0)
+        case 'bz2':
+            return bz2.compress(data, compresslevel=level)
+        case 'zst':
+            return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def read_all(source) -> str | BytesIO:
+    """
+    Reads a decompressed input into memory, for readers that have to seek in the file.
+
+    Args:
+        source: Path or file object given by open_input().
+
+    Returns:
+        The path unchanged, or a BytesIO with the data of the file object.
+    """
+    if isinstance(source, str):
+        return source
+    return BytesIO(source.read())
@@ -0,0 +1,314 @@
+# Import classes for loading and converting data
+from convert_data_manager import DataManager, Converter
+
+# Import the OrderedDict class for the in-memory LRU layer
+from collections import OrderedDict
+
+# Import modules for hashing, serializing the options and working with files
+import hashlib
+import json
+import os
+import tempfile
+
+# Options of DataManager that change the loaded data
+load_options = ('engine', 'round_decimals', 'sheet_name', 'columns', 'where')
+
+# Options of Converter.convert_many() that change the converted bytes
+convert_options = ('compact', 'compression', 'compression_level', 'fixed_width')
+
+
+class ConversionCache:
+    """
+    The ConversionCache class stores converted output keyed by the input file content and the output format.
+
+    Converted bytes are kept in an in-memory LRU layer and in an on-disk layer. Both
+    layers are bounded by size and evict the least recently used entries first.
+
+    Args:
+        cache_dir (str): Directory of the on-disk layer.
+        max_memory_bytes (int): Size limit of the in-memory layer.
+        max_disk_bytes (int): Size limit of the on-disk layer.
+    """
+
+    # Number of bytes read at once when hashing the input file
+    hash_block_size = 1024 * 1024
+
+    def __init__(self, cache_dir: str = '.conversion_cache', max_memory_bytes: int = 64 * 1024 * 1024, max_disk_bytes: int = 1024 * 1024 * 1024) -> None:
+        """
+        Initializes the ConversionCache class with the cache directory and size limits.
+
+        Args:
+            cache_dir (str): Directory of the on-disk layer.
+            max_memory_bytes (int): Size limit of the in-memory layer in bytes.
+            max_disk_bytes (int): Size limit of the on-disk layer in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_cache = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = {'memory': 0, 'disk': 0}
+        self.misses = 0
+        self.evictions = {'memory': 0, 'disk': 0}
+
+    def content_hash(self, input_file: str) -> str:
+        """
+        Computes the SHA-256 hash of the input file content.
+
+        Args:
+            input_file (str): Path to the input file.
+
+        Returns:
+            str: The hexadecimal hash of the file content.
+        """
+        digest = hashlib.sha256()
+        with open(input_file, 'rb') as f:
+            while block := f.read(self.hash_block_size):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def make_key(self, input_file: str, output_format: str, options: dict | None = None) -> str:
+        """
+        Builds the cache key from the file content, the output format and the options.
+
+        Args:
+            input_file (str): Path to the input file.
+            output_format (str): Desired output format.
+            options (dict, optional): Conversion options that change the output.
+
+        Returns:
+            str: The cache key.
+        """
+        key_source = json.dumps([self.content_hash(input_file), output_format, options or {}], sort_keys=True, default=str)
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the converted bytes stored under the key.
+
+        Args:
+            key (str): The cache key from make_key().
+
+        Returns:
+            bytes or None: The stored bytes, None if the key is not cached.
+        """
+        if key in self.memory_cache:
+            # Marks the entry as the most recently used one
+            self.memory_cache.move_to_end(key)
+            self.hits['memory'] += 1
+            return self.memory_cache[key]
+
+        disk_path = self._disk_path(key)
+        try:
+            with open(disk_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        # Updates the access time used for the disk eviction order
+        try:
+            os.utime(disk_path)
+        except FileNotFoundError:
+            # Another process evicted the entry after it was read, it counts as a miss
+            self.misses += 1
+            return None
+        self.hits['disk'] += 1
+        self._put_memory(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores the converted bytes under the key in both layers.
+
+        Args:
+            key (str): The cache key from make_key().
+            data (bytes): The converted bytes.
+        """
+        self._put_memory(key, data)
+
+        if len(data) > self.max_disk_bytes:
+            return
+        disk_path = self._disk_path(key)
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+        # Writes to a temporary file with a unique name first, so readers never see a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(suffix='.tmp', prefix=f"{key}.", dir=os.path.dirname(disk_path))
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, disk_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._evict_disk()
+
+    def get_or_convert(self, input_file: str, output_format: str, options: dict | None = None) -> bytes | None:
+        """
+        Returns the converted bytes from the cache, converting the input file on a miss.
+
+        Args:
+            input_file (str): Path to the input file.
+            output_format (str): Desired output format.
+            options (dict, optional): Conversion options that change the output, the keys of
+                load_options and convert_options.
+
+        Returns:
+            bytes or None: The converted bytes, None if the file could not be loaded or converted.
+
+        Raises:
+            ValueError: If an option is not supported.
+        """
+        validate_options(options)
+        key = self.make_key(input_file, output_format, options)
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        data = convert_to_bytes(input_file, output_format, options)
+        if data is not None:
+            self.put(key, data)
+        return data
+
+    def stats(self) -> dict:
+        """
+        Returns the hit, miss and eviction counts and the size of both layers.
+
+        Returns:
+            dict: The cache statistics.
+        """
+        hits = self.hits['memory'] + self.hits['disk']
+        requests = hits + self.misses
+        return {
+            'hits': hits,
+            'memory_hits': self.hits['memory'],
+            'disk_hits': self.hits['disk'],
+            'misses': self.misses,
+            'hit_ratio': hits / requests if requests else 0.0,
+            'memory_evictions': self.evictions['memory'],
+            'disk_evictions': self.evictions['disk'],
+            'memory_entries': len(self.memory_cache),
+            'memory_bytes': self.memory_bytes,
+            'disk_bytes': sum(size for _, size, _ in self._disk_entries()),
+        }
+
+    def clear(self) -> None:
+        """
+        Removes all entries from both layers.
+        """
+        self.memory_cache.clear()
+        self.memory_bytes = 0
+        for path, _, _ in self._disk_entries():
+            os.remove(path)
+
+    def _put_memory(self, key: str, data: bytes) -> None:
+        """
+        Stores the bytes in the in-memory layer and evicts the least recently used entries.
+
+        Args:
+            key (str): The cache key.
+            data (bytes): The converted bytes.
+        """
+        if len(data) > self.max_memory_bytes:
+            return
+        if key in self.memory_cache:
+            self.memory_bytes -= len(self.memory_cache.pop(key))
+        self.memory_cache[key] = data
+        self.memory_bytes += len(data)
+
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory_cache.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+            self.evictions['memory'] += 1
+
+    def _disk_path(self, key: str) -> str:
+        """
+        Returns the path of the on-disk entry for the key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: Path to the cache file.
+        """
+        return os.path.join(self.cache_dir, key[:2], f"{key}.bin")
+
+    def _disk_entries(self) -> list[tuple[str, int, float]]:
+        """
+        Lists the entries of the on-disk layer.
+
+        Returns:
+            list[tuple[str, int, float]]: Path, size and modification time of every cache file.
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for directory, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.bin'):
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        # Removed by another process in the meantime
+                        continue
+                    entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """
+        Removes the least recently used cache files until the on-disk layer fits its size limit.
+        """
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        disk_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another process
+                pass
+            else:
+                self.evictions['disk'] += 1
+            disk_bytes -= size
+
+
+def validate_options(options: dict | None) -> None:
+    """
+    Checks that all conversion options are supported.
+
+    Args:
+        options (dict, optional): Conversion options.
+
+    Raises:
+        ValueError: If an option is neither a load option nor a convert option.
+    """
+    unsupported = sorted(set(options or {}) - set(load_options) - set(convert_options))
+    if unsupported:
+        raise ValueError(f"Unsupported conversion options: {', '.join(unsupported)}")
+
+
+def convert_to_bytes(input_file: str, output_format: str, options: dict | None = None) -> bytes | None:
+    """
+    Loads the input file and converts it to the output format.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+        options (dict, optional): Options passed to DataManager (load_options) and to
+            Converter.convert_many() (convert_options).
+
+    Returns:
+        bytes or None: The converted bytes, None if the file could not be loaded or converted.
+
+    Raises:
+        ValueError: If an option is not supported.
+    """
+    options = options or {}
+    validate_options(options)
+
+    df_load_data = DataManager(input_file, **{key: options[key] for key in load_options if key in options}).load_data()
+    if df_load_data is None:
+        return None
+
+    return Converter.convert_many(df_load_data, [output_format], **{key: options[key] for key in convert_options if key in options}).get(output_format)
@@ -1,12 +1,57 @@
-# Import the re library, pandas library and assign it the alias pd
-import pandas as pd
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
 
 # Import the re module for working with regular expressions
 import re
 
+# Import the find_spec function for checking whether pyarrow is installed
+from importlib.util import find_spec
+
 # Import function is_valid_mime_type from module valid_mime_type
 from valid_mime_type import is_valid_mime_type
 
+# Import the FileTypeDetector class for detecting the file format from its content
+from mime_type_detector import FileTypeDetector
+
+# Import the ChunkWriter class for writing data chunk by chunk
+from chunk_writer import ChunkWriter
+
+# Import the TableRenderer class for writing Markdown, HTML and LaTeX tables row by row
+from table_renderer import TableRenderer
+
+# Import the iter_xml_chunks function for reading XML files chunk by chunk
+from xml_stream import iter_xml_chunks
+
+# Import the streaming XLSX reader and the constant-memory XLSX writer
+from xlsx_stream import XlsxStreamWriter, iter_xlsx_chunks, read_xlsx, sheet_names, write_xlsx
+
+# Import functions for reading and writing compressed files
+from compressed_io import codec_from_suffix, compress_bytes, open_compressed, open_input, open_output, read_all
+
+# Import functions for selecting columns and filtering rows
+from data_filter import filter_rows, read_columns, select_columns, validate_where, where_to_xpath
+
+# Import the DtypeOptimizer class for shrinking the column types of the loaded data
+from dtype_optimizer import DtypeOptimizer
+
+# Import the DataFrameCache class for caching parsed DataFrames
+from dataframe_cache import DataFrameCache
+
+# Import the BufferManager class to hold the converted data
+from io_buffer import BufferManager
+
+# Import the ThreadPoolExecutor class for converting to several formats in parallel
+from concurrent.futures import ThreadPoolExecutor
+
+# Import StringIO to tell text buffers from bytes buffers and BytesIO for compressing XLSX output
+from io import BytesIO, StringIO
+
 
 class DataManager:
     """
@@ -15,60 +60,132 @@ class DataManager:
     # Default encoding for data loading and export
     data_encoding = 'utf-8'
 
-    def __init__(self, input_file: str) -> None:
+    # Default number of rows per chunk in streaming mode
+    default_chunksize = 100_000
+
+    # Supported reader engines for CSV and JSON input
+    engines = ('pandas', 'pyarrow', 'auto')
+
+    # Detected formats whose content may also be read as the listed formats, the extension decides between them
+    ambiguous_suffixes = {'.html': {'.xml'}, '.xml': {'.html'}, '.json': {'.jsonl', '.ndjson'}}
+
+    def __init__(self, input_file: str, chunksize: int | None = None, cache_dir: str | None = None, engine: str = 'pandas', round_decimals: int | None = 2, sheet_name: str | int = 0,
+                 columns: list[str] | None = None, where: list[tuple] | None = None, optimizer: DtypeOptimizer | None = None) -> None:
         """
         Initializes the DataManager class with the input file path.
 
+        Input files compressed with gzip, bzip2 or Zstandard (.gz, .bz2, .zst) are
+        detected from their content and decompressed while they are read.
+
         Args:
             input_file (str): Path to the input file.
+            chunksize (int, optional): Number of rows per chunk used by load_chunks().
+            cache_dir (str, optional): Directory for caching the parsed data, caching is off if None.
+            engine (str): Reader for CSV and JSON input: 'pandas', 'pyarrow' (multithreaded, arrow-backed
+                dtypes) or 'auto' (pyarrow if it is installed, otherwise pandas).
+            round_decimals (int, optional): Number of decimals JSON input is rounded to, no rounding if None.
+            sheet_name (str | int): Name or index of the sheet read from XLSX input, the first sheet by default.
+            columns (list[str], optional): Columns to load, all columns if None. CSV and XLSX readers
+                skip the other columns while parsing.
+            where (list[tuple], optional): Row filter of (column, operator, value) conditions that all have
+                to match, e.g. [('gender', '==', 'Female'), ('id', '>', 100)]. The operators are
+                ==, !=, <, <=, >, >= and in. XML input is filtered by an XPath expression while parsing
+                and streamed input chunk by chunk.
+            optimizer (DtypeOptimizer, optional): Shrinks the column types of the data returned by load_data(),
+                the memory saved is in optimizer.report.
         """
+        if engine not in self.engines:
+            raise ValueError(f"Invalid engine: {engine}")
+        validate_where(where)
+
         self.input_file = input_file
+        self.chunksize = chunksize or self.default_chunksize
+        self.cache = DataFrameCache(cache_dir) if cache_dir else None
+        self.engine = engine
+        self.round_decimals = round_decimals
+        self.sheet_name = sheet_name
+        self.columns = list(columns) if columns else None
+        self.where = list(where) if where else None
+        self.optimizer = optimizer
+
+    def resolve_engine(self) -> str:
+        """
+        Returns the reader engine used for CSV and JSON input.
+
+        Returns:
+            str: 'pyarrow' if it was chosen and is installed, otherwise 'pandas'.
+        """
+        if self.engine == 'pandas' or find_spec('pyarrow') is None:
+            return 'pandas'
+        return 'pyarrow'
 
     def extract_suffix(self) -> str:
         """
         Extracts the file extension from the given file name.
 
+        The extension of a compressed file is the one before the compression extension,
+        e.g. '.csv' for mock_data.csv.gz.
+
+        Returns:
+            str: The extracted file extension, or an empty string if the file name has none.
+        """
+        pattern = r'(\.[a-z]+)(?:\.(?:gz|bz2|zst))?$'
+        found_suffix = re.search(pattern, self.input_file)
+        return found_suffix[1] if found_suffix else ''
+
+    def detect_suffix(self) -> str:
+        """
+        Detects the file extension from the content of the file.
+
+        Only the beginning of the file is read, so extensionless and mislabeled files
+        are routed to the right loader. If the content is not recognized, or it may
+        be either of two formats that start alike, e.g. HTML and XML or JSON and
+        JSON Lines, the extension from the file name is used.
+
         Returns:
-            str: The extracted file extension.
+            str: The detected file extension.
         """
-        pattern = r'(\.[a-z]+)$'
-        found_suffix = re.search(pattern, self.input_file)[0]  
-        return found_suffix
+        matcher = FileTypeDetector(self.input_file).detect()
+        suffix = self.extract_suffix()
+        if matcher is None:
+            return suffix
+        detected_suffix = f".{matcher.extension()}"
+        if suffix in self.ambiguous_suffixes.get(detected_suffix, ()):
+            return suffix
+        return detected_suffix
         
     def load_data(self):
         """
         Loads data from the input file based on its extension.
 
+        If caching is on, the parsed data is stored in the cache directory and later
+        loads of the unchanged file read it from there instead of parsing it again.
+
         Returns:
             pd.DataFrame or None: The loaded data as a DataFrame if successful, None otherwise.
         """
         try:
-            # Extracts the file extension using the extract_suffix() method
-            suffix = self.extract_suffix()
+            # Returns the cached data if the file has not changed since it was parsed
+            optimizer_variant = self.optimizer.variant() if self.optimizer is not None else None
+            cache_variant = f"{self.resolve_engine()}:{self.round_decimals}:{self.sheet_name}:{self.columns}:{self.where}:{optimizer_variant}"
+            if self.cache is not None:
+                df_cached = self.cache.load(self.input_file, cache_variant)
+                if df_cached is not None:
+                    return df_cached
+
+            # Detects the file extension from the file content using the detect_suffix() method
+            suffix = self.detect_suffix()
 
             # Checks the validity of the file's MIME type using the is_valid_mime_type() function
             if is_valid_mime_type(suffix, self.input_file):
-                # If the MIME type is valid, uses a match construct based on the file extension
-                match suffix:
-                    # If the extension is '.csv', reads the data from the file as CSV using the read_csv() method
-                    case '.csv':
-                        return pd.read_csv(self.input_file)
-                    # If the extension is '.json', reads the data from the file as JSON using the read_json() method
-                    case '.json':
-                        return pd.read_json(self.input_file).round(2)
-                    # If the extension is '.xml', reads the data from the file as XML using the read_xml() method
-                    case '.xml':
-                        return pd.read_xml(self.input_file)
-                    # If the extension is '.xlsx', reads the data from the file as Excel using the read_excel() method
-                    case '.xlsx':
-                        return pd.read_excel(self.input_file)
-                    # If the extension is '.html', reads the data from the file as HTML using the read_html() method
-                    case '.html':
-                        list_df_result = pd.read_html(self.input_file)
-                        return list_df_result[0]
-                    # If the extension does not match any supported formats, raises an exception
-                    case _:
-                        raise ValueError("Load Data: Unsupported file type.")
+                # If the MIME type is valid, reads the data with the reader for the file extension
+                df_load_data = self.select(self.read_data(suffix))
+                if self.optimizer is not None:
+                    # Downcasts the numeric columns and stores repeated strings as categoricals
+                    df_load_data = self.optimizer.optimize(df_load_data)
+                if self.cache is not None:
+                    self.cache.store(self.input_file, df_load_data, cache_variant)
+                return df_load_data
             else:
                 # If the file's MIME type is not valid, raises an exception
                 raise ValueError("The file extension is not supported. Invalid MIME type.")
@@ -76,30 +193,263 @@ class DataManager:
         # Handle specific errors raised during loading
         except pd.errors.EmptyDataError:
             print("Load Error: An empty file.")
-        except (FileNotFoundError, pd.errors.ParserError) as e:
+        # The ParseError of ElementTree and the XMLSyntaxError of lxml are both SyntaxErrors
+        except (FileNotFoundError, pd.errors.ParserError, SyntaxError) as e:
             print(f"Load Error: {e}")
         # Catches exceptions in case of problems with loading data from the file
         except ValueError as ve:
             # Prints the error message
             print(f"Load Error: {ve}")
-            
+
+    def select(self, df_load_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filters the rows and selects the columns of the loaded data.
+
+        Args:
+            df_load_data (pd.DataFrame): The loaded data or one chunk of it.
+
+        Returns:
+            pd.DataFrame: The matching rows of the selected columns.
+        """
+        return select_columns(filter_rows(df_load_data, self.where), self.columns)
+
+    def read_data(self, suffix: str) -> pd.DataFrame:
+        """
+        Reads the data from the input file with the reader for the given extension.
+
+        Only the selected and filter columns are parsed from CSV and XLSX input and only
+        the matching rows from XML input, the result still has to be passed to select().
+
+        Args:
+            suffix (str): The file extension.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        usecols = read_columns(self.columns, self.where)
+
+        # A compressed file is read through a decompressing file object
+        with open_input(self.input_file) as source:
+            # Uses a match construct based on the file extension
+            match suffix:
+                # If the extension is '.csv', reads the data from the file as CSV using the read_csv() method
+                case '.csv':
+                    if self.resolve_engine() == 'pyarrow':
+                        # Multithreaded pyarrow parser with arrow-backed dtypes
+                        return pd.read_csv(source, engine='pyarrow', dtype_backend='pyarrow', usecols=usecols)
+                    return pd.read_csv(source, usecols=usecols)
+                # If the extension is '.json', reads the data from the file as JSON using the read_json() method
+                case '.json' | '.jsonl' | '.ndjson':
+                    df_load_data = self.read_json(lines=suffix != '.json', source=source)
+                    if self.round_decimals is not None:
+                        df_load_data = df_load_data.round(self.round_decimals)
+                    return df_load_data
+                # If the extension is '.xml', reads the data from the file as XML using the read_xml() method
+                case '.xml':
+                    # The document may be parsed twice, so a decompressed document is held in memory
+                    source = read_all(source)
+                    xpath = where_to_xpath(self.where)
+                    if xpath is not None and self.where:
+                        try:
+                            # Only the rows matching the filter are parsed into the DataFrame
+                            return pd.read_xml(source, xpath=xpath)
+                        except ValueError:
+                            # No row matches, the whole file is read so the empty result keeps its columns
+                            if not isinstance(source, str):
+                                source.seek(0)
+                    return pd.read_xml(source)
+                # If the extension is '.xlsx', streams the rows of the sheet with the read-only openpyxl reader
+                case '.xlsx':
+                    # The ZIP archive of the workbook has to be seekable
+                    return read_xlsx(read_all(source), self.sheet_name, self.chunksize, usecols)
+                # If the extension is '.html', reads the data from the file as HTML using the read_html() method
+                case '.html':
+                    list_df_result = pd.read_html(source)
+                    return list_df_result[0]
+                # If the extension does not match any supported formats, raises an exception
+                case _:
+                    raise ValueError("Load Data: Unsupported file type.")
+
+    def read_json(self, lines: bool = False, source=None) -> pd.DataFrame:
+        """
+        Reads the data from the input file as JSON.
+
+        The pyarrow JSON reader only reads newline-delimited JSON, JSON documents are
+        read by the pandas parser with arrow-backed dtypes.
+
+        Args:
+            lines (bool): True for newline-delimited JSON (JSON Lines), one object per line.
+            source (optional): Path or file object to read from, the input file if None.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        source = self.input_file if source is None else source
+        if self.resolve_engine() == 'pandas':
+            return pd.read_json(source, lines=lines)
+        if lines:
+            # Multithreaded pyarrow reader for one JSON object per line
+            return pd.read_json(source, engine='pyarrow', lines=True, dtype_backend='pyarrow')
+        return pd.read_json(source, dtype_backend='pyarrow')
+
+    def read_chunks(self, suffix: str):
+        """
+        Reads the input file chunk by chunk with the streaming reader for the given extension.
+
+        Args:
+            suffix (str): The file extension.
+
+        Yields:
+            pd.DataFrame: The next chunk of the loaded data.
+        """
+        usecols = read_columns(self.columns, self.where)
+
+        # A compressed file is decompressed while the chunks are read
+        with open_input(self.input_file) as source:
+            if suffix == '.xml':
+                yield from iter_xml_chunks(source, self.chunksize)
+            elif suffix == '.xlsx':
+                # The ZIP archive of the workbook has to be seekable
+                yield from iter_xlsx_chunks(read_all(source), self.chunksize, self.sheet_name, usecols)
+            elif suffix in ('.jsonl', '.ndjson'):
+                # Parses the file line by line, chunksize lines at a time
+                with pd.read_json(source, lines=True, chunksize=self.chunksize) as reader:
+                    yield from reader
+            else:
+                with pd.read_csv(source, chunksize=self.chunksize, usecols=usecols) as reader:
+                    yield from reader
+
+    def load_sheets(self, names: list[str] | None = None) -> dict[str, pd.DataFrame] | None:
+        """
+        Loads several sheets of an XLSX input file.
+
+        Args:
+            names (list[str], optional): Names of the sheets, all sheets if None.
+
+        Returns:
+            dict[str, pd.DataFrame] or None: The data of every sheet by sheet name if successful, None otherwise.
+        """
+        try:
+            # Detects the file extension from the file content using the detect_suffix() method
+            suffix = self.detect_suffix()
+            if suffix != '.xlsx':
+                raise ValueError(f"Load Data: Sheets are only supported for .xlsx files, got {suffix}.")
+
+            # Checks the validity of the file's MIME type using the is_valid_mime_type() function
+            if not is_valid_mime_type(suffix, self.input_file):
+                raise ValueError("The file extension is not supported. Invalid MIME type.")
+
+            with open_input(self.input_file) as source:
+                # The ZIP archive of the workbook has to be seekable
+                source = read_all(source)
+                names = names if names is not None else sheet_names(source)
+                usecols = read_columns(self.columns, self.where)
+                return {name: self.select(read_xlsx(source, name, self.chunksize, usecols)) for name in names}
+
+        # Handle specific errors raised during loading
+        except FileNotFoundError as e:
+            print(f"Load Error: {e}")
+        # Catches exceptions in case of problems with loading data from the file
+        except ValueError as ve:
+            # Prints the error message
+            print(f"Load Error: {ve}")
+
+    def iter_chunks(self):
+        """
+        Reads a CSV, JSON Lines, XML or XLSX input file in chunks of chunksize rows, raising load errors.
+
+        Every chunk is filtered and projected as soon as it is read, chunks without
+        matching rows are skipped.
+
+        Yields:
+            pd.DataFrame: The next chunk of the loaded data.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+            ValueError: If the file cannot be streamed or its content is invalid.
+        """
+        # Detects the file extension from the file content using the detect_suffix() method
+        suffix = self.detect_suffix()
+
+        # Streaming is only supported for CSV, JSON Lines, XML and XLSX input
+        if suffix not in ('.csv', '.jsonl', '.ndjson', '.xml', '.xlsx'):
+            raise ValueError(f"Load Data: Streaming is not supported for {suffix} files.")
+
+        # Checks the validity of the file's MIME type using the is_valid_mime_type() function
+        if not is_valid_mime_type(suffix, self.input_file):
+            raise ValueError("The file extension is not supported. Invalid MIME type.")
+
+        # Reads the file lazily, yielding one DataFrame per chunk
+        for df_chunk in self.read_chunks(suffix):
+            df_chunk = self.select(df_chunk)
+            if len(df_chunk) or not self.where:
+                yield df_chunk
+
+    def load_chunks(self):
+        """
+        Loads data from a CSV, JSON Lines, XML or XLSX input file in chunks of chunksize rows.
+
+        Only one chunk is held in memory at a time, so large files can be converted
+        without reading them whole. Load errors are printed and end the chunks,
+        use iter_chunks() to have them raised instead.
+
+        Yields:
+            pd.DataFrame: The next chunk of the loaded data.
+        """
+        try:
+            yield from self.iter_chunks()
+
+        # Handle specific errors raised during loading
+        except pd.errors.EmptyDataError:
+            print("Load Error: An empty file.")
+        # The ParseError of ElementTree and the XMLSyntaxError of lxml are both SyntaxErrors
+        except (FileNotFoundError, pd.errors.ParserError, SyntaxError) as e:
+            print(f"Load Error: {e}")
+        # Catches exceptions in case of problems with loading data from the file
+        except ValueError as ve:
+            # Prints the error message
+            print(f"Load Error: {ve}")
+
 class Converter:
-    def __init__(self, df_load_data: pd.DataFrame, output_format: str, bytes_buffer, xlsx_buffer, string_buffer) -> None:
+    def __init__(self, df_load_data: pd.DataFrame, output_format: str, bytes_buffer=None, xlsx_buffer=None, string_buffer=None, buffer_manager: BufferManager | None = None, compact: bool = False,
+                 columns: list[str] | None = None, compression: str | None = None, compression_level: int | None = None, fixed_width: int | None = None) -> None:
         """
         Initializes the Converter class with data, output format, and buffers.
 
+        The buffers can be given directly, or taken from a BufferManager, in which case
+        only the buffer used by the output format is created.
+
         Args:
             df_load_data (pd.DataFrame): Pandas DataFrame to be converted.
             output_format (str): Desired output format.
             bytes_buffer: Buffer for bytes data.
             xlsx_buffer: Buffer for Excel data.
             string_buffer: Buffer for string data.
+            buffer_manager (BufferManager, optional): Buffer manager providing the buffer for the output format.
+            compact (bool): Write JSON without indentation.
+            columns (list[str], optional): Columns to convert, in the given order, all columns if None.
+            compression (str, optional): Codec read_bytes() compresses the data with: 'gz', 'bz2' or 'zst'.
+            compression_level (int, optional): Compression level, the codec default if None.
+            fixed_width (int, optional): Width of Markdown columns, the data is not measured before the table is written if set.
         """
         self.df_load_data = df_load_data
         self.output_format = output_format
+        self.compact = compact
+        self.columns = columns
+        self.compression = compression
+        self.compression_level = compression_level
+        self.fixed_width = fixed_width
         self.bytes_buffer = bytes_buffer
         self.xlsx_buffer = xlsx_buffer
         self.string_buffer = string_buffer
+        self.buffer_manager = buffer_manager
+        # Name of the buffer the converted data is written to, read back by read_bytes()
+        self.buffer_name = BufferManager.buffer_name_for(output_format)
+
+        if buffer_manager is not None:
+            # Takes only the buffer the output format is written to
+            if getattr(self, self.buffer_name) is None:
+                setattr(self, self.buffer_name, getattr(buffer_manager, self.buffer_name))
 
     def convert_data(self):
         """
@@ -108,31 +458,30 @@ class Converter:
         try:
             if isinstance(self.df_load_data, pd.DataFrame):
                 # Check if the loaded data is a Pandas DataFrame
+                df_load_data = select_columns(self.df_load_data, self.columns)
                 match self.output_format:
                     # Using the match construct to handle different output formats
                     case 'csv':
                         # If the output format is CSV, write the DataFrame to a CSV file
-                        self.df_load_data.to_csv(self.string_buffer, index=False)
+                        df_load_data.to_csv(self.string_buffer, index=False)
                     case 'json':
                         # If the output format is JSON, write the DataFrame to a JSON file
-                        self.df_load_data.to_json(self.string_buffer, orient='records', indent=4, index=False)
+                        df_load_data.to_json(self.string_buffer, orient='records', indent=None if self.compact else 4, index=False)
+                    case 'jsonl' | 'ndjson':
+                        # If the output format is JSON Lines, write one JSON object per line
+                        df_load_data.to_json(self.string_buffer, orient='records', lines=True)
                     case 'xml':
                         # If the output format is XML, convert DataFrame to XML and write to buffer
-                        self.df_load_data.columns = self.df_load_data.columns.str.replace(' ', '_')
-                        self.df_load_data.to_xml(self.bytes_buffer, index=False)
+                        # The columns are renamed on a copy, so the shared DataFrame is not modified
+                        df_xml = df_load_data.rename(columns=lambda column: str(column).replace(' ', '_'))
+                        df_xml.to_xml(self.bytes_buffer, index=False)
                     case 'xlsx':
                         # If the output format is XLSX, write the DataFrame to an Excel file
-                        self.df_load_data.to_excel(self.xlsx_buffer, index=False)
-                    case 'html':
-                        # If the output format is HTML, write the DataFrame to an HTML file
-                        # self.df_load_data.columns = self.df_load_data.columns.str.replace(' ', '_')
-                        self.df_load_data.to_html(self.string_buffer, index=False)
-                    case 'md':
-                        # If the output format is Markdown, write the DataFrame to a Markdown file
-                        self.df_load_data.to_markdown(self.string_buffer, index=False)
-                    case 'tex':
-                        # If the output format is TeX, write the DataFrame to a LaTeX file
-                        self.df_load_data.to_latex(self.string_buffer, index=False)
+                        # The constant-memory writer does not build the whole workbook in memory
+                        write_xlsx(df_load_data, self.xlsx_buffer)
+                    case 'html' | 'md' | 'tex':
+                        # If the output format is HTML, Markdown or TeX, write the table row by row
+                        TableRenderer(self.string_buffer, self.output_format, self.fixed_width).render(df_load_data)
                     case _:
                         # If the output format is not recognized, raise a ValueError
                         raise ValueError(f"Invalid output format: {self.output_format}")
@@ -144,8 +493,106 @@ class Converter:
             # If a ValueError occurs during data processing, it prints an error message
             print(f"Convert Error: {ve}")
 
+    def read_bytes(self) -> bytes:
+        """
+        Returns the converted data from the buffer it was written to.
+
+        If a compression codec is set, the data is compressed with it.
+
+        Returns:
+            bytes: The converted data, empty if nothing was converted.
+        """
+        buffer = getattr(self, self.buffer_name)
+        if buffer is None:
+            return b''
+        if isinstance(buffer, StringIO):
+            data = buffer.getvalue().encode(DataManager.data_encoding)
+        else:
+            data = buffer.getvalue()
+        if self.compression is None or not data:
+            return data
+        return compress_bytes(data, self.compression, self.compression_level)
+
+    @classmethod
+    def convert_many(cls, df_load_data: pd.DataFrame, output_formats: list[str], max_workers: int | None = None, compact: bool = False,
+                     columns: list[str] | None = None, compression: str | None = None, compression_level: int | None = None, fixed_width: int | None = None) -> dict[str, bytes]:
+        """
+        Converts one loaded DataFrame to several output formats.
+
+        The DataFrame is loaded only once and shared by all conversions. Every format
+        gets its own buffers, so the conversions can run in parallel threads.
+
+        Args:
+            df_load_data (pd.DataFrame): Pandas DataFrame to be converted.
+            output_formats (list[str]): Desired output formats.
+            max_workers (int, optional): Number of threads, the formats are converted one by one if None.
+            compact (bool): Write JSON without indentation.
+            columns (list[str], optional): Columns to convert, all columns if None.
+            compression (str, optional): Codec the converted data is compressed with: 'gz', 'bz2' or 'zst'.
+            compression_level (int, optional): Compression level, the codec default if None.
+            fixed_width (int, optional): Width of Markdown columns, the columns are measured if None.
+
+        Returns:
+            dict[str, bytes]: Converted data for every output format that was converted successfully.
+        """
+        def convert_one(output_format: str) -> bytes:
+            file_converter = cls(df_load_data, output_format, buffer_manager=BufferManager(), compact=compact, columns=columns,
+                                 compression=compression, compression_level=compression_level, fixed_width=fixed_width)
+            file_converter.convert_data()
+            return file_converter.read_bytes()
+
+        # Removes duplicate formats while keeping their order
+        output_formats = list(dict.fromkeys(output_formats))
+
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = dict(zip(output_formats, executor.map(convert_one, output_formats)))
+        else:
+            results = {output_format: convert_one(output_format) for output_format in output_formats}
+
+        # Formats that failed to convert are left out, Converter has already printed the error
+        return {output_format: data for output_format, data in results.items() if data}
+
+    def convert_chunks(self, chunks):
+        """
+        Converts the data chunk by chunk and stores it in the string buffer.
+
+        Supported output formats are csv, jsonl (or ndjson), xml and md, and xlsx, which is stored
+        in the xlsx buffer.
+
+        Args:
+            chunks: Iterable of DataFrame chunks, e.g. from DataManager.load_chunks().
+        """
+        # Selects the columns of every chunk as it is loaded
+        chunks = (select_columns(df_chunk, self.columns) for df_chunk in chunks)
+
+        try:
+            if self.output_format == 'xlsx':
+                # XLSX is binary, so it is written by the constant-memory writer to the xlsx buffer
+                xlsx_writer = XlsxStreamWriter(self.xlsx_buffer)
+                for df_chunk in chunks:
+                    xlsx_writer.write_chunk(df_chunk)
+                xlsx_writer.close()
+                return
+
+            # Text formats, XML included, are written to the string buffer, taken from the buffer manager if needed
+            if self.string_buffer is None and self.buffer_manager is not None:
+                self.string_buffer = self.buffer_manager.string_buffer
+            self.buffer_name = 'string_buffer'
+
+            # Writes every chunk as soon as it is loaded
+            chunk_writer = ChunkWriter(self.string_buffer, self.output_format, self.fixed_width)
+            for df_chunk in chunks:
+                chunk_writer.write_chunk(df_chunk)
+            chunk_writer.close()
+
+        except ValueError as ve:
+            # If a ValueError occurs during data processing, it prints an error message
+            print(f"Convert Error: {ve}")
+
 class ExportData:
-    def __init__(self, df_load_data: pd.DataFrame, export_output_format: str, output_file_path) -> None:
+    def __init__(self, df_load_data: pd.DataFrame, export_output_format: str, output_file_path, compact: bool = False, columns: list[str] | None = None,
+                 compression: str | None = None, compression_level: int | None = None, fixed_width: int | None = None) -> None:
         """
         Initializes the ExportData class with data, output format, and output file path.
 
@@ -153,10 +600,45 @@ class ExportData:
             df_load_data (pd.DataFrame): Pandas DataFrame to be exported.
             export_output_format (str): Desired output format.
             output_file_path (str): Path to the output file.
+            compact (bool): Write JSON without indentation.
+            columns (list[str], optional): Columns to export, in the given order, all columns if None.
+            compression (str, optional): Codec the output file is compressed with: 'gz', 'bz2' or 'zst'.
+                If None, it is taken from the extension of the output file path, e.g. output.csv.gz.
+            compression_level (int, optional): Compression level, the codec default if None.
+            fixed_width (int, optional): Width of Markdown columns, the data is not measured before the table is written if set.
         """
         self.df_load_data = df_load_data
         self.export_output_format = export_output_format
         self.output_file_path = output_file_path
+        self.compact = compact
+        self.columns = columns
+        self.compression = compression
+        self.compression_level = compression_level
+        self.fixed_width = fixed_width
+
+    def compression_codec(self) -> str | None:
+        """
+        Returns the codec the output file is compressed with.
+
+        Returns:
+            str or None: The codec set in the constructor or given by the output file extension, None for no compression.
+        """
+        return self.compression or codec_from_suffix(self.output_file_path)
+
+    def write_compressed_xlsx(self, write) -> None:
+        """
+        Writes an XLSX workbook to a compressed output file.
+
+        The ZIP archive of the workbook cannot be written to a compressing stream,
+        so the workbook is built in memory and compressed afterwards.
+
+        Args:
+            write: Function writing the workbook to the binary buffer it is given.
+        """
+        xlsx_buffer = BytesIO()
+        write(xlsx_buffer)
+        with open(self.output_file_path, 'wb') as output_file:
+            output_file.write(compress_bytes(xlsx_buffer.getvalue(), self.compression_codec(), self.compression_level))
     
     def export_data(self):
         """
@@ -165,32 +647,42 @@ class ExportData:
         try:
             if isinstance(self.df_load_data, pd.DataFrame):
                 # Checking the type of input data, whether it is a DataFrame
-                match self.export_output_format:
-                    # For supported output formats cases
-                    case 'csv':
-                        # Export to CSV format
-                        self.df_load_data.to_csv(self.output_file_path, index=False)
-                    case 'json':
-                        # Export to JSON format
-                        self.df_load_data.to_json(self.output_file_path, orient='records', indent=2, index=False)
-                    case 'xml':
-                        # Export to XML format
-                        self.df_load_data.to_xml(self.output_file_path, index=False)
-                    case 'xlsx':
-                        # Export to Excel format
-                        self.df_load_data.to_excel(self.output_file_path, index=False)
-                    case 'html':
-                        # Export to HTML format
-                        self.df_load_data.to_html(self.output_file_path, index=False)
-                    case 'md':
-                        # Export to Markdown format
-                        self.df_load_data.to_markdown(self.output_file_path, index=False)
-                    case 'tex':
-                        # Export to LaTeX format
-                        self.df_load_data.to_latex(self.output_file_path, index=False)
-                    case _:
-                        # Executed if the specified format does not match the supported formats
-                        raise ValueError(f"Invalid output format: {self.export_output_format}")
+                df_load_data = select_columns(self.df_load_data, self.columns)
+                if self.export_output_format == 'xlsx' and self.compression_codec() is not None:
+                    # Export to Excel format, compressed after the workbook is built
+                    self.write_compressed_xlsx(lambda xlsx_buffer: write_xlsx(df_load_data, xlsx_buffer))
+                    return
+
+                # A compressed output file is written through a compressing file object
+                binary = self.export_output_format in ('xml', 'xlsx')
+                with open_output(self.output_file_path, self.compression_codec(), self.compression_level, binary, DataManager.data_encoding) as output_file:
+                    match self.export_output_format:
+                        # For supported output formats cases
+                        case 'csv':
+                            # Export to CSV format
+                            df_load_data.to_csv(output_file, index=False)
+                        case 'json':
+                            # Export to JSON format
+                            df_load_data.to_json(output_file, orient='records', indent=None if self.compact else 2, index=False)
+                        case 'jsonl' | 'ndjson':
+                            # Export to JSON Lines format, one JSON object per line
+                            df_load_data.to_json(output_file, orient='records', lines=True)
+                        case 'xml':
+                            # Export to XML format
+                            df_load_data.to_xml(output_file, index=False)
+                        case 'xlsx':
+                            # Export to Excel format
+                            write_xlsx(df_load_data, output_file)
+                        case 'html' | 'md' | 'tex':
+                            # Export to HTML, Markdown or LaTeX format, written row by row
+                            if hasattr(output_file, 'write'):
+                                TableRenderer(output_file, self.export_output_format, self.fixed_width).render(df_load_data)
+                            else:
+                                with open(output_file, 'w', encoding=DataManager.data_encoding, newline='') as table_file:
+                                    TableRenderer(table_file, self.export_output_format, self.fixed_width).render(df_load_data)
+                        case _:
+                            # Executed if the specified format does not match the supported formats
+                            raise ValueError(f"Invalid output format: {self.export_output_format}")
             else:
                 # Throws an exception if the data loaded is not a DataFrame
                 raise ValueError("A DataFrame is expected, check the validity of the input data.")  # Vyvolá výnimku, ak načítané dáta nie sú DataFrame            
@@ -198,3 +690,72 @@ class ExportData:
         except ValueError as ve:
             # If a ValueError occurs during data processing, it prints an error message
             print(f"Export Error: {ve}")
+
+    def export_chunks(self, chunks):
+        """
+        Exports the data to a file chunk by chunk in the specified format.
+
+        Supported output formats are csv, jsonl (or ndjson), xml, md and xlsx. The output file path
+        can also be an open text stream, e.g. a socket wrapped with socket.makefile('w'),
+        or a binary stream for xlsx. Compressed text output is compressed chunk by chunk.
+
+        Args:
+            chunks: Iterable of DataFrame chunks, e.g. from DataManager.load_chunks().
+        """
+        # Selects the columns of every chunk as it is loaded
+        chunks = (select_columns(df_chunk, self.columns) for df_chunk in chunks)
+
+        try:
+            if self.export_output_format == 'xlsx':
+                if self.compression_codec() is not None and not hasattr(self.output_file_path, 'write'):
+                    self.write_compressed_xlsx(lambda xlsx_buffer: self._write_xlsx_chunks(xlsx_buffer, chunks))
+                else:
+                    self._write_xlsx_chunks(self.output_file_path, chunks)
+                return
+
+            # Checks the format before the output file is created
+            if self.export_output_format not in ChunkWriter.supported_formats:
+                raise ValueError(f"Invalid chunked output format: {self.export_output_format}")
+
+            # Writes directly to an open stream, otherwise opens the output file
+            if hasattr(self.output_file_path, 'write'):
+                self._write_chunks(self.output_file_path, chunks)
+            elif self.compression_codec() is not None:
+                with open_compressed(self.output_file_path, 'wt', self.compression_codec(), self.compression_level, DataManager.data_encoding) as output_file:
+                    self._write_chunks(output_file, chunks)
+            else:
+                with open(self.output_file_path, 'w', encoding=DataManager.data_encoding, newline='') as output_file:
+                    self._write_chunks(output_file, chunks)
+
+        except ValueError as ve:
+            # If a ValueError occurs during data processing, it prints an error message
+            print(f"Export Error: {ve}")
+
+    def _write_xlsx_chunks(self, output_file, chunks):
+        """
+        Writes every chunk to an XLSX workbook as soon as it is loaded.
+
+        The constant-memory writer keeps only the current chunk in memory.
+
+        Args:
+            output_file: Path to the XLSX file or a binary stream.
+            chunks: Iterable of DataFrame chunks.
+        """
+        xlsx_writer = XlsxStreamWriter(output_file)
+        for df_chunk in chunks:
+            xlsx_writer.write_chunk(df_chunk)
+        xlsx_writer.close()
+
+    def _write_chunks(self, output_stream, chunks):
+        """
+        Writes every chunk to the output stream as soon as it is loaded.
+
+        Args:
+            output_stream: Text stream the chunks are written to.
+            chunks: Iterable of DataFrame chunks.
+        """
+        chunk_writer = ChunkWriter(output_stream, self.export_output_format, self.fixed_width)
+        for df_chunk in chunks:
+            chunk_writer.write_chunk(df_chunk)
+        chunk_writer.close()
+        output_stream.flush()
@@ -0,0 +1,183 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import the operator module for the comparison functions
+import operator
+
+
+# Supported comparison operators of the row filter
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, values: column.isin(values),
+}
+
+# XPath operators matching the comparison operators, != is written as not(=)
+XPATH_OPERATORS = {'==': '=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+
+def validate_where(where: list[tuple] | None) -> None:
+    """
+    Checks that the row filter consists of (column, operator, value) conditions with supported operators.
+
+    Args:
+        where (list[tuple], optional): The row filter, e.g. [('gender', '==', 'Female'), ('id', '>', 100)].
+
+    Raises:
+        ValueError: If a condition is not a (column, operator, value) tuple or the operator is not supported.
+    """
+    for condition in where or []:
+        if len(condition) != 3:
+            raise ValueError(f"Invalid filter condition: {condition}, expected (column, operator, value).")
+        if condition[1] not in OPERATORS:
+            raise ValueError(f"Invalid filter operator: {condition[1]}, expected one of {', '.join(OPERATORS)}.")
+
+
+def where_columns(where: list[tuple] | None) -> list[str]:
+    """
+    Returns the columns used by the row filter.
+
+    Args:
+        where (list[tuple], optional): The row filter.
+
+    Returns:
+        list[str]: The column names in the order of the conditions, without duplicates.
+    """
+    return list(dict.fromkeys(column for column, _, _ in where or []))
+
+
+def read_columns(columns: list[str] | None, where: list[tuple] | None) -> list[str] | None:
+    """
+    Returns the columns a reader has to read to project and filter the data.
+
+    Args:
+        columns (list[str], optional): The selected columns, all columns if None.
+        where (list[tuple], optional): The row filter.
+
+    Returns:
+        list[str] or None: The selected columns followed by the other filter columns, None for all columns.
+    """
+    if not columns:
+        return None
+    return list(dict.fromkeys([*columns, *where_columns(where)]))
+
+
+def filter_rows(df_load_data: pd.DataFrame, where: list[tuple] | None) -> pd.DataFrame:
+    """
+    Keeps only the rows that match all conditions of the row filter.
+
+    Args:
+        df_load_data (pd.DataFrame): The data to be filtered.
+        where (list[tuple], optional): The row filter, all rows are kept if None.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+
+    Raises:
+        ValueError: If a filter column does not exist.
+    """
+    if not where:
+        return df_load_data
+
+    missing = [column for column in where_columns(where) if column not in df_load_data.columns]
+    if missing:
+        raise ValueError(f"Unknown filter columns: {', '.join(map(str, missing))}")
+
+    mask = pd.Series(True, index=df_load_data.index)
+    for column, operator_name, value in where:
+        try:
+            mask &= OPERATORS[operator_name](df_load_data[column], value).fillna(False).astype(bool)
+        except TypeError as e:
+            raise ValueError(f"Cannot compare column {column} with {value!r}: {e}") from e
+    return df_load_data[mask]
+
+
+def select_columns(df_load_data: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    """
+    Keeps only the selected columns, in the given order.
+
+    Args:
+        df_load_data (pd.DataFrame): The data to be projected.
+        columns (list[str], optional): The selected columns, all columns are kept if None.
+
+    Returns:
+        pd.DataFrame: The selected columns.
+
+    Raises:
+        ValueError: If a selected column does not exist.
+    """
+    if not columns:
+        return df_load_data
+
+    missing = [column for column in columns if column not in df_load_data.columns]
+    if missing:
+        raise ValueError(f"Unknown columns: {', '.join(map(str, missing))}")
+    return df_load_data[list(columns)]
+
+
+def xpath_literal(value) -> str | None:
+    """
+    Formats a value as an XPath literal.
+
+    Args:
+        value: A string or number.
+
+    Returns:
+        str or None: The literal, None if the value cannot be written in XPath 1.0.
+    """
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    if not isinstance(value, str):
+        return repr(value)
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return None
+
+
+def where_to_xpath(where: list[tuple] | None, row_xpath: str = './*') -> str | None:
+    """
+    Translates the row filter to an XPath expression selecting the matching rows.
+
+    Args:
+        where (list[tuple], optional): The row filter.
+        row_xpath (str): XPath of the row elements.
+
+    Returns:
+        str or None: The XPath expression, None if a condition cannot be written in XPath.
+    """
+    predicates = []
+    for column, operator_name, value in where or []:
+        # The column is the name of a child element of the row
+        name = str(column)
+        if not name.isidentifier():
+            return None
+        values = value if operator_name == 'in' else [value]
+        literals = [xpath_literal(item) for item in values]
+        if not literals or None in literals:
+            return None
+        # XPath 1.0 compares strings by their numeric value in <, <=, > and >=
+        if operator_name in ('<', '<=', '>', '>=') and isinstance(value, str):
+            return None
+        if operator_name == 'in':
+            predicates.append('(' + ' or '.join(f"{name}={literal}" for literal in literals) + ')')
+        elif operator_name == '!=':
+            # A row without the element is kept, as a missing value differs from every value in filter_rows()
+            predicates.append(f"not({name}={literals[0]})")
+        else:
+            predicates.append(f"{name}{XPATH_OPERATORS[operator_name]}{literals[0]}")
+
+    if not predicates:
+        return row_xpath
+    return f"{row_xpath}[{' and '.join(predicates)}]"
@@ -0,0 +1,157 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import modules for hashing the cache keys and working with files
+import hashlib
+import os
+
+# Import the Feather reader and writer from pyarrow on first use, None if pyarrow is not installed
+feather = lazy_import('pyarrow.feather', optional=True)
+
+
+class DataFrameCache:
+    """
+    The DataFrameCache class stores parsed DataFrames in a binary format for fast reloads.
+
+    The DataFrames are stored in the Feather format, which is memory-mapped when it is
+    read back. If pyarrow is not installed or the DataFrame cannot be stored as Feather,
+    pickle is used instead. The entries are keyed by the path, modification time and
+    size of the source file, so a changed source file is parsed again.
+
+    Args:
+        cache_dir (str): Directory of the cache files.
+    """
+
+    def __init__(self, cache_dir: str = '.dataframe_cache') -> None:
+        """
+        Initializes the DataFrameCache class with the cache directory.
+
+        Args:
+            cache_dir (str): Directory of the cache files.
+        """
+        self.cache_dir = cache_dir
+
+    def path_prefix(self, input_file: str) -> str:
+        """
+        Returns the part of the cache file name that identifies the source file.
+
+        Args:
+            input_file (str): Path to the source file.
+
+        Returns:
+            str: Hash of the absolute path of the source file.
+        """
+        return hashlib.sha256(os.path.abspath(input_file).encode('utf-8')).hexdigest()[:32]
+
+    def state_prefix(self, input_file: str) -> str:
+        """
+        Returns the part of the cache file name that identifies the source file and its state.
+
+        Args:
+            input_file (str): Path to the source file.
+
+        Returns:
+            str: Hash of the path followed by the hash of the modification time and size.
+        """
+        stat = os.stat(input_file)
+        state = f"{stat.st_mtime_ns}:{stat.st_size}"
+        return f"{self.path_prefix(input_file)}-{hashlib.sha256(state.encode('utf-8')).hexdigest()[:16]}"
+
+    def make_key(self, input_file: str, variant: str = '') -> str:
+        """
+        Builds the cache key from the path, modification time and size of the source file.
+
+        Args:
+            input_file (str): Path to the source file.
+            variant (str): Reader options that change the parsed DataFrame, e.g. the engine.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"{self.state_prefix(input_file)}-{hashlib.sha256(variant.encode('utf-8')).hexdigest()[:8]}"
+
+    def load(self, input_file: str, variant: str = '') -> pd.DataFrame | None:
+        """
+        Loads the cached DataFrame of the source file.
+
+        Args:
+            input_file (str): Path to the source file.
+            variant (str): Reader options that change the parsed DataFrame, e.g. the engine.
+
+        Returns:
+            pd.DataFrame or None: The cached DataFrame, None if the source file is not cached or has changed.
+        """
+        key = self.make_key(input_file, variant)
+        feather_path = os.path.join(self.cache_dir, f"{key}.feather")
+        pickle_path = os.path.join(self.cache_dir, f"{key}.pkl")
+
+        if feather is not None and os.path.exists(feather_path):
+            # Memory-maps the file instead of reading it into memory
+            return feather.read_feather(feather_path, memory_map=True)
+        if os.path.exists(pickle_path):
+            return pd.read_pickle(pickle_path)
+        return None
+
+    def store(self, input_file: str, df_load_data: pd.DataFrame, variant: str = '') -> None:
+        """
+        Stores the parsed DataFrame of the source file and removes its outdated entries.
+
+        Args:
+            input_file (str): Path to the source file.
+            df_load_data (pd.DataFrame): The parsed DataFrame.
+            variant (str): Reader options that change the parsed DataFrame, e.g. the engine.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        key = self.make_key(input_file, variant)
+        self.invalidate(input_file, keep_current=True)
+
+        if feather is not None:
+            feather_path = os.path.join(self.cache_dir, f"{key}.feather")
+            try:
+                self._write_atomic(feather_path, lambda path: feather.write_feather(df_load_data, path))
+                return
+            except (ValueError, TypeError):
+                # Column names or values Feather cannot store, pickle is used instead
+                pass
+
+        pickle_path = os.path.join(self.cache_dir, f"{key}.pkl")
+        self._write_atomic(pickle_path, df_load_data.to_pickle)
+
+    def invalidate(self, input_file: str, keep_current: bool = False) -> None:
+        """
+        Removes the cached entries of the source file.
+
+        Args:
+            input_file (str): Path to the source file.
+            keep_current (bool): Keep the entries of the current file state, remove only the outdated ones.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        prefix = f"{self.path_prefix(input_file)}-"
+        current_prefix = f"{self.state_prefix(input_file)}-" if keep_current else None
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and not (current_prefix and name.startswith(current_prefix)):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def _write_atomic(path: str, write) -> None:
+        """
+        Writes a cache file through a temporary file, so readers never see a partial file.
+
+        Args:
+            path (str): Path to the cache file.
+            write: Function writing the data to the path it is given.
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,214 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import numpy for the value ranges of the integer types, on first use
+np = lazy_import('numpy')
+
+# Import the find_spec function for checking whether pyarrow is installed
+from importlib.util import find_spec
+
+# Import the json module for saving and loading schemas
+import json
+
+
+class DtypeOptimizer:
+    """
+    The DtypeOptimizer class shrinks the memory of a DataFrame by choosing smaller column types.
+
+    Integer columns are downcast to the smallest integer type that holds their values,
+    float columns to float32 only if every value stays exactly the same, so the
+    converted output does not change. String columns with few distinct values become
+    categoricals, the other string columns can be stored as arrow strings.
+
+    The changed types form a schema, which can be saved and passed to later runs, so
+    the types are not inferred again. Without a schema the types are inferred anew for
+    every DataFrame, so one optimizer can be used for several files.
+
+    Args:
+        schema (dict[str, str], optional): Column types, e.g. {'id': 'int16', 'gender': 'category'}.
+            The types are inferred if None.
+        category_threshold (float): Highest ratio of distinct to non-missing values of a string
+            column that is stored as a categorical.
+        arrow_strings (bool): Store the other string columns as arrow strings if pyarrow is installed.
+    """
+
+    # numpy integer types, their value range is checked before a column is converted
+    integer_types = ('int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64')
+
+    def __init__(self, schema: dict[str, str] | None = None, category_threshold: float = 0.5, arrow_strings: bool = False) -> None:
+        """
+        Initializes the DtypeOptimizer class with the schema and inference options.
+
+        Args:
+            schema (dict[str, str], optional): Column types, inferred if None.
+            category_threshold (float): Highest ratio of distinct to non-missing values of a categorical column.
+            arrow_strings (bool): Store the other string columns as arrow strings if pyarrow is installed.
+        """
+        self.schema = dict(schema) if schema is not None else None
+        self.category_threshold = category_threshold
+        self.arrow_strings = arrow_strings
+        # Schema the last DataFrame was optimized with, given or inferred, written by save_schema()
+        self.last_schema = None
+        # Memory report of the last optimized DataFrame
+        self.report = None
+
+    @classmethod
+    def from_schema_file(cls, schema_file: str, **options) -> 'DtypeOptimizer':
+        """
+        Creates a DtypeOptimizer with the schema saved by save_schema().
+
+        Args:
+            schema_file (str): Path to the JSON schema file.
+            **options: Other arguments of the constructor.
+
+        Returns:
+            DtypeOptimizer: The optimizer with the saved schema.
+        """
+        with open(schema_file, encoding='utf-8') as f:
+            return cls(json.load(f), **options)
+
+    def save_schema(self, schema_file: str) -> None:
+        """
+        Saves the schema of the last optimized DataFrame, or the given schema, to a JSON file.
+
+        Args:
+            schema_file (str): Path to the JSON schema file.
+
+        Raises:
+            ValueError: If there is no schema yet, no DataFrame was optimized.
+        """
+        schema = self.last_schema if self.last_schema is not None else self.schema
+        if schema is None:
+            raise ValueError("There is no schema to save, optimize a DataFrame first.")
+        with open(schema_file, 'w', encoding='utf-8') as f:
+            json.dump(schema, f, indent=2)
+
+    def variant(self) -> str:
+        """
+        Returns the options of the optimizer that change the optimized DataFrame.
+
+        Only the options given to the constructor are used, so the variant is the same
+        before and after a DataFrame is optimized.
+
+        Returns:
+            str: The options, used in the cache key of the parsed data.
+        """
+        return f"{self.schema}:{self.category_threshold}:{self.arrow_strings}"
+
+    def infer_column_type(self, column: pd.Series) -> str:
+        """
+        Chooses the smallest type that holds all values of the column.
+
+        Args:
+            column (pd.Series): The column.
+
+        Returns:
+            str: The name of the type.
+        """
+        if pd.api.types.is_bool_dtype(column):
+            return str(column.dtype)
+
+        if pd.api.types.is_integer_dtype(column) and isinstance(column.dtype, np.dtype):
+            return str(pd.to_numeric(column, downcast='integer' if column.min() < 0 else 'unsigned').dtype)
+
+        if pd.api.types.is_float_dtype(column) and column.dtype == np.float64:
+            # float32 is used only if no value loses precision
+            downcast = column.astype(np.float32)
+            if (downcast.astype(np.float64) == column)[column.notna()].all():
+                return 'float32'
+            return str(column.dtype)
+
+        values = column.dropna()
+        if (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)) and len(values) and values.map(type).eq(str).all():
+            if values.nunique() / len(values) <= self.category_threshold:
+                return 'category'
+            if self.arrow_strings and find_spec('pyarrow') is not None:
+                return 'string[pyarrow]'
+        return str(column.dtype)
+
+    def infer_schema(self, df_load_data: pd.DataFrame) -> dict[str, str]:
+        """
+        Chooses the smallest type of every column.
+
+        Args:
+            df_load_data (pd.DataFrame): The loaded data.
+
+        Returns:
+            dict[str, str]: The type of every column whose type changes, the other columns keep their type.
+        """
+        schema = {}
+        for column in df_load_data.columns:
+            dtype = self.infer_column_type(df_load_data[column])
+            if dtype != str(df_load_data[column].dtype):
+                schema[str(column)] = dtype
+        return schema
+
+    def optimize(self, df_load_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the columns to the types of the schema, inferring the types of this DataFrame if there is none.
+
+        The memory before and after and the type of every column are stored in report.
+
+        Args:
+            df_load_data (pd.DataFrame): The loaded data.
+
+        Returns:
+            pd.DataFrame: The data with the smaller column types.
+
+        Raises:
+            ValueError: If a schema column does not exist or its values do not fit the schema type.
+        """
+        # An inferred schema only belongs to this DataFrame and is not kept for the next one
+        schema = self.schema if self.schema is not None else self.infer_schema(df_load_data)
+
+        columns = {str(column): column for column in df_load_data.columns}
+        missing = [name for name in schema if name not in columns]
+        if missing:
+            raise ValueError(f"Unknown schema columns: {', '.join(missing)}")
+
+        memory_before = int(df_load_data.memory_usage(deep=True).sum())
+        types = {}
+        for name, dtype in schema.items():
+            column = df_load_data[columns[name]]
+            if str(column.dtype) == dtype:
+                continue
+            if dtype in self.integer_types and pd.api.types.is_numeric_dtype(column) and len(column.dropna()):
+                # numpy wraps integers that do not fit, so the range is checked first
+                limits = np.iinfo(dtype)
+                if column.min() < limits.min or column.max() > limits.max:
+                    raise ValueError(f"Values of column {name} do not fit the type {dtype}.")
+            types[columns[name]] = dtype
+
+        try:
+            df_optimized = df_load_data.astype(types) if types else df_load_data
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"The data does not match the schema: {e}") from e
+
+        memory_after = int(df_optimized.memory_usage(deep=True).sum())
+        self.last_schema = schema
+        self.report = {
+            'memory_before': memory_before,
+            'memory_after': memory_after,
+            'saved_bytes': memory_before - memory_after,
+            'saved_percent': (memory_before - memory_after) / memory_before * 100 if memory_before else 0.0,
+            'types': {str(column): str(dtype) for column, dtype in df_optimized.dtypes.items()},
+        }
+        return df_optimized
+
+    def summary(self) -> str:
+        """
+        Describes the memory saved by the last optimization.
+
+        Returns:
+            str: The memory before and after, e.g. 'Memory: 101479 B -> 52310 B, saved 49169 B (48.5 %)'.
+        """
+        if self.report is None:
+            return "Memory: no DataFrame optimized yet."
+        return (f"Memory: {self.report['memory_before']} B -> {self.report['memory_after']} B, "
+                f"saved {self.report['saved_bytes']} B ({self.report['saved_percent']:.1f} %)")
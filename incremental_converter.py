@@ -0,0 +1,460 @@
+# Import the DataManager class for detecting and validating the source file
+from convert_data_manager import DataManager
+
+# Import the ChunkWriter class for writing and appending data chunk by chunk
+from chunk_writer import ChunkWriter
+
+# Import the detect_codec function for rejecting compressed source files
+from compressed_io import detect_codec
+
+# Import function is_valid_mime_type from module valid_mime_type
+from valid_mime_type import is_valid_mime_type
+
+# Import the lazy_import function for importing pandas on first use
+from lazy_import import lazy_import
+
+# Import pandas library for parsing the new rows, on first use
+pd = lazy_import('pandas')
+
+# Import modules for parsing command line arguments, hashing, reading files and storing the checkpoints
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+
+
+class BoundedReader(io.RawIOBase):
+    """
+    The BoundedReader class reads a binary file from a start offset up to an end offset.
+
+    Bytes appended to the file while it is read are not seen, so the reader always
+    stops at the end offset the checkpoint is taken at.
+
+    Args:
+        input_stream: Binary file object.
+        start (int): Offset of the first byte.
+        end (int): Offset after the last byte.
+    """
+
+    def __init__(self, input_stream, start: int, end: int) -> None:
+        """
+        Initializes the BoundedReader class with the file object and the byte range.
+
+        Args:
+            input_stream: Binary file object.
+            start (int): Offset of the first byte.
+            end (int): Offset after the last byte.
+        """
+        super().__init__()
+        self.input_stream = input_stream
+        self.end = end
+        self.input_stream.seek(start)
+
+    def readable(self) -> bool:
+        """
+        Returns True, the reader can be read.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads bytes into the buffer, at most up to the end offset.
+
+        Args:
+            buffer: Writable buffer.
+
+        Returns:
+            int: Number of bytes read, 0 at the end offset.
+        """
+        remaining = self.end - self.input_stream.tell()
+        if remaining <= 0:
+            return 0
+        data = self.input_stream.read(min(len(buffer), remaining))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class SchemaError(ValueError):
+    """
+    The SchemaError class is raised when the new rows cannot be parsed with the column types of the checkpoint.
+    """
+
+
+class IncrementalConverter:
+    """
+    The IncrementalConverter class converts an append-only CSV file, converting only the rows added since the last run.
+
+    After every run a checkpoint with the byte offset, row count, columns and column
+    types of the converted part of the source file is stored. The next run parses only
+    the bytes after the offset with the stored column types and appends the new rows to
+    the output file. The output file is rebuilt from the whole source file if there is
+    no checkpoint, the source file was truncated or rewritten, its columns changed, the
+    new rows do not fit the column types, or the output file was modified.
+
+    Only complete lines are converted, a last line still being written is left for
+    the next run.
+
+    Args:
+        input_file (str): Path to the CSV source file.
+        output_file (str): Path to the output file.
+        output_format (str): Output format: csv, jsonl (or ndjson), xml or md.
+        checkpoint_dir (str): Directory of the checkpoint files.
+        chunksize (int, optional): Number of rows converted at once.
+    """
+
+    # Number of bytes before the offset whose hash detects a rewritten source file
+    tail_size = 4096
+
+    # Number of bytes read at once when searching for the last line break
+    block_size = 64 * 1024
+
+    def __init__(self, input_file: str, output_file: str, output_format: str, checkpoint_dir: str = '.incremental_checkpoints', chunksize: int | None = None) -> None:
+        """
+        Initializes the IncrementalConverter class with the source file, output file and checkpoint directory.
+
+        Args:
+            input_file (str): Path to the CSV source file.
+            output_file (str): Path to the output file.
+            output_format (str): Output format: csv, jsonl (or ndjson), xml or md.
+            checkpoint_dir (str): Directory of the checkpoint files.
+            chunksize (int, optional): Number of rows converted at once.
+
+        Raises:
+            ValueError: If the output format cannot be appended to.
+        """
+        if output_format not in ChunkWriter.supported_formats:
+            raise ValueError(f"Invalid incremental output format: {output_format}")
+
+        self.input_file = input_file
+        self.output_file = output_file
+        self.output_format = output_format
+        self.checkpoint_dir = checkpoint_dir
+        self.chunksize = chunksize or DataManager.default_chunksize
+
+    def checkpoint_path(self) -> str:
+        """
+        Returns the path to the checkpoint file of the source and output file.
+
+        Returns:
+            str: Path to the checkpoint file, named by the hash of both absolute paths.
+        """
+        paths = f"{os.path.abspath(self.input_file)}\0{os.path.abspath(self.output_file)}"
+        return os.path.join(self.checkpoint_dir, f"{hashlib.sha256(paths.encode('utf-8')).hexdigest()[:32]}.json")
+
+    def load_checkpoint(self) -> dict | None:
+        """
+        Loads the checkpoint of the last run.
+
+        Returns:
+            dict or None: The checkpoint, None if there is none or it cannot be read.
+        """
+        try:
+            with open(self.checkpoint_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store_checkpoint(self, checkpoint: dict) -> None:
+        """
+        Stores the checkpoint through a temporary file, so a partial checkpoint is never read.
+
+        Args:
+            checkpoint (dict): The checkpoint.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self.checkpoint_path()
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(temp_path, path)
+
+    def read_columns(self) -> list[str]:
+        """
+        Reads the column names from the header line of the source file.
+
+        Returns:
+            list[str]: The column names, empty if the file is empty.
+        """
+        with open(self.input_file, 'rb') as f:
+            header = f.readline().decode('utf-8-sig')
+        return next(csv.reader([header]), [])
+
+    def complete_end(self, start: int) -> int:
+        """
+        Returns the offset after the last line break of the source file.
+
+        Args:
+            start (int): Offset the search stops at.
+
+        Returns:
+            int: The offset after the last complete line, start if there is no line break after it.
+        """
+        with open(self.input_file, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            while position > start:
+                block_start = max(start, position - self.block_size)
+                f.seek(block_start)
+                block = f.read(position - block_start)
+                index = block.rfind(b'\n')
+                if index >= 0:
+                    return block_start + index + 1
+                position = block_start
+        return start
+
+    def tail_hash(self, offset: int) -> str:
+        """
+        Returns the hash of the bytes before the offset.
+
+        Args:
+            offset (int): The offset.
+
+        Returns:
+            str: SHA-256 of the last tail_size bytes before the offset.
+        """
+        with open(self.input_file, 'rb') as f:
+            f.seek(max(0, offset - self.tail_size))
+            return hashlib.sha256(f.read(min(offset, self.tail_size))).hexdigest()
+
+    def rebuild_reason(self, checkpoint: dict | None, columns: list[str]) -> str | None:
+        """
+        Checks whether the new rows can be appended to the output file of the last run.
+
+        Args:
+            checkpoint (dict, optional): The checkpoint of the last run.
+            columns (list[str]): The current columns of the source file.
+
+        Returns:
+            str or None: Why the output file has to be rebuilt, None if the new rows can be appended.
+        """
+        if checkpoint is None:
+            return "no checkpoint"
+        if checkpoint.get('output_format') != self.output_format:
+            return "output format changed"
+        if not os.path.exists(self.output_file) or os.path.getsize(self.output_file) != checkpoint.get('output_size'):
+            return "output file changed"
+        if os.path.getsize(self.input_file) < checkpoint['offset']:
+            return "source file truncated"
+        if self.tail_hash(checkpoint['offset']) != checkpoint.get('tail_sha256'):
+            return "source file rewritten"
+        if columns != checkpoint.get('columns') or 'dtypes' not in checkpoint:
+            return "schema changed"
+        return None
+
+    def read_rows(self, start: int, end: int, columns: list[str] | None = None, dtypes: dict[str, str] | None = None):
+        """
+        Parses the rows between the start and end offset of the source file chunk by chunk.
+
+        Args:
+            start (int): Offset of the first byte, 0 to parse the header line as well.
+            end (int): Offset after the last complete line.
+            columns (list[str], optional): Column names of rows without a header line.
+            dtypes (dict[str, str], optional): Column types the rows are parsed with, inferred if None.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+
+        Raises:
+            SchemaError: If the rows cannot be parsed with the column types.
+        """
+        with open(self.input_file, 'rb') as f:
+            source = io.BufferedReader(BoundedReader(f, start, end), buffer_size=self.block_size)
+            options = {'header': None, 'names': columns} if columns is not None else {}
+            with pd.read_csv(source, chunksize=self.chunksize, encoding=DataManager.data_encoding, dtype=dtypes or None, **options) as reader:
+                try:
+                    yield from reader
+                except ValueError as e:
+                    if not dtypes:
+                        raise
+                    raise SchemaError(f"The new rows do not match the column types: {e}") from e
+
+    def write_rows(self, output_stream, chunks, header_written: bool) -> int:
+        """
+        Writes the chunks to the output stream.
+
+        Args:
+            output_stream: Text stream the chunks are written to.
+            chunks: Iterable of DataFrame chunks.
+            header_written (bool): True when appending, so the header is not written again.
+
+        Returns:
+            tuple[int, dict[str, str]]: Number of rows written and the types of their columns,
+                empty if no rows were written.
+        """
+        chunk_writer = ChunkWriter(output_stream, self.output_format)
+        chunk_writer.header_written = header_written
+        rows = 0
+        # Empty frames with the column types of every chunk, combined into the types of the whole output
+        schemas = []
+        for df_chunk in chunks:
+            chunk_writer.write_chunk(df_chunk)
+            rows += len(df_chunk)
+            if len(df_chunk):
+                schemas.append(df_chunk.iloc[:0])
+        chunk_writer.close()
+        dtypes = {str(column): str(dtype) for column, dtype in pd.concat(schemas).dtypes.items()} if schemas else {}
+        return rows, dtypes
+
+    def rebuild(self, columns: list[str], end: int) -> tuple[int, dict[str, str]]:
+        """
+        Converts the source file up to the end offset, replacing the output file.
+
+        The output file is written through a temporary file, so a failed rebuild keeps
+        the previous output file.
+
+        Args:
+            columns (list[str]): The columns of the source file.
+            end (int): Offset after the last complete line.
+
+        Returns:
+            tuple[int, dict[str, str]]: Number of rows written and the types of their columns.
+
+        Raises:
+            ValueError: If the source file is not a valid CSV file.
+        """
+        if not is_valid_mime_type('.csv', self.input_file):
+            raise ValueError("The file extension is not supported. Invalid MIME type.")
+
+        temp_path = f"{self.output_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding=DataManager.data_encoding, newline='') as output_stream:
+                if end > 0:
+                    result = self.write_rows(output_stream, self.read_rows(0, end), header_written=False)
+                else:
+                    result = self.write_rows(output_stream, [pd.DataFrame(columns=columns)], header_written=False)
+            os.replace(temp_path, self.output_file)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return result
+
+    def append(self, columns: list[str], start: int, end: int, dtypes: dict[str, str]) -> tuple[int, dict[str, str]]:
+        """
+        Appends the rows between the start and end offset to the output file.
+
+        The rows are parsed with the column types of the converted part, so they are
+        written the same way as by a full rebuild.
+
+        Args:
+            columns (list[str]): The columns of the source file.
+            start (int): Offset after the rows converted by the last run.
+            end (int): Offset after the last complete line.
+            dtypes (dict[str, str]): Column types of the converted part, inferred from the new rows if empty.
+
+        Returns:
+            tuple[int, dict[str, str]]: Number of rows written and the types of their columns.
+
+        Raises:
+            ValueError: If the XML output file does not end with the closing root element.
+            SchemaError: If the new rows cannot be parsed with the column types.
+        """
+        if self.output_format == 'xml':
+            # Removes the closing root element, it is written again after the new rows
+            footer = ChunkWriter.xml_footer.encode(DataManager.data_encoding)
+            with open(self.output_file, 'rb+') as f:
+                f.seek(-len(footer), os.SEEK_END)
+                if f.read() != footer:
+                    raise ValueError("The XML output file does not end with the closing root element.")
+                f.seek(-len(footer), os.SEEK_END)
+                f.truncate()
+
+        with open(self.output_file, 'a', encoding=DataManager.data_encoding, newline='') as output_stream:
+            return self.write_rows(output_stream, self.read_rows(start, end, columns, dtypes), header_written=True)
+
+    def run(self, full: bool = False) -> dict:
+        """
+        Converts the rows added to the source file since the last run.
+
+        Args:
+            full (bool): Rebuild the output file from the whole source file.
+
+        Returns:
+            dict: Result of the run with the keys mode ('full', 'append' or 'unchanged'),
+                reason, rows_written, rows and offset.
+
+        Raises:
+            ValueError: If the source file is not an uncompressed CSV file.
+        """
+        if detect_codec(self.input_file) is not None:
+            raise ValueError("Incremental conversion is not supported for compressed source files.")
+        suffix = DataManager(self.input_file).detect_suffix()
+        if suffix != '.csv':
+            raise ValueError(f"Incremental conversion is only supported for CSV source files, got {suffix}.")
+
+        checkpoint = self.load_checkpoint()
+        columns = self.read_columns()
+        reason = "full rebuild requested" if full else self.rebuild_reason(checkpoint, columns)
+
+        mode = 'full'
+        if reason is None:
+            end = self.complete_end(checkpoint['offset'])
+            if end == checkpoint['offset']:
+                return {'mode': 'unchanged', 'reason': None, 'rows_written': 0, 'rows': checkpoint['rows'], 'offset': end}
+            try:
+                rows_written, dtypes = self.append(columns, checkpoint['offset'], end, checkpoint['dtypes'])
+                # The types stay those of the converted part, unless it had no rows yet
+                dtypes = checkpoint['dtypes'] or dtypes
+                rows = checkpoint['rows'] + rows_written
+                mode = 'append'
+            except SchemaError:
+                # The partly appended output file is replaced by the rebuild
+                reason = "schema changed"
+
+        if mode == 'full':
+            end = self.complete_end(0)
+            rows_written, dtypes = self.rebuild(columns, end)
+            rows = rows_written
+
+        self.store_checkpoint({
+            'input_file': os.path.abspath(self.input_file),
+            'output_file': os.path.abspath(self.output_file),
+            'output_format': self.output_format,
+            'offset': end,
+            'rows': rows,
+            'columns': columns,
+            'dtypes': dtypes,
+            'tail_sha256': self.tail_hash(end),
+            'output_size': os.path.getsize(self.output_file),
+        })
+        return {'mode': mode, 'reason': reason, 'rows_written': rows_written, 'rows': rows, 'offset': end}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs one incremental conversion from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 0 if the conversion succeeded, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(description="Convert only the rows appended to a CSV file since the last run.")
+    parser.add_argument('input_file', help="Path to the CSV source file.")
+    parser.add_argument('output_file', help="Path to the output file the new rows are appended to.")
+    parser.add_argument('output_format', help="Output format: csv, jsonl, ndjson, xml or md.")
+    parser.add_argument('--checkpoint-dir', default='.incremental_checkpoints', help="Directory of the checkpoint files.")
+    parser.add_argument('--chunksize', type=int, help="Number of rows converted at once.")
+    parser.add_argument('--full', action='store_true', help="Rebuild the output file from the whole source file.")
+    args = parser.parse_args(argv)
+
+    try:
+        converter = IncrementalConverter(args.input_file, args.output_file, args.output_format, args.checkpoint_dir, args.chunksize)
+        result = converter.run(full=args.full)
+    except (OSError, ValueError, pd.errors.ParserError) as e:
+        print(f"Convert Error: {e}")
+        return 1
+
+    reason = f" ({result['reason']})" if result['reason'] else ''
+    print(f"{result['mode']}{reason}: {result['rows_written']} rows written, {result['rows']} rows in total")
+    return 0
+
+
+# Execute code only when script is run directly, not imported as a module
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,11 @@
-# Import pandas library for data manipulation
-import pandas as pd
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
 
 # Import BytesIO and StringIO from io library for memory buffers
 from io import BytesIO, StringIO
@@ -10,37 +16,95 @@ class BufferManager:
     """
     This class manages three different buffers: bytes buffer, xlsx buffer, and string buffer.
     It provides methods to read data from each buffer.
+
+    The buffers are created lazily on first use, so only the buffer needed for the
+    output format is allocated. The bytes buffers can be read without copying through
+    getbuffer(), and reset() empties the buffers for reuse across conversions.
     """
 
     # Set default encoding for reading data
     data_decoding = 'windows-1252'
 
-    # Initialize the class with empty buffers
+    # Name of the buffer each output format is written to, the string buffer is used for the others
+    format_buffers = {'xml': 'bytes_buffer', 'xlsx': 'xlsx_buffer'}
+
+    # Initialize the class without buffers, they are created on first use
     def __init__(self):
         """
-        Initializes the buffers with empty memory objects.
+        Initializes the buffer manager, the memory objects are created on first access.
+        """
+        self._bytes_buffer = None
+        self._xlsx_buffer = None
+        self._string_buffer = None
+
+    @property
+    def bytes_buffer(self) -> BytesIO:
+        """
+        Returns the bytes buffer, creating it on first access.
+        """
+        if self._bytes_buffer is None:
+            self._bytes_buffer = BytesIO()
+        return self._bytes_buffer
+
+    @property
+    def xlsx_buffer(self) -> BytesIO:
+        """
+        Returns the xlsx buffer, creating it on first access.
+        """
+        if self._xlsx_buffer is None:
+            self._xlsx_buffer = BytesIO()
+        return self._xlsx_buffer
+
+    @property
+    def string_buffer(self) -> StringIO:
+        """
+        Returns the string buffer, creating it on first access.
+        """
+        if self._string_buffer is None:
+            self._string_buffer = StringIO()
+        return self._string_buffer
+
+    @classmethod
+    def buffer_name_for(cls, output_format: str) -> str:
+        """
+        Returns the name of the buffer the output format is written to.
+
+        Args:
+            output_format (str): The output format.
+
+        Returns:
+            str: 'bytes_buffer', 'xlsx_buffer' or 'string_buffer'.
         """
-        self.bytes_buffer = BytesIO()
-        self.xlsx_buffer = BytesIO()
-        self.string_buffer = StringIO()
+        return cls.format_buffers.get(output_format, 'string_buffer')
+
+    def buffer_for(self, output_format: str):
+        """
+        Returns the buffer the output format is written to, creating it on first access.
+
+        Args:
+            output_format (str): The output format.
+
+        Returns:
+            BytesIO or StringIO: The buffer for the output format.
+        """
+        return getattr(self, self.buffer_name_for(output_format))
 
     # Read and decode the contents of the bytes buffer
     def read_bytes_buffer(self):
         """
         Reads data from the bytes buffer, decodes it using the specified encoding, and returns it as a string.
         """
-        # Reset the buffer position to the beginning
-        self.bytes_buffer.seek(0)  # Reset the read pointer to the beginning
-        # Read all bytes from the buffer
-        data = self.bytes_buffer.read() #.decode(self.data_decoding)
-        # Decode the bytes using the specified encoding
-        result = data.decode(self.data_decoding)
+        # Decodes directly from a view of the buffer, without copying the bytes first
+        with self.bytes_buffer.getbuffer() as view:
+            result = str(view, self.data_decoding)
         return result
 
      # Read and load the contents of the Excel buffer as a Pandas DataFrame
     def read_buffer_xlsx(self):
         """
         Reads data from the xlsx buffer as an Excel spreadsheet using the openpyxl engine and returns a pandas DataFrame.
+
+        Use getbuffer('xlsx') to get the xlsx file itself without parsing it.
         """
         # Reset the buffer position to the beginning
         self.xlsx_buffer.seek(0)  # Reset the read pointer to the beginning
@@ -53,19 +117,42 @@ class BufferManager:
         """
         Reads data from the string buffer and returns it as a string.
         """
-        # Reset the buffer position to the beginning
-        self.string_buffer.seek(0)  # Reset the read pointer to the beginning
-        # Read all text from the buffer
-        result = self.string_buffer.read()
+        # Returns the whole contents regardless of the current position
+        result = self.string_buffer.getvalue()
         return result
 
-    
-    # def reset_buffer(self):
-    #     self.bytes_buffer.seek(0)
-    #     self.bytes_buffer.truncate(0)
-        
-    #     self.xlsx_buffer.seek(0)
-    #     self.xlsx_buffer.truncate(0)
-        
-    #     self.string_buffer.seek(0)
-    #     self.string_buffer.truncate(0)
\ No newline at end of file
+    def getbuffer(self, output_format: str = 'xml') -> memoryview:
+        """
+        Returns a zero-copy view of the bytes buffer the output format is written to.
+
+        The view has to be released (view.release() or a with block) before the
+        buffer is written to or reset again.
+
+        Args:
+            output_format (str): The output format, 'xml' or 'xlsx'.
+
+        Returns:
+            memoryview: A view of the buffer contents.
+
+        Raises:
+            ValueError: If the output format is written to the string buffer.
+        """
+        buffer_name = self.buffer_name_for(output_format)
+        if buffer_name == 'string_buffer':
+            raise ValueError(f"The {output_format} format is written to the string buffer, use read_string_buffer().")
+        return getattr(self, buffer_name).getbuffer()
+
+    def reset(self):
+        """
+        Empties the created buffers, so they can be reused for the next conversion.
+        """
+        for buffer_name in ('_bytes_buffer', '_xlsx_buffer', '_string_buffer'):
+            buffer = getattr(self, buffer_name)
+            if buffer is None:
+                continue
+            try:
+                buffer.seek(0)
+                buffer.truncate(0)
+            except BufferError:
+                # A view returned by getbuffer() is still in use, a new buffer is created on next access
+                setattr(self, buffer_name, None)
@@ -0,0 +1,98 @@
+# Import the import_module function for importing a module on first use
+from importlib import import_module
+
+# Import the find_spec function for checking whether an optional module is installed
+from importlib.util import find_spec
+
+
+# Libraries imported by warm_up(), by the output or input format that needs them
+WARM_UP_MODULES = {'xlsx': ['openpyxl'], 'xml': ['lxml.etree'], 'html': ['lxml.html']}
+
+
+class LazyModule:
+    """
+    The LazyModule class stands in for a module that is imported on first attribute access.
+
+    Heavy libraries like pandas and openpyxl take longer to import than a short
+    conversion takes to run, so they are imported only when a format needs them.
+    The import itself is thread-safe, it runs under the import lock.
+
+    Args:
+        name (str): Name of the module, e.g. 'pandas'.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initializes the LazyModule class with the module name, without importing it.
+
+        Args:
+            name (str): Name of the module.
+        """
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def load(self):
+        """
+        Imports the module if it was not imported yet.
+
+        Returns:
+            The module.
+        """
+        if self._module is None:
+            self.__dict__['_module'] = import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        """
+        Imports the module and returns its attribute.
+
+        Args:
+            attribute (str): Name of the attribute.
+
+        Returns:
+            The attribute of the module.
+        """
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        """
+        Returns the name of the module and whether it was imported.
+
+        Returns:
+            str: The description.
+        """
+        state = 'imported' if self._module is not None else 'not imported'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name: str, optional: bool = False) -> LazyModule | None:
+    """
+    Returns a module that is imported on first attribute access.
+
+    Args:
+        name (str): Name of the module, e.g. 'pandas' or 'pyarrow.feather'.
+        optional (bool): Return None if the module is not installed.
+
+    Returns:
+        LazyModule or None: The lazy module, None if an optional module is not installed.
+    """
+    if optional and find_spec(name.split('.')[0]) is None:
+        return None
+    return LazyModule(name)
+
+
+def warm_up(formats: list[str] | None = None) -> None:
+    """
+    Imports pandas and the libraries of the given formats, so the first conversion does not import them.
+
+    Args:
+        formats (list[str], optional): Input and output formats, e.g. ['xlsx', 'xml'].
+    """
+    import_module('pandas')
+    for file_format in formats or []:
+        for module_name in WARM_UP_MODULES.get(file_format, []):
+            try:
+                import_module(module_name)
+            except ImportError:
+                # The format fails with its own error when a conversion needs it
+                pass
@@ -1,125 +1,231 @@
-# Import classes and modules for data conversion management
-from convert_data_manager import DataManager, Converter, ExportData
+# Import the time module first, so the cold start is measured from the beginning of the script
+import time
+start_time = time.perf_counter()
 
-# Import the show function from the pandasgui module to display the interactive GUI for the pandas DataFrame
-# from pandasgui import show
+# Import classes and modules for data conversion management, pandas and openpyxl are imported on first use
+from convert_data_manager import DataManager, Converter, ExportData
 
 # Import the BufferManager class from the io_buffer file to manage input and output
 from io_buffer import BufferManager
 
-# Import the re module for working with regular expressions
-import re
+# Import the codec_from_suffix function for the output format of compressed output files
+from compressed_io import codec_from_suffix
+
+# Import the ChunkWriter class for the formats that can be written chunk by chunk
+from chunk_writer import ChunkWriter
+
+# Import modules for parsing command line arguments and running the cold start measurement
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Libraries whose import dominates the start of a conversion
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'openpyxl', 'lxml')
+
+
+def output_format_for(output_file: str) -> str:
+    """
+    Returns the output format given by the extension of the output file.
+
+    Args:
+        output_file (str): Path to the output file, e.g. 'output.csv' or 'output.csv.gz'.
+
+    Returns:
+        str: The output format, e.g. 'csv', empty if the file name has no extension.
+    """
+    if codec_from_suffix(output_file) is not None:
+        output_file = os.path.splitext(output_file)[0]
+    return os.path.splitext(output_file)[1].lstrip('.')
+
+
+def write_output(output_file: str, export) -> bool:
+    """
+    Writes the output file through a temporary file, which replaces it only when it was written.
+
+    Args:
+        output_file (str): Path to the output file.
+        export: Function that writes the output to the path of the temporary file it is given
+            and returns whether all the data was written.
+
+    Returns:
+        bool: True if the output file was written, False otherwise.
+    """
+    temp_path = f"{output_file}.{os.getpid()}.tmp"
+    try:
+        if not export(temp_path) or not os.path.exists(temp_path):
+            return False
+        os.replace(temp_path, output_file)
+        return True
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def convert(args: argparse.Namespace) -> dict | None:
+    """
+    Loads the input file and converts it, writing the result to the output file or to stdout.
+
+    The output file is written through a temporary file, so a failed conversion neither
+    leaves a partial file nor is hidden by the output file of an earlier run.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict or None: Seconds spent in every stage, None if the conversion failed.
+    """
+    timings = {'startup': time.perf_counter() - start_time}
+    file_data_manager = DataManager(args.input_file, chunksize=args.chunksize, engine=args.engine, sheet_name=args.sheet, columns=args.columns)
+
+    if args.chunksize and args.output:
+        # Streams the chunks from the input file to the output file
+        loaded = False
+
+        def load_chunks():
+            nonlocal loaded
+            try:
+                yield from file_data_manager.iter_chunks()
+            except (OSError, ValueError, SyntaxError) as e:
+                print(f"Load Error: {e}")
+                return
+            loaded = True
+
+        def export_chunks(temp_path):
+            ExportData(None, args.output_format, temp_path, compact=args.compact, compression=codec_from_suffix(args.output), fixed_width=args.fixed_width).export_chunks(load_chunks())
+            # A load or export error stops reading the chunks before the last one
+            return loaded
+
+        start = time.perf_counter()
+        written = write_output(args.output, export_chunks)
+        timings['load+write'] = time.perf_counter() - start
+        return timings if written else None
+
+    start = time.perf_counter()
+    df_load_data = file_data_manager.load_data()
+    timings['load'] = time.perf_counter() - start
+    if df_load_data is None:
+        return None
+
+    if args.output:
+        def export_data(temp_path):
+            ExportData(df_load_data, args.output_format, temp_path, compact=args.compact, compression=codec_from_suffix(args.output), fixed_width=args.fixed_width).export_data()
+            return True
+
+        start = time.perf_counter()
+        written = write_output(args.output, export_data)
+        timings['write'] = time.perf_counter() - start
+        return timings if written else None
+
+    start = time.perf_counter()
+    file_converter = Converter(df_load_data, args.output_format, buffer_manager=BufferManager(), compact=args.compact, fixed_width=args.fixed_width)
+    file_converter.convert_data()
+    data = file_converter.read_bytes()
+    timings['convert'] = time.perf_counter() - start
+    if not data:
+        return None
+
+    start = time.perf_counter()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+    timings['write'] = time.perf_counter() - start
+    return timings
+
+
+def measure_cold_start(argv: list[str], runs: int) -> dict:
+    """
+    Runs the conversion in fresh interpreters and measures their wall time.
+
+    An empty interpreter is measured as well, so the time of the interpreter itself
+    can be told apart from the imports and the conversion.
+
+    Args:
+        argv (list[str]): Command line arguments of the conversion.
+        runs (int): Number of runs of each command.
+
+    Returns:
+        dict: Median seconds of the empty interpreter and of the conversion.
+    """
+    def median_seconds(command: list[str]) -> float:
+        seconds = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=False)
+            seconds.append(time.perf_counter() - start)
+        return statistics.median(seconds)
+
+    interpreter = median_seconds([sys.executable, '-c', 'pass'])
+    conversion = median_seconds([sys.executable, os.path.abspath(__file__), *argv])
+    return {'interpreter': interpreter, 'conversion': conversion, 'difference': conversion - interpreter}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs one conversion from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 0 if the conversion succeeded, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(description="Convert a CSV, JSON, JSON Lines, XML, XLSX or HTML file to another format.")
+    parser.add_argument('input_file', help="Path to the input file, it may be compressed (.gz, .bz2, .zst).")
+    parser.add_argument('output_format', nargs='?', help="Output format: csv, json, jsonl, xml, xlsx, html, md or tex. Taken from the output file if omitted.")
+    parser.add_argument('-o', '--output', help="Output file, the converted data is written to stdout if omitted.")
+    parser.add_argument('--chunksize', type=int, help=f"Stream the input in chunks of this many rows, supported for {', '.join(ChunkWriter.supported_formats)} and xlsx output files.")
+    parser.add_argument('--columns', type=lambda value: value.split(','), help="Comma-separated columns to convert, all columns if omitted.")
+    parser.add_argument('--engine', choices=DataManager.engines, default='pandas', help="Reader for CSV and JSON input.")
+    parser.add_argument('--sheet', default=0, type=lambda value: int(value) if value.isdigit() else value, help="Name or index of the XLSX sheet.")
+    parser.add_argument('--compact', action='store_true', help="Write JSON without indentation.")
+    parser.add_argument('--fixed-width', type=int, metavar='WIDTH', help="Pad Markdown columns to WIDTH characters instead of measuring the data first.")
+    parser.add_argument('--timing', action='store_true', help="Print the seconds of every stage and the imported libraries to stderr.")
+    parser.add_argument('--cold-start', type=int, metavar='RUNS', help="Measure the conversion in fresh interpreters RUNS times and print the median.")
+    args = parser.parse_intermixed_args(argv)
+
+    if args.output_format is None:
+        if not args.output:
+            parser.error("the output format is required when no output file is given")
+        args.output_format = output_format_for(args.output)
+
+    # Only some formats can be written chunk by chunk, the others need the whole data
+    chunked_formats = (*ChunkWriter.supported_formats, 'xlsx')
+    if args.chunksize and args.output and args.output_format not in chunked_formats:
+        parser.error(f"--chunksize supports the output formats {', '.join(chunked_formats)}, not {args.output_format or 'none'}")
+
+    if args.cold_start:
+        # Runs the same conversion without the --cold-start option in fresh interpreters
+        argv = sys.argv[1:] if argv is None else argv
+        child_argv = []
+        skip_value = False
+        for argument in argv:
+            if skip_value:
+                skip_value = False
+            elif argument == '--cold-start':
+                skip_value = True
+            elif not argument.startswith('--cold-start='):
+                child_argv.append(argument)
+        result = measure_cold_start(child_argv, args.cold_start)
+        print(f"Cold start (median of {args.cold_start} runs): interpreter {result['interpreter']:.4f}s, "
+              f"conversion {result['conversion']:.4f}s, imports and conversion {result['difference']:.4f}s")
+        return 0
+
+    if args.output_format == 'xlsx' and not args.output and sys.stdout.isatty():
+        print("Convert Error: XLSX output is binary, write it to a file with -o.", file=sys.stderr)
+        return 1
+
+    timings = convert(args)
+    if args.timing:
+        if timings is not None:
+            stages = '  '.join(f"{stage} {seconds:.4f}s" for stage, seconds in timings.items())
+            print(f"Timing: {stages}  total {time.perf_counter() - start_time:.4f}s", file=sys.stderr)
+        imported = [name for name in HEAVY_MODULES if name in sys.modules]
+        print(f"Imported libraries: {', '.join(imported) or 'none'}", file=sys.stderr)
+    return 0 if timings is not None else 1
 
 
 # Execute code only when script is run directly, not imported as a module
 if __name__ == '__main__':
-    # Function to load data from a file
-    def load_input_file(input_file: str):
-        """
-        Initializes the data loading class based on file type (csv, json, xml, xlsx, html).
-        Args:
-            input_file (str): Path to the input file.
-        Returns:
-            DataManager: Instance of the data loading class.
-        """
-        file_data_manager = DataManager(input_file)
-        return file_data_manager
-
-    # Function to create a DataFrame from loaded data
-    def create_dataframe(file_data_manager: DataManager):
-        """
-        Loads data from a file and creates a Pandas DataFrame.
-        Args:
-            file_data_manager (DataManager): Instance of the data loading class.
-        Returns:
-            pd.DataFrame: Pandas DataFrame containing the loaded data.
-        """
-        df_load_data = file_data_manager.load_data()
-        return df_load_data
-
-    # Function to convert data to specified format and store in buffers
-    def convert_data_to_buffer(df_load_data):
-        """
-        Initializes the data conversion class and converts the DataFrame to the desired format.
-        Args:
-            df_load_data (pd.DataFrame): Pandas DataFrame to be converted.
-        """
-        file_converter = Converter(
-            df_load_data,
-            show_output_format,
-            bytes_buffer_manager.bytes_buffer,
-            xlsx_buffer_manager.xlsx_buffer,
-            string_buffer_manager.string_buffer,
-        )
-        file_converter.convert_data()
-
-    # Function to read and display converted data based on the output format
-    def show_convert_data():
-        """
-        Reads the converted data from the appropriate buffer and returns it.
-        Returns:
-            str or pd.DataFrame: The converted data in the specified format.
-        """
-        list_allowed_extensions = ['csv', 'json', 'html', 'md', 'tex']
-        
-        if show_output_format == 'xml':
-            return bytes_buffer_manager.read_bytes_buffer()
-        elif show_output_format == 'xlsx':
-            return xlsx_buffer_manager.read_buffer_xlsx()
-        elif show_output_format in list_allowed_extensions:
-            return string_buffer_manager.read_string_buffer()
-
-    # Function to export converted data to a file (commented out for now)
-    def export_file(output_file_path, export_output_format):
-        """
-        Exports the data to a file in the specified format.
-
-        Args:
-            output_file_path (str): The path to the output file.
-            export_output_format (str): The desired output format.
-
-        Raises:
-            ValueError: If the file extension does not match the specified export format.
-        """
-        # Regular expression pattern to extract the file extension
-        pattern = r'([a-z]+)$'
-        suffix = re.search(pattern, output_file_path)[0]
-    
-        # Check if the found file extension matches the specified export format
-        if suffix == export_output_format:
-            # Create an instance of ExportData to handle the export process
-            export_data_manager = ExportData(df_load_data, export_output_format, output_file_path)
-            
-            # Perform the data export
-            export_data_manager.export_data()
-        else:
-            # Raise a ValueError if the found file extension does not match the specified export format
-            raise ValueError(f"Incorrect export format. Expected {export_output_format}, got {suffix}.")
-
-
-    # --- Main execution flow --- #
-    
-    # Initialize buffer managers for different data types
-    bytes_buffer_manager = BufferManager()
-    xlsx_buffer_manager = BufferManager()
-    string_buffer_manager = BufferManager()
-    
-    # Define input file path and desired output format
-    input_file = 'dataset/mock_data.html'
-    show_output_format = 'csv'
-    
-    # --- View output data functionality --- #
-    
-    file_data_manager = load_input_file(input_file)
-    df_load_data = create_dataframe(file_data_manager)
-    convert_data_to_buffer(df_load_data)
-    result = show_convert_data()
-    print(result)
-    # gui = show(df_load_data)
-
-    # --- Export functionality commented out for now --- #
-    
-    # Define output file path and format
-    # output_file_path = 'dataset/test_export_file.csv'
-    # export_output_format = 'csv'
-    # export_file(output_file_path, export_output_format)
+    sys.exit(main())
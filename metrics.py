@@ -0,0 +1,369 @@
+# Import classes for loading and converting data
+from convert_data_manager import DataManager, Converter
+
+# Import the BufferManager class to hold the converted data
+from io_buffer import BufferManager
+
+# Import the DtypeOptimizer class for the optional optimize stage
+from dtype_optimizer import DtypeOptimizer
+
+# Import function is_valid_mime_type from module valid_mime_type
+from valid_mime_type import is_valid_mime_type
+
+# Import the warm_up function for the import stage
+from lazy_import import warm_up
+
+# Import the contextmanager decorator for the stage timer
+from contextlib import contextmanager
+
+# Import modules for logging, profiling, tracing memory and measuring time
+import argparse
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+
+
+def current_rss_bytes() -> int | None:
+    """
+    Returns the current resident set size of the process.
+
+    Returns:
+        int or None: RSS in bytes, None if it cannot be read on this platform.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class LoggingSink:
+    """
+    The LoggingSink class writes every stage event to a logger.
+
+    Args:
+        logger (logging.Logger, optional): The logger, the 'converter.metrics' logger if None.
+        level (int): The logging level of the events.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        """
+        Initializes the LoggingSink class with the logger and level.
+
+        Args:
+            logger (logging.Logger, optional): The logger, the 'converter.metrics' logger if None.
+            level (int): The logging level of the events.
+        """
+        self.logger = logger or logging.getLogger('converter.metrics')
+        self.level = level
+
+    def emit(self, event: dict) -> None:
+        """
+        Writes the event to the logger.
+
+        Args:
+            event (dict): The stage event.
+        """
+        fields = ' '.join(
+            f"{name}={value:.6f}" if isinstance(value, float) else f"{name}={value}"
+            for name, value in event.items() if value is not None
+        )
+        self.logger.log(self.level, fields)
+
+
+class MemorySink:
+    """
+    The MemorySink class collects the stage events in a list.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the MemorySink class with an empty list of events.
+        """
+        self.events = []
+
+    def emit(self, event: dict) -> None:
+        """
+        Appends the event to the list of events.
+
+        Args:
+            event (dict): The stage event.
+        """
+        self.events.append(event)
+
+    def totals(self) -> dict:
+        """
+        Sums the durations of the collected events by stage.
+
+        Returns:
+            dict: Total seconds of every stage.
+        """
+        totals = {}
+        for event in self.events:
+            totals[event['stage']] = totals.get(event['stage'], 0.0) + event['seconds']
+        return totals
+
+
+class PrometheusFileSink:
+    """
+    The PrometheusFileSink class keeps counters of the stage events in a Prometheus text exposition file.
+
+    The file is rewritten after every event and can be read by the node_exporter
+    textfile collector.
+
+    Args:
+        output_file (str): Path to the .prom file.
+        prefix (str): Prefix of the metric names.
+    """
+
+    def __init__(self, output_file: str, prefix: str = 'converter') -> None:
+        """
+        Initializes the PrometheusFileSink class with the output file and metric prefix.
+
+        Args:
+            output_file (str): Path to the .prom file.
+            prefix (str): Prefix of the metric names.
+        """
+        self.output_file = output_file
+        self.prefix = prefix
+        self.counters = {}
+
+    def emit(self, event: dict) -> None:
+        """
+        Adds the event to the counters and rewrites the file.
+
+        Args:
+            event (dict): The stage event.
+        """
+        labels = (event['stage'], event.get('input_format') or '', event.get('output_format') or '')
+        counter = self.counters.setdefault(labels, {'calls': 0, 'seconds': 0.0, 'bytes_in': 0, 'bytes_out': 0, 'rows': 0})
+        counter['calls'] += 1
+        counter['seconds'] += event['seconds']
+        for name in ('bytes_in', 'bytes_out', 'rows'):
+            counter[name] += event.get(name) or 0
+        self.write()
+
+    def write(self) -> None:
+        """
+        Writes all counters to the file in the Prometheus text format.
+        """
+        metrics = [
+            ('calls', 'stage_calls_total', 'Number of executed pipeline stages.'),
+            ('seconds', 'stage_seconds_total', 'Time spent in pipeline stages in seconds.'),
+            ('bytes_in', 'stage_bytes_in_total', 'Bytes read by pipeline stages.'),
+            ('bytes_out', 'stage_bytes_out_total', 'Bytes written by pipeline stages.'),
+            ('rows', 'stage_rows_total', 'Rows processed by pipeline stages.'),
+        ]
+        lines = []
+        for field, name, help_text in metrics:
+            lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {self.prefix}_{name} counter")
+            for (stage, input_format, output_format), counter in sorted(self.counters.items()):
+                lines.append(f'{self.prefix}_{name}{{stage="{stage}",input_format="{input_format}",output_format="{output_format}"}} {counter[field]}')
+
+        # Writes to a temporary file first, so the collector never reads a partial file
+        temp_file = f"{self.output_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(temp_file, self.output_file)
+
+
+class Instrumentation:
+    """
+    The Instrumentation class measures the stages of a conversion and sends the events to a sink.
+
+    Every event contains the stage name, its duration in seconds, the memory delta and
+    the fields given to stage(), e.g. bytes_in, bytes_out and rows. The memory delta is
+    measured with tracemalloc if it is tracing, otherwise from the process RSS.
+
+    Args:
+        sink: Object with an emit(event) method, e.g. LoggingSink, MemorySink or PrometheusFileSink.
+    """
+
+    def __init__(self, sink) -> None:
+        """
+        Initializes the Instrumentation class with the sink.
+
+        Args:
+            sink: Object with an emit(event) method.
+        """
+        self.sink = sink
+
+    @staticmethod
+    def memory_bytes() -> int | None:
+        """
+        Returns the memory in use, from tracemalloc if it is tracing, otherwise the RSS.
+
+        Returns:
+            int or None: Memory in bytes, None if it cannot be measured.
+        """
+        if tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return current_rss_bytes()
+
+    @contextmanager
+    def stage(self, name: str, **fields):
+        """
+        Measures the code in the with block as one stage and emits its event.
+
+        The yielded dict can be updated inside the block with fields known only at the
+        end of the stage, e.g. rows or bytes_out.
+
+        Args:
+            name (str): Name of the stage.
+            **fields: Fields added to the event.
+
+        Yields:
+            dict: The event, emitted when the block ends.
+        """
+        event = {'stage': name, **fields}
+        memory_before = self.memory_bytes()
+        start = time.perf_counter()
+        try:
+            yield event
+        except Exception as e:
+            event['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            event['seconds'] = time.perf_counter() - start
+            memory_after = self.memory_bytes()
+            event['memory_delta_bytes'] = memory_after - memory_before if memory_before is not None and memory_after is not None else None
+            self.sink.emit(event)
+
+    def convert(self, input_file: str, output_format: str, optimizer: DtypeOptimizer | None = None) -> bytes | None:
+        """
+        Loads the input file and converts it to the output format, measuring every stage.
+
+        The stages are import, detect, validate, read, optimize (only with an optimizer), convert
+        and readback. The import stage imports pandas and the libraries of the input and output
+        format, so their import time is not counted in the read or convert stage.
+
+        Args:
+            input_file (str): Path to the input file.
+            output_format (str): Desired output format.
+            optimizer (DtypeOptimizer, optional): Shrinks the column types between read and convert.
+
+        Returns:
+            bytes or None: The converted data, None if the file could not be loaded or is not valid.
+        """
+        file_data_manager = DataManager(input_file)
+
+        # The load stages are the stages of DataManager.load_data(), their errors are handled the same way
+        try:
+            bytes_in = os.path.getsize(input_file)
+
+            with self.stage('import', output_format=output_format):
+                # The input format is taken from the extension, the detected format is only known after detect
+                warm_up([file_data_manager.extract_suffix().lstrip('.'), output_format])
+
+            with self.stage('detect', output_format=output_format) as event:
+                suffix = file_data_manager.detect_suffix()
+                event['input_format'] = suffix.lstrip('.')
+
+            fields = {'input_format': suffix.lstrip('.'), 'output_format': output_format}
+            with self.stage('validate', bytes_in=bytes_in, **fields) as event:
+                is_valid = is_valid_mime_type(suffix, input_file)
+                event['valid'] = is_valid
+            if not is_valid:
+                raise ValueError("The file extension is not supported. Invalid MIME type.")
+
+            with self.stage('read', bytes_in=bytes_in, **fields) as event:
+                df_load_data = file_data_manager.select(file_data_manager.read_data(suffix))
+                event['rows'] = len(df_load_data)
+
+            if optimizer is not None:
+                with self.stage('optimize', rows=len(df_load_data), **fields) as event:
+                    df_load_data = optimizer.optimize(df_load_data)
+                    event['saved_bytes'] = optimizer.report['saved_bytes']
+
+        # The EmptyDataError and ParserError of pandas are ValueErrors, the XML parse errors SyntaxErrors
+        except (FileNotFoundError, SyntaxError, ValueError) as e:
+            print(f"Load Error: {e}")
+            return None
+
+        buffer_manager = BufferManager()
+        file_converter = Converter(df_load_data, output_format, buffer_manager=buffer_manager)
+        with self.stage('convert', rows=len(df_load_data), **fields):
+            file_converter.convert_data()
+
+        with self.stage('readback', **fields) as event:
+            data = file_converter.read_bytes()
+            event['bytes_out'] = len(data)
+        return data
+
+
+def profile_conversion(input_file: str, output_format: str, sort: str = 'cumulative', limit: int = 25, optimizer: DtypeOptimizer | None = None) -> str:
+    """
+    Runs one conversion under cProfile and tracemalloc and returns a report.
+
+    Args:
+        input_file (str): Path to the input file.
+        output_format (str): Desired output format.
+        sort (str): Sort key of the profile statistics.
+        limit (int): Number of functions and allocation sites in the report.
+        optimizer (DtypeOptimizer, optional): Shrinks the column types between read and convert.
+
+    Returns:
+        str: The stage timings, the profile statistics and the top allocation sites.
+    """
+    sink = MemorySink()
+    profiler = cProfile.Profile()
+
+    tracemalloc.start()
+    try:
+        profiler.enable()
+        Instrumentation(sink).convert(input_file, output_format, optimizer)
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    report = io.StringIO()
+    report.write("Stages:\n")
+    for event in sink.events:
+        report.write(f"  {event['stage']:10} {event['seconds']:10.4f}s  memory delta {event['memory_delta_bytes'] or 0:>12} B\n")
+    report.write(f"Peak traced memory: {peak} B\n\nProfile:\n")
+    pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(limit)
+    report.write("Top allocation sites:\n")
+    for statistic in snapshot.statistics('lineno')[:limit]:
+        report.write(f"  {statistic}\n")
+    return report.getvalue()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs one instrumented conversion from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 0 if the conversion succeeded, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(description="Measure the stages of one conversion.")
+    parser.add_argument('input_file', help="Path to the input file.")
+    parser.add_argument('output_format', help="Output format: csv, json, jsonl, xml, xlsx, html, md or tex.")
+    parser.add_argument('--profile', action='store_true', help="Run under cProfile and tracemalloc and print a report.")
+    parser.add_argument('--prometheus', help="Write the stage counters to this Prometheus text file.")
+    parser.add_argument('--optimize', action='store_true', help="Shrink the column types between read and convert.")
+    args = parser.parse_args(argv)
+
+    optimizer = DtypeOptimizer() if args.optimize else None
+    if args.profile:
+        print(profile_conversion(args.input_file, args.output_format, optimizer=optimizer))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    sink = PrometheusFileSink(args.prometheus) if args.prometheus else LoggingSink()
+    return 0 if Instrumentation(sink).convert(args.input_file, args.output_format, optimizer) else 1
+
+
+# Execute code only when script is run directly, not imported as a module
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,12 @@
 # mime_type_csv.py
 
+# Import the open_binary function for reading compressed files
+from compressed_io import open_binary
+
+# Import the repeat function for counting the commas of many records in one call
+from itertools import repeat
+
+
 class CsvMatcher():
     """
     The CsvMatcher class is used for matching CSV files.
@@ -57,13 +64,28 @@ class ValidateCsv(CsvMatcher):
     """
     The ValidateCsv class inherits from the CsvMatcher class and is used for validating CSV files.
 
+    The file is read once, in blocks of block_size bytes, so the memory use does not
+    depend on the size of the file. Only an invalid file is read a second time, line by
+    line, to find the number of the invalid line.
+
     Args:
         input_file (str): The path to the input file.
 
     Attributes:
         Inherits attributes from the CsvMatcher class.
+        signature_found (bool): True if the signature was found during the last check.
+        expected_column_count (int | None): Number of columns in the first line.
+        invalid_line (int | None): Line number of the first invalid line, None if all lines are valid.
+        invalid_column_count (int | None): Number of columns found on the invalid line.
+        unclosed_quote_line (int | None): Line number of a quote that is not closed before the end of the file.
     """
 
+    # Number of bytes read from the file at once
+    block_size = 64 * 1024
+
+    # The quote character, a field between two quotes may contain commas and line breaks
+    quote = b'"'
+
     def __init__(self, input_file: str):
         """
         Initializes the ValidateCsv object with the input file.
@@ -72,40 +94,194 @@ class ValidateCsv(CsvMatcher):
             input_file (str): The path to the input file.
         """
         super().__init__(input_file)
+        self.signature_found = False
+        self.expected_column_count = None
+        self.invalid_line = None
+        self.invalid_column_count = None
+        self.unclosed_quote_line = None
 
     def check_csv_line(self):
         """
-        Checks the number of commas in each line of the CSV file.
+        Checks the number of columns in each line of the CSV file.
+
+        Commas and line breaks inside quoted fields are not counted as separators
+        and blank lines are skipped. Every block is split at the quotes and the parts
+        inside quotes are left out, so the records and commas are counted by bytes
+        methods, without a Python loop over the bytes.
+
+        If the file is invalid, the number and column count of the first invalid line
+        are stored in invalid_line and invalid_column_count, a quote that is not closed
+        until the end of the file in unclosed_quote_line.
+
+        Returns:
+            bool: True if all lines have the same number of columns, otherwise False.
+        """
+        self.signature_found = False
+        self.expected_column_count = None
+
+        in_quotes = False
+        pending = b''  # Start of the record that continues in the next block
+
+        with open_binary(self.input_file) as f:
+            while block := f.read(self.block_size):
+                # Checks if the CSV file signature matches
+                self.signature_found = self.signature_found or self.match(block)
+
+                # The parts outside and inside quotes alternate, every quoted field is
+                # replaced by one quote, so a record with an empty quoted field is not blank
+                parts = block.split(self.quote)
+                if in_quotes:
+                    outside = self.quote + self.quote.join(parts[1::2])
+                else:
+                    outside = self.quote.join(parts[0::2])
+                if len(parts) % 2 == 0:
+                    in_quotes = not in_quotes
+
+                records = (pending + outside).split(b'\n')
+                pending = records.pop()
+                if not self._check_records(records):
+                    return self._scan_lines()
+
+        if in_quotes or (pending and not self._check_records([pending])):
+            return self._scan_lines()
+
+        # An empty file or a file with blank lines only is not a valid CSV file
+        return self.expected_column_count is not None
+
+    def _check_records(self, records: list[bytes]) -> bool:
+        """
+        Compares the column count of finished records with the first line.
+
+        Args:
+            records (list[bytes]): The records without their quoted fields.
 
         Returns:
-            bool: True if all lines have the same number of commas, otherwise False.
+            bool: True if all records are valid, otherwise False.
         """
-        with open(self.input_file, 'r') as f:
-            lines = f.readlines()
+        if self.expected_column_count is None:
+            # The first record that is not blank gives the number of columns
+            for index, record in enumerate(records):
+                if record.strip():
+                    self.expected_column_count = record.count(b',') + 1
+                    records = records[index + 1:]
+                    break
+            else:
+                return True
 
-        comma_count = lines[0].count(',')  # Number of commas in the first line
+        comma_counts = list(map(bytes.count, records, repeat(b',')))
+        expected_commas = self.expected_column_count - 1
+        if all(count == expected_commas for count in set(comma_counts)):
+            return True
+        # Only blank lines may have another number of commas
+        return all(not record.strip() for record, count in zip(records, comma_counts) if count != expected_commas)
 
-        # Checks each line
-        for line in lines[1:]:
-            if line.count(',') != comma_count:
-                return False  # Returns False if the number of commas differs
-        return True  # Returns True if all lines have the same number of commas
+    def _scan_lines(self):
+        """
+        Checks the CSV file line by line to find the number of the first invalid line.
+
+        The check stops at the first invalid line and stores its number and column count
+        in invalid_line and invalid_column_count. A quote that is not closed until the
+        end of the file is stored in unclosed_quote_line.
+
+        Returns:
+            bool: True if all lines have the same number of columns, otherwise False.
+        """
+        self.signature_found = False
+        self.expected_column_count = None
+        self.invalid_line = None
+        self.invalid_column_count = None
+        self.unclosed_quote_line = None
+
+        in_quotes = False
+        line_number = 0  # Number of line breaks read so far
+        record_line = 1  # Line number on which the current record starts
+        column_count = 1  # Number of columns in the current record
+        record_empty = True  # True while the current record contains only whitespace
+        quote_line = None  # Line number of the last opening quote
+
+        with open_binary(self.input_file) as f:
+            while block := f.read(self.block_size):
+                # Checks if the CSV file signature matches
+                self.signature_found = self.signature_found or self.match(block)
+
+                pieces = block.split(b'\n')
+                last_index = len(pieces) - 1
+                for index, piece in enumerate(pieces):
+                    if in_quotes or self.quote in piece:
+                        # Splitting at the quotes gives the parts inside and outside quotes in turn,
+                        # only the commas of the outside parts are counted
+                        parts = piece.split(self.quote)
+                        column_count += b''.join(parts[1::2] if in_quotes else parts[0::2]).count(b',')
+                        if len(parts) % 2 == 0:
+                            in_quotes = not in_quotes
+                        if in_quotes and len(parts) > 1:
+                            # The last quote of the piece opens a field
+                            quote_line = line_number + 1
+                    else:
+                        # Fast path for pieces without quotes
+                        column_count += piece.count(b',')
+
+                    if record_empty and piece.strip():
+                        record_empty = False
+
+                    # The last piece of a block continues in the next block
+                    if index == last_index:
+                        continue
+
+                    line_number += 1
+                    if in_quotes:
+                        # A line break inside a quoted field does not end the record
+                        continue
+                    if not self._end_record(record_line, column_count, record_empty):
+                        return False  # Returns False on the first invalid line
+                    column_count = 1
+                    record_empty = True
+                    record_line = line_number + 1
+
+        # A quoted field that is not closed takes the rest of the file
+        if in_quotes:
+            self.unclosed_quote_line = quote_line
+            return False
+
+        # Checks the last record if the file does not end with a line break
+        if not record_empty and not self._end_record(record_line, column_count, record_empty):
+            return False
+
+        # An empty file or a file with blank lines only is not a valid CSV file
+        return self.expected_column_count is not None
+
+    def _end_record(self, record_line: int, column_count: int, record_empty: bool) -> bool:
+        """
+        Compares the column count of a finished record with the first line.
+
+        Args:
+            record_line (int): Line number on which the record starts.
+            column_count (int): Number of columns found in the record.
+            record_empty (bool): True if the record is a blank line.
+
+        Returns:
+            bool: True if the record is valid, otherwise False.
+        """
+        if record_empty:
+            return True  # Blank lines are skipped
+        if self.expected_column_count is None:
+            self.expected_column_count = column_count  # Number of columns in the first line
+            return True
+        if column_count != self.expected_column_count:
+            self.invalid_line = record_line
+            self.invalid_column_count = column_count
+            return False
+        return True
 
     def validate_csv(self):
         """
-        Validates the CSV file by checking its signature and line structure.
+        Validates the CSV file by checking its signature and line structure in a single pass.
 
         Returns:
             bool: True if the CSV file is valid, otherwise False.
         """
-        with open(self.input_file, 'rb') as f:
-            content = f.read()
-
-        # Checks if the CSV file signature matches
-        is_match = self.match(content)
-        
-        # Checks if each line of the CSV file has the same number of commas
+        # Checks if each line of the CSV file has the same number of columns
         is_valid_line = self.check_csv_line()
 
         # Returns True if both signature and line structure are valid, otherwise False
-        return is_match and is_valid_line
+        return self.signature_found and is_valid_line
@@ -0,0 +1,389 @@
+# mime_type_detector.py
+
+# Import the CsvMatcher class from the file mime_type_csv.py
+from mime_type_csv import CsvMatcher
+
+# Import the json module for parsing the first line of JSON Lines files
+import json
+
+# Import the open_binary function for reading compressed files
+from compressed_io import open_binary
+
+
+class XlsxMatcher():
+    """
+    The XlsxMatcher class is used for matching XLSX files.
+
+    Args:
+        input_file (str): The path to the input file.
+
+    Attributes:
+        signature (bytes): The signature for ZIP archives, used by XLSX files.
+        input_file (str): The path to the input file.
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initializes the XlsxMatcher object with the input file.
+
+        Args:
+            input_file (str): The path to the input file.
+        """
+        self.signature = b"\x50\x4B\x03\x04"  # Signature for ZIP archives (PK\x03\x04)
+        self.input_file = input_file
+
+    def match(self, buf: bytes):
+        """
+        Checks that the buffer starts with the ZIP signature and contains an Office Open XML entry.
+
+        Args:
+            buf (bytes): The data buffer.
+
+        Returns:
+            bool: True if the buffer looks like an XLSX file, otherwise False.
+        """
+        return buf.startswith(self.signature) and (b"[Content_Types].xml" in buf or b"xl/" in buf)
+
+    def extension(self):
+        """
+        Returns the file extension for XLSX files.
+
+        Returns:
+            str: The file extension "xlsx".
+        """
+        return "xlsx"
+
+    def mime(self):
+        """
+        Returns the MIME type for XLSX files.
+
+        Returns:
+            str: The MIME type for XLSX files.
+        """
+        return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class HtmlMatcher():
+    """
+    The HtmlMatcher class is used for matching HTML files.
+
+    Args:
+        input_file (str): The path to the input file.
+
+    Attributes:
+        signature (tuple): The opening tags HTML files start with.
+        tags (tuple): The tags that mark a file starting with a comment or another tag as HTML.
+        input_file (str): The path to the input file.
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initializes the HtmlMatcher object with the input file.
+
+        Args:
+            input_file (str): The path to the input file.
+        """
+        self.signature = (b"<!doctype html", b"<html", b"<table")  # Opening tags of HTML files
+        self.tags = (b"<html", b"<table")  # Tags found after a leading comment or <meta> tag
+        self.input_file = input_file
+
+    def match(self, buf: bytes):
+        """
+        Checks whether the buffer starts with an HTML opening tag.
+
+        A file that starts with a comment or another tag, e.g. <meta charset="utf-8">, is
+        HTML if an <html> or <table> tag follows in the buffer, unless it starts with an
+        XML declaration.
+
+        Args:
+            buf (bytes): The data buffer.
+
+        Returns:
+            bool: True if the buffer looks like an HTML file, otherwise False.
+        """
+        head = strip_buffer(buf).lower()
+        if head.startswith(self.signature):
+            return True
+        return head.startswith(b"<") and not head.startswith(b"<?xml") and any(tag in head for tag in self.tags)
+
+    def extension(self):
+        """
+        Returns the file extension for HTML files.
+
+        Returns:
+            str: The file extension "html".
+        """
+        return "html"
+
+    def mime(self):
+        """
+        Returns the MIME type for HTML files.
+
+        Returns:
+            str: The MIME type "text/html".
+        """
+        return "text/html"
+
+
+class XmlMatcher():
+    """
+    The XmlMatcher class is used for matching XML files.
+
+    Args:
+        input_file (str): The path to the input file.
+
+    Attributes:
+        signature (bytes): The signature for XML files (opening angle bracket).
+        input_file (str): The path to the input file.
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initializes the XmlMatcher object with the input file.
+
+        Args:
+            input_file (str): The path to the input file.
+        """
+        self.signature = b"\x3C"  # Signature for XML files (<)
+        self.input_file = input_file
+
+    def match(self, buf: bytes):
+        """
+        Checks whether the buffer starts with an XML declaration or element.
+
+        HTML files also start with '<', so HtmlMatcher has to be tried first.
+
+        Args:
+            buf (bytes): The data buffer.
+
+        Returns:
+            bool: True if the buffer looks like an XML file, otherwise False.
+        """
+        return strip_buffer(buf).startswith(self.signature)
+
+    def extension(self):
+        """
+        Returns the file extension for XML files.
+
+        Returns:
+            str: The file extension "xml".
+        """
+        return "xml"
+
+    def mime(self):
+        """
+        Returns the MIME type for XML files.
+
+        Returns:
+            str: The MIME type "application/xml".
+        """
+        return "application/xml"
+
+
+class JsonMatcher():
+    """
+    The JsonMatcher class is used for matching JSON files.
+
+    Args:
+        input_file (str): The path to the input file.
+
+    Attributes:
+        signature (tuple): The characters a JSON document starts with.
+        input_file (str): The path to the input file.
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initializes the JsonMatcher object with the input file.
+
+        Args:
+            input_file (str): The path to the input file.
+        """
+        self.signature = (b"\x5B", b"\x7B")  # Signature for JSON files ([ or {)
+        self.input_file = input_file
+
+    def match(self, buf: bytes):
+        """
+        Checks whether the buffer starts with a JSON array or object.
+
+        Args:
+            buf (bytes): The data buffer.
+
+        Returns:
+            bool: True if the buffer looks like a JSON file, otherwise False.
+        """
+        return strip_buffer(buf).startswith(self.signature)
+
+    def extension(self):
+        """
+        Returns the file extension for JSON files.
+
+        Returns:
+            str: The file extension "json".
+        """
+        return "json"
+
+    def mime(self):
+        """
+        Returns the MIME type for JSON files.
+
+        Returns:
+            str: The MIME type "application/json".
+        """
+        return "application/json"
+
+
+class JsonLinesMatcher():
+    """
+    The JsonLinesMatcher class is used for matching newline-delimited JSON (JSON Lines) files.
+
+    Args:
+        input_file (str): The path to the input file.
+
+    Attributes:
+        signature (bytes): The character every line of a JSON Lines file starts with.
+        input_file (str): The path to the input file.
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initializes the JsonLinesMatcher object with the input file.
+
+        Args:
+            input_file (str): The path to the input file.
+        """
+        self.signature = b"\x7B"  # Signature for JSON Lines files ({)
+        self.input_file = input_file
+
+    def match(self, buf: bytes, labeled: bool = False):
+        """
+        Checks whether the buffer starts with a complete JSON object on the first line and another object on the next line.
+
+        A JSON document that spans several lines does not parse line by line, so
+        JsonLinesMatcher has to be tried before JsonMatcher. A JSON document written
+        on a single line, e.g. by DataFrame.to_json(), is not matched.
+
+        Args:
+            buf (bytes): The data buffer.
+            labeled (bool): The file has a JSON Lines extension, so a single object without
+                a line break and a first line cut off at the end of the buffer match as well.
+
+        Returns:
+            bool: True if the buffer looks like a JSON Lines file, otherwise False.
+        """
+        first_line, _, next_lines = strip_buffer(buf).partition(b"\n")
+        first_line = first_line.strip()
+        if not first_line.startswith(self.signature):
+            return False
+        if labeled and not next_lines and len(buf) >= FileTypeDetector.sniff_size:
+            # The first record is longer than the buffer
+            return True
+        if not labeled and not next_lines.lstrip().startswith(self.signature):
+            # A single object may be a JSON document as well
+            return False
+        try:
+            return isinstance(json.loads(first_line), dict)
+        except ValueError:
+            return False
+
+    def extension(self):
+        """
+        Returns the file extension for JSON Lines files.
+
+        Returns:
+            str: The file extension "jsonl".
+        """
+        return "jsonl"
+
+    def mime(self):
+        """
+        Returns the MIME type for JSON Lines files.
+
+        Returns:
+            str: The MIME type "application/x-ndjson".
+        """
+        return "application/x-ndjson"
+
+
+def strip_buffer(buf: bytes) -> bytes:
+    """
+    Removes the UTF-8 byte order mark and the leading whitespace from the buffer.
+
+    Args:
+        buf (bytes): The data buffer.
+
+    Returns:
+        bytes: The buffer without the leading byte order mark and whitespace.
+    """
+    return buf.removeprefix(b"\xEF\xBB\xBF").lstrip()
+
+
+class FileTypeDetector:
+    """
+    The FileTypeDetector class detects the format of a file from its content.
+
+    Only the first sniff_size bytes of the file are read. The matchers are tried in
+    the order of the registry and the first one that matches decides the format.
+
+    Args:
+        input_file (str): The path to the input file.
+    """
+
+    # Number of bytes read from the beginning of the file
+    sniff_size = 4096
+
+    # Registered matchers in the order they are tried, more specific formats first
+    registry = [XlsxMatcher, HtmlMatcher, XmlMatcher, JsonLinesMatcher, JsonMatcher, CsvMatcher]
+
+    def __init__(self, input_file: str) -> None:
+        """
+        Initializes the FileTypeDetector class with the input file path.
+
+        Args:
+            input_file (str): Path to the input file.
+        """
+        self.input_file = input_file
+
+    def read_head(self) -> bytes:
+        """
+        Reads the beginning of the input file.
+
+        Compressed files are decompressed, so their content is detected.
+
+        Returns:
+            bytes: The first sniff_size bytes of the file.
+        """
+        with open_binary(self.input_file) as f:
+            return f.read(self.sniff_size)
+
+    def matcher_for(self, suffix: str):
+        """
+        Returns the matcher registered for the given file extension.
+
+        Args:
+            suffix (str): The file extension, with or without the leading dot.
+
+        Returns:
+            The matcher object for the extension, or None if no matcher is registered.
+        """
+        # The .ndjson extension is another name for JSON Lines
+        suffix = 'jsonl' if suffix.lstrip('.') == 'ndjson' else suffix
+        for matcher_class in self.registry:
+            matcher = matcher_class(self.input_file)
+            if matcher.extension() == suffix.lstrip('.'):
+                return matcher
+        return None
+
+    def detect(self):
+        """
+        Detects the format of the input file from its content.
+
+        Returns:
+            The first matching matcher object, or None if no matcher matches.
+        """
+        head = self.read_head()
+        for matcher_class in self.registry:
+            matcher = matcher_class(self.input_file)
+            if matcher.match(head):
+                return matcher
+        return None
@@ -0,0 +1,655 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import numpy for combining the column types of the Markdown values, on first use
+np = lazy_import('numpy')
+
+# Import wcwidth for measuring wide characters in Markdown, same as tabulate, if it is installed
+wcwidth = lazy_import('wcwidth', optional=True)
+
+# Import the escape function for writing HTML text content safely
+from html import escape
+
+# Import the Integral class for recognizing numpy integers in object columns
+from numbers import Integral
+
+
+class TableRenderer:
+    """
+    The TableRenderer class writes a DataFrame as a Markdown, HTML or LaTeX table row by row.
+
+    DataFrame.to_markdown(), to_html() and to_latex() build the whole table as one string
+    before it is written, and to_markdown() formats every cell through tabulate. The
+    renderer formats batch_rows rows at a time and writes them straight to the output
+    stream, so only one batch of formatted rows is held in memory.
+
+    The tables are the same as the tables of pandas. Markdown needs the width of every
+    column and HTML the number of decimals of every float column before the first row
+    is written, so the data is measured in a pre-pass. With fixed_width there is no
+    pre-pass: Markdown columns are padded to the fixed width, longer cells are written
+    as they are, every HTML float is written with its own decimals and every HTML
+    datetime and timedelta in full.
+
+    Args:
+        output_stream: Text stream (open file or StringIO) the table is written to.
+        output_format (str): Output format, one of the supported_formats.
+        fixed_width (int, optional): Width of the Markdown columns, the data is not measured first if set.
+    """
+
+    # Output formats that can be rendered row by row
+    supported_formats = ('md', 'html', 'tex')
+
+    # Number of rows formatted at a time
+    batch_rows = 10000
+
+    # Order of the Markdown column types, a column gets the most generic type of its values, same as in tabulate
+    md_types = {'none': 0, 'bool': 1, 'int': 2, 'float': 3, 'text': 4}
+
+    # Markdown column types of numpy kinds, tabulate takes numpy bools for numbers and datetimes for text
+    md_kinds = {'b': 'float', 'i': 'int', 'u': 'int', 'f': 'float', 'M': 'text', 'm': 'text'}
+
+    # Markdown column types of numpy columns in an object values matrix, which holds Python bools and Timestamps
+    md_object_kinds = {'b': 'bool', 'i': 'int', 'u': 'int', 'f': 'float', 'M': 'text', 'm': 'text'}
+
+    # Fraction digits of HTML datetimes and the matching isoformat() timespec
+    timespecs = {0: 'seconds', 3: 'milliseconds', 6: 'microseconds', 9: 'nanoseconds'}
+
+    # Number of decimals of floats in HTML and LaTeX, same as pandas
+    precision = 6
+
+    def __init__(self, output_stream, output_format: str, fixed_width: int | None = None) -> None:
+        """
+        Initializes the TableRenderer class with the output stream and output format.
+
+        Args:
+            output_stream: Text stream the table is written to.
+            output_format (str): Desired output format.
+            fixed_width (int, optional): Width of the Markdown columns, the data is not measured first if set.
+        """
+        if output_format not in self.supported_formats:
+            raise ValueError(f"Invalid table output format: {output_format}")
+
+        self.output_stream = output_stream
+        self.output_format = output_format
+        self.fixed_width = fixed_width
+
+    def render(self, df_load_data: pd.DataFrame) -> None:
+        """
+        Writes the DataFrame as a table to the output stream.
+
+        Args:
+            df_load_data (pd.DataFrame): The data to be written.
+        """
+        match self.output_format:
+            case 'md':
+                self._write_md(df_load_data)
+            case 'html':
+                self._write_html(df_load_data)
+            case 'tex':
+                self._write_tex(df_load_data)
+
+    def batches(self, df_load_data: pd.DataFrame, positions: list[int] | None = None):
+        """
+        Splits the DataFrame into batches of batch_rows rows.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+            positions (list[int], optional): Positions of the columns to be returned, all columns if None.
+
+        Yields:
+            list[list]: The values of every column of the next batch.
+        """
+        if positions is None:
+            positions = range(df_load_data.shape[1])
+        for start in range(0, len(df_load_data), self.batch_rows):
+            df_batch = df_load_data.iloc[start:start + self.batch_rows]
+            # Columns are taken by position, so duplicate column names work too
+            yield [df_batch.iloc[:, position].tolist() for position in positions]
+
+    def md_batches(self, df_load_data: pd.DataFrame, values_dtype=None):
+        """
+        Splits the values matrix of the DataFrame into batches of batch_rows rows.
+
+        tabulate formats DataFrame.values, in which all columns have one common type,
+        e.g. integers become floats next to a float column and nullable integers become
+        floats with nan when they are the only column. Datetimes and timedeltas stay numpy
+        values, which are printed differently from Timestamps.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+            values_dtype: Type of the values matrix of the whole DataFrame, the batches are cast to it.
+                Not used with fixed_width, then the values of every column are taken separately.
+
+        Yields:
+            list[list]: The values of every column of the next batch.
+        """
+        for start in range(0, len(df_load_data), self.batch_rows):
+            batch = df_load_data.iloc[start:start + self.batch_rows]
+            if self.fixed_width is not None:
+                # A table with fixed widths does not follow tabulate, every column keeps its own type
+                yield [batch.iloc[:, position].astype(object).tolist() for position in range(batch.shape[1])]
+                continue
+            values = batch.values
+            if values_dtype is not None and values.dtype != values_dtype:
+                values = values.astype(values_dtype)
+            if values.dtype.kind in 'Mm':
+                yield [list(column) for column in values.T]
+            else:
+                yield [column.tolist() for column in values.T]
+
+    def values_dtype(self, df_load_data: pd.DataFrame):
+        """
+        Returns the type of DataFrame.values without building the whole matrix.
+
+        The type only depends on the data for a single column of an extension type, e.g.
+        a nullable integer column is int64 without missing values and float64 with them.
+        Then the types of all batches are combined.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+
+        Returns:
+            numpy.dtype: The type of the values matrix.
+        """
+        values_dtype = df_load_data.iloc[:0].values.dtype
+        if values_dtype.kind == 'O' or not any(isinstance(dtype, pd.api.extensions.ExtensionDtype) for dtype in df_load_data.dtypes):
+            return values_dtype
+        return np.result_type(*(df_load_data.iloc[start:start + self.batch_rows].values.dtype for start in range(0, len(df_load_data), self.batch_rows)))
+
+    @staticmethod
+    def is_missing(value) -> bool:
+        """
+        Checks whether a value is missing: None, NaN, NA or NaT.
+
+        Args:
+            value: The value.
+
+        Returns:
+            bool: True if the value is missing.
+        """
+        return value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+
+    @staticmethod
+    def numpy_kind(dtype) -> str | None:
+        """
+        Returns the kind of a numpy dtype: 'b' for bool, 'i' and 'u' for integers, 'f' for floats.
+
+        Args:
+            dtype: The dtype of a column.
+
+        Returns:
+            str or None: The kind, None for extension types like strings, categories or nullable integers.
+        """
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            return None
+        return dtype.kind
+
+    @staticmethod
+    def trim_float(text: str) -> str:
+        """
+        Removes the trailing zeros of a float, keeping one digit after the decimal point.
+
+        Args:
+            text (str): The formatted float, e.g. '2.500000'.
+
+        Returns:
+            str: The shortened float, e.g. '2.5'.
+        """
+        if '.' not in text:
+            return text
+        text = text.rstrip('0')
+        return text + '0' if text.endswith('.') else text
+
+    @staticmethod
+    def md_type(value) -> str:
+        """
+        Returns the type of a Markdown cell value, strings that are numbers count as numbers, same as in tabulate.
+
+        Args:
+            value: The value.
+
+        Returns:
+            str: One of the md_types.
+        """
+        if value is None or (isinstance(value, str) and not value):
+            return 'none'
+        if hasattr(value, 'isoformat'):
+            return 'text'
+        if isinstance(value, bool) or (isinstance(value, str) and value in ('True', 'False')):
+            return 'bool'
+        if isinstance(value, Integral):
+            return 'int'
+        if isinstance(value, float):
+            return 'float'
+        if isinstance(value, str):
+            try:
+                int(value)
+                return 'int'
+            except ValueError:
+                pass
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return 'text'
+        # Only the literal inf and nan strings are numbers, not e.g. 'Infinity'
+        if isinstance(value, str) and (number != number or number in (float('inf'), float('-inf'))):
+            return 'float' if value.lower() in ('inf', '-inf', 'nan') else 'text'
+        return 'float'
+
+    @staticmethod
+    def md_cell(value, md_type: str) -> str:
+        """
+        Formats a value as a Markdown table cell, escaping the pipe character.
+
+        Args:
+            value: The value.
+            md_type (str): The type of the column.
+
+        Returns:
+            str: The cell text.
+        """
+        if value is None:
+            return ''
+        if md_type == 'float':
+            try:
+                text = format(float(value), 'g')
+            except (TypeError, ValueError):
+                text = str(value)
+        elif md_type == 'int':
+            text = str(value)
+        else:
+            # A line break would end the table row
+            text = ' '.join(str(value).splitlines()).strip()
+        return text.replace('|', '\\|')
+
+    @staticmethod
+    def md_width(text: str) -> int:
+        """
+        Returns the width of a Markdown cell on screen, same as in tabulate.
+
+        Wide characters, e.g. CJK characters and emoji, take two columns and combining
+        characters none, if wcwidth is installed.
+
+        Args:
+            text (str): The cell text.
+
+        Returns:
+            int: The width of the text.
+        """
+        if wcwidth is None or (text.isascii() and text.isprintable()):
+            return len(text)
+        return wcwidth.wcswidth(text)
+
+    @staticmethod
+    def md_plain(cells: list[str]) -> bool:
+        """
+        Checks whether the width of every Markdown cell is its length, which is faster to measure.
+
+        Args:
+            cells (list[str]): The cell texts.
+
+        Returns:
+            bool: True if wcwidth is not installed or all cells are printable ASCII.
+        """
+        text = ''.join(cells)
+        return wcwidth is None or (text.isascii() and text.isprintable())
+
+    def md_pad(self, text: str, width: int, right: bool) -> str:
+        """
+        Pads a Markdown cell with spaces to the width on screen.
+
+        Args:
+            text (str): The cell text.
+            width (int): The width of the column.
+            right (bool): Align the text to the right.
+
+        Returns:
+            str: The padded cell text.
+        """
+        padding = ' ' * (width - self.md_width(text))
+        return padding + text if right else text + padding
+
+    @staticmethod
+    def md_decimals(text: str) -> int:
+        """
+        Returns the number of characters after the decimal point of a float cell, used for aligning the points.
+
+        Args:
+            text (str): The cell text of a float column, formatted by md_cell().
+
+        Returns:
+            int: The number of characters after the point or the exponent, -1 for integers, nan and inf.
+        """
+        position = text.rfind('.')
+        if position < 0:
+            position = text.lower().rfind('e')
+        return len(text) - position - 1 if position >= 0 else -1
+
+    def md_layout(self, df_load_data: pd.DataFrame) -> tuple[list[dict], object]:
+        """
+        Chooses the type and width of every Markdown column.
+
+        Without fixed_width, the type is taken from the values and the width from the
+        longest cell, which takes a pass over the data.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+
+        Returns:
+            tuple[list[dict], object]: The type, width and decimals of every column, decimals is None
+                if the points are not aligned, and the type of the values matrix, None with fixed_width.
+        """
+        headers = [str(column) for column in df_load_data.columns]
+        if self.fixed_width is not None or not len(df_load_data):
+            layout = []
+            for header, dtype in zip(headers, df_load_data.dtypes):
+                if not len(df_load_data) or pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+                    md_type = 'text'
+                else:
+                    # Integers are written in full, only floats in the general format
+                    md_type = 'int' if pd.api.types.is_integer_dtype(dtype) else 'float'
+                layout.append({'type': md_type, 'width': max(self.fixed_width or 0, self.md_width(header) + 2), 'decimals': None})
+            return layout, None
+
+        # The type of a numeric values matrix gives the type of all columns, the values of an object matrix are checked
+        values_dtype = self.values_dtype(df_load_data)
+        md_type = self.md_kinds.get(values_dtype.kind)
+        if md_type is not None:
+            types = [md_type] * len(headers)
+        else:
+            # The type of numpy columns is given by their dtype, the values of the other columns are checked
+            types = [self.md_object_kinds.get(self.numpy_kind(dtype)) for dtype in df_load_data.dtypes]
+            unknown = [position for position, md_type in enumerate(types) if md_type is None]
+            for position in unknown:
+                # A column without values is a bool column in tabulate
+                types[position] = 'bool'
+            if unknown:
+                for values in self.md_batches(df_load_data, values_dtype):
+                    for position in unknown:
+                        if types[position] != 'text':
+                            types[position] = max(types[position], *map(self.md_type, values[position]), key=self.md_types.get)
+
+        # Numbers are aligned on the decimal point, so their width includes the padding after the point
+        layout = [{'type': md_type, 'width': self.md_width(header) + 2, 'decimals': -1 if md_type == 'float' else None, 'integer': 0}
+                  for header, md_type in zip(headers, types)]
+        for values in self.md_batches(df_load_data, values_dtype):
+            for column, column_values in zip(layout, values):
+                cells = [self.md_cell(value, column['type']) for value in column_values]
+                if column['type'] == 'float':
+                    for cell in cells:
+                        decimals = self.md_decimals(cell)
+                        column['decimals'] = max(column['decimals'], decimals)
+                        column['integer'] = max(column['integer'], len(cell) - decimals)
+                else:
+                    column['width'] = max(column['width'], *map(len if self.md_plain(cells) else self.md_width, cells))
+        for column in layout:
+            if column['type'] == 'float':
+                column['width'] = max(column['width'], column['integer'] + column['decimals'])
+        return layout, values_dtype
+
+    def _write_md(self, df_load_data: pd.DataFrame) -> None:
+        """
+        Writes the DataFrame as a Markdown pipe table, same as DataFrame.to_markdown(index=False).
+
+        Args:
+            df_load_data (pd.DataFrame): The data to be written.
+        """
+        layout, values_dtype = self.md_layout(df_load_data)
+        self.output_stream.write(self.md_header(df_load_data, layout))
+        for rows in self.md_rows(df_load_data, layout, values_dtype):
+            self.output_stream.write(''.join(f"\n{row}" for row in rows))
+
+    def render_md_chunk(self, df_chunk: pd.DataFrame, header: bool = True) -> None:
+        """
+        Writes a chunk of a Markdown table, every line ends with a line break.
+
+        The chunks of one table are written with fixed_width, so all of them get the same
+        column widths without measuring the whole data first.
+
+        Args:
+            df_chunk (pd.DataFrame): The chunk of data to be written.
+            header (bool): Write the header and the separator line before the rows.
+        """
+        layout, values_dtype = self.md_layout(df_chunk)
+        if header:
+            self.output_stream.write(f"{self.md_header(df_chunk, layout)}\n")
+        for rows in self.md_rows(df_chunk, layout, values_dtype):
+            self.output_stream.write(''.join(f"{row}\n" for row in rows))
+
+    def md_header(self, df_load_data: pd.DataFrame, layout: list[dict]) -> str:
+        """
+        Formats the header and the separator line of a Markdown table.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+            layout (list[dict]): The layout of the columns from md_layout().
+
+        Returns:
+            str: The two lines without the line break after the separator.
+        """
+        header = []
+        separator = []
+        for column_name, column in zip(df_load_data.columns, layout):
+            right = column['type'] in ('int', 'float')
+            name = str(column_name).replace('|', '\\|')
+            header.append(self.md_pad(name, column['width'], right))
+            if not len(df_load_data):
+                # A table without rows has no alignment
+                separator.append('-' * (column['width'] + 2))
+            else:
+                separator.append('-' * (column['width'] + 1) + ':' if right else ':' + '-' * (column['width'] + 1))
+        return f"| {' | '.join(header)} |\n|{'|'.join(separator)}|"
+
+    def md_rows(self, df_load_data: pd.DataFrame, layout: list[dict], values_dtype):
+        """
+        Formats the rows of a Markdown table batch by batch.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+            layout (list[dict]): The layout of the columns from md_layout().
+            values_dtype: The type of the values matrix from md_layout().
+
+        Yields:
+            list[str]: The lines of the rows of the next batch, without line breaks.
+        """
+        numeric = [column['type'] in ('int', 'float') for column in layout]
+        for values in self.md_batches(df_load_data, values_dtype):
+            columns = []
+            for column, column_values, right in zip(layout, values, numeric):
+                cells = [self.md_cell(value, column['type']) for value in column_values]
+                if right and column['decimals'] is not None:
+                    cells = [(cell + ' ' * (column['decimals'] - self.md_decimals(cell))).rjust(column['width']) for cell in cells]
+                elif not self.md_plain(cells):
+                    cells = [self.md_pad(cell, column['width'], right) for cell in cells]
+                elif right:
+                    cells = [cell.rjust(column['width']) for cell in cells]
+                else:
+                    cells = [cell.ljust(column['width']) for cell in cells]
+                columns.append(cells)
+            yield [f"| {' | '.join(row)} |" for row in zip(*columns)]
+
+    def html_layout(self, df_load_data: pd.DataFrame) -> list[dict | None]:
+        """
+        Chooses the format of every HTML float, datetime and timedelta column.
+
+        pandas writes all floats of a column with the same number of decimals, or all in
+        scientific notation if some are too small or too large. Datetimes are written
+        without the time if all of them are at midnight, otherwise with the fraction
+        digits the most precise one needs, and timedeltas as days if all of them are
+        whole days. This takes a pass over these columns. With fixed_width, every float
+        gets its own decimals and datetimes and timedeltas are written in full.
+
+        Args:
+            df_load_data (pd.DataFrame): The data.
+
+        Returns:
+            list[dict or None]: The kind and format of every float, datetime and timedelta column, None for the other columns.
+        """
+        kinds = [self.numpy_kind(dtype) for dtype in df_load_data.dtypes]
+        layout = [None] * df_load_data.shape[1]
+        for position, kind in enumerate(kinds):
+            if kind == 'f':
+                layout[position] = {'kind': kind, 'decimals': None, 'scientific': False}
+            elif kind == 'M':
+                layout[position] = {'kind': kind, 'dates_only': self.fixed_width is None, 'digits': None if self.fixed_width is not None else 0}
+            elif kind == 'm':
+                layout[position] = {'kind': kind, 'days_only': self.fixed_width is None}
+        if self.fixed_width is not None:
+            return layout
+
+        for position, kind in enumerate(kinds):
+            if kind not in ('M', 'm'):
+                continue
+            column = layout[position]
+            for start in range(0, len(df_load_data), self.batch_rows):
+                series = df_load_data.iloc[start:start + self.batch_rows, position].dropna()
+                if kind == 'M':
+                    column['dates_only'] = column['dates_only'] and bool((series.dt.normalize() == series).all())
+                    nanoseconds = series.dt.microsecond * 1000 + series.dt.nanosecond
+                    digits = 9 if (nanoseconds % 1000).any() else 6 if (nanoseconds % 1_000_000).any() else 3 if nanoseconds.any() else 0
+                    column['digits'] = max(column['digits'], digits)
+                else:
+                    column['days_only'] = column['days_only'] and bool((series % pd.Timedelta(days=1) == pd.Timedelta(0)).all())
+
+        positions = [position for position, kind in enumerate(kinds) if kind == 'f']
+        if not positions:
+            return layout
+
+        # The length of the longest float is measured after its trailing zeros are removed
+        stats = {position: {'decimals': -1, 'integer': 0, 'length': 0, 'large': False, 'small': False} for position in positions}
+        for values in self.batches(df_load_data, positions):
+            for position, column_values in zip(positions, values):
+                column = stats[position]
+                for value in column_values:
+                    if value != value:
+                        column['length'] = max(column['length'], 3)
+                        continue
+                    text = f"{value:.{self.precision}f}"
+                    if '.' in text:
+                        column['decimals'] = max(column['decimals'], len(text.rstrip('0')) - text.index('.') - 1)
+                        column['integer'] = max(column['integer'], text.index('.') + 1)
+                    else:
+                        column['length'] = max(column['length'], len(text))
+                    size = abs(value)
+                    column['large'] = column['large'] or size > 1e6
+                    column['small'] = column['small'] or 0 < size < 10 ** -self.precision
+
+        for position, column in stats.items():
+            # At least one decimal is kept, e.g. 2.0
+            layout[position]['decimals'] = max(column['decimals'], 1)
+            length = max(column['length'], column['integer'] + layout[position]['decimals'] if column['integer'] else 0)
+            layout[position]['scientific'] = column['small'] or (length > self.precision + 6 and column['large'])
+        return layout
+
+    def html_cell(self, value, column: dict | None) -> str:
+        """
+        Formats a value as an HTML table cell, same as DataFrame.to_html().
+
+        Args:
+            value: The value.
+            column (dict or None): The format of the float, datetime or timedelta column, None for the other columns.
+
+        Returns:
+            str: The escaped cell text.
+        """
+        if column is not None and column['kind'] in ('M', 'm'):
+            if value is pd.NaT:
+                return 'NaT'
+            if column['kind'] == 'm':
+                return f"{value.days} days" if column['days_only'] else str(value)
+            if column['dates_only']:
+                return value.date().isoformat()
+            return str(value) if column['digits'] is None else value.isoformat(sep=' ', timespec=self.timespecs[column['digits']])
+        if column is not None:
+            if value != value:
+                return 'NaN'
+            if column['scientific']:
+                return f"{value:.{self.precision}e}"
+            text = f"{value:.{self.precision}f}"
+            if column['decimals'] is None or '.' not in text:
+                return self.trim_float(text)
+            return text[:len(text) - self.precision + column['decimals']]
+
+        # Strings and numbers are checked first, they are the most common values
+        if isinstance(value, str):
+            text = value.replace('\t', '\\t').replace('\r', '\\r').replace('\n', '\\n')
+        elif isinstance(value, Integral):
+            text = str(value)
+        elif isinstance(value, float):
+            text = 'NaN' if value != value else self.trim_float(f"{value:.{self.precision}f}")
+        elif value is None:
+            text = 'None'
+        elif value is pd.NA:
+            text = '<NA>'
+        elif value is pd.NaT:
+            text = 'NaT'
+        else:
+            text = str(value).replace('\t', '\\t').replace('\r', '\\r').replace('\n', '\\n')
+        # pandas removes the whitespace around the cell text
+        return escape(text.strip(), quote=False)
+
+    def _write_html(self, df_load_data: pd.DataFrame) -> None:
+        """
+        Writes the DataFrame as an HTML table, same as DataFrame.to_html(index=False).
+
+        Args:
+            df_load_data (pd.DataFrame): The data to be written.
+        """
+        layout = self.html_layout(df_load_data)
+
+        header = ''.join(f"      <th>{escape(str(column).strip(), quote=False)}</th>\n" for column in df_load_data.columns)
+        self.output_stream.write('<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n'
+                                 f"{header}    </tr>\n  </thead>\n  <tbody>\n")
+
+        for values in self.batches(df_load_data):
+            columns = [[self.html_cell(value, column) for value in column_values] for column, column_values in zip(layout, values)]
+            self.output_stream.write(''.join(
+                "    <tr>\n" + ''.join(f"      <td>{cell}</td>\n" for cell in row) + "    </tr>\n" for row in zip(*columns)
+            ))
+
+        self.output_stream.write("  </tbody>\n</table>")
+
+    def tex_cell(self, value) -> str:
+        """
+        Formats a value as a LaTeX table cell, same as DataFrame.to_latex().
+
+        Args:
+            value: The value.
+
+        Returns:
+            str: The cell text.
+        """
+        # Strings and floats are checked first, they are the most common values
+        if isinstance(value, str):
+            return value
+        if isinstance(value, float):
+            return 'NaN' if value != value else f"{value:.{self.precision}f}"
+        if self.is_missing(value):
+            return 'NaN'
+        return str(value)
+
+    def _write_tex(self, df_load_data: pd.DataFrame) -> None:
+        """
+        Writes the DataFrame as a LaTeX tabular environment, same as DataFrame.to_latex(index=False).
+
+        The cells are written as they are, without escaping, the same as pandas does by default.
+
+        Args:
+            df_load_data (pd.DataFrame): The data to be written.
+        """
+        # Numeric columns are aligned to the right
+        column_format = ''.join('r' if pd.api.types.is_numeric_dtype(dtype) else 'l' for dtype in df_load_data.dtypes)
+        header = ' & '.join(str(column) for column in df_load_data.columns)
+        self.output_stream.write(f"\\begin{{tabular}}{{{column_format}}}\n\\toprule\n{header} \\\\\n\\midrule\n")
+
+        for values in self.batches(df_load_data):
+            columns = [[self.tex_cell(value) for value in column_values] for column_values in values]
+            self.output_stream.write(''.join(f"{' & '.join(row)} \\\\\n" for row in zip(*columns)))
+
+        self.output_stream.write("\\bottomrule\n\\end{tabular}\n")
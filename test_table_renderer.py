@@ -0,0 +1,107 @@
+# Import the StringIO class for rendering the tables in memory
+from io import StringIO
+
+# Import pytest for parametrizing the comparisons and skipping them without the pandas writers
+import pytest
+
+# Import numpy and pandas for building the edge case DataFrames
+import numpy as np
+import pandas as pd
+
+# Import the TableRenderer class under test
+from table_renderer import TableRenderer
+
+
+def edge_frames() -> dict[str, pd.DataFrame]:
+    """
+    Builds the DataFrames whose tables differ most easily from the tables of pandas.
+
+    Returns:
+        dict[str, pd.DataFrame]: The DataFrames by name.
+    """
+    return {
+        'mixed': pd.DataFrame({
+            'i': [1, -20, 3],
+            'f': [1.25, np.nan, 1234567.5],
+            's': ['a b', None, '<x&y>'],
+            'o': pd.Series(['x', None, np.nan], dtype=object),
+            'b': [True, False, True],
+            't': [1e-8, 2.0, 3.0],
+            'n': pd.array([1, None, 3], dtype='Int64'),
+            'c': pd.Categorical(['a', 'b', None]),
+            'sn': ['12', '3', '4'],
+            'big': [1e20, 2.5, np.inf],
+            'u': np.array([1, 2, 3], dtype='uint8'),
+            'f32': np.array([5.1, 2, 3], dtype='float32'),
+            'mix': pd.Series([1.5, 'x', 2], dtype=object),
+            'nanstr': ['nan', 'inf', '1e5'],
+        }),
+        'empty': pd.DataFrame({'a': pd.Series([], dtype=int), 'b': pd.Series([], dtype=object)}),
+        'numbers': pd.DataFrame({'i': [1, 2, 3], 'f': [0.5, 2.0, 3.125]}),
+        'bools': pd.DataFrame({'b': [True, False]}),
+        'dates': pd.DataFrame({'d': pd.to_datetime(['2020-01-01', '2020-01-02', None])}),
+        'date_times': pd.DataFrame({'d': pd.to_datetime(['2020-01-01 10:00', '2020-01-02 00:00', None])}),
+        'date_fractions': pd.DataFrame({'d': pd.to_datetime(['2020-01-01 10:00:00.500', '2020-01-02 00:00:00.000', None])}),
+        'dates_with_text': pd.DataFrame({'d': pd.to_datetime(['2020-01-01', None]), 's': ['a', 'b']}),
+        'dates_utc': pd.DataFrame({'d': pd.to_datetime(['2020-01-01', '2020-01-02']).tz_localize('UTC')}),
+        'timedeltas': pd.DataFrame({'t': pd.to_timedelta(['1 days', '2 hours', None])}),
+        'whole_days': pd.DataFrame({'t': pd.to_timedelta(['1 days', '-2 days', None])}),
+        'whitespace': pd.DataFrame({' s ': ['  a  ', ' b', 'c\n', None], 'o': pd.Series([' x ', 'y', None, 'z'], dtype=object)}),
+        'nullable_int': pd.DataFrame({'n': pd.array([1, None, 30], dtype='Int64')}),
+        'nullable_bool': pd.DataFrame({'b': pd.array([True, None, False], dtype='boolean')}),
+        'arrow_double': pd.DataFrame({'p': pd.array([1.5, None, 3.25], dtype='double[pyarrow]')}),
+        'wide': pd.DataFrame({'w': ['日本語', 'ab', '😀x', 'é'], 'x': [1, 2, 3, 4]}),
+        'wide_header': pd.DataFrame({'名前': ['a', 'b']}),
+    }
+
+
+# The writers of pandas the tables are compared with
+PANDAS_WRITERS = {
+    'md': lambda df: df.to_markdown(index=False),
+    'html': lambda df: df.to_html(index=False),
+    'tex': lambda df: df.to_latex(index=False),
+}
+
+
+def render(df: pd.DataFrame, output_format: str) -> str:
+    """
+    Renders the DataFrame with TableRenderer into a string.
+
+    Args:
+        df (pd.DataFrame): The data.
+        output_format (str): md, html or tex.
+
+    Returns:
+        str: The table.
+    """
+    output_stream = StringIO()
+    TableRenderer(output_stream, output_format).render(df)
+    return output_stream.getvalue()
+
+
+@pytest.mark.parametrize('output_format', sorted(PANDAS_WRITERS))
+@pytest.mark.parametrize('name', sorted(edge_frames()))
+def test_table_matches_pandas(name, output_format):
+    pytest.importorskip('tabulate' if output_format == 'md' else 'jinja2')
+    if name == 'arrow_double':
+        pytest.importorskip('pyarrow')
+    df = edge_frames()[name]
+    assert render(df, output_format) == PANDAS_WRITERS[output_format](df)
+
+
+@pytest.mark.parametrize('output_format', sorted(PANDAS_WRITERS))
+def test_batches_match_pandas(monkeypatch, output_format):
+    pytest.importorskip('tabulate' if output_format == 'md' else 'jinja2')
+    # The nullable column only has a missing value in the last batch
+    df = pd.DataFrame({'n': pd.array([1, 2, 3, 4, None], dtype='Int64')})
+    monkeypatch.setattr(TableRenderer, 'batch_rows', 2)
+    assert render(df, output_format) == PANDAS_WRITERS[output_format](df)
+
+
+def test_fixed_width_writes_integers_in_full():
+    df = pd.DataFrame({'i': [333333333333, 1234567], 'f': [0.5, 1234567.0]})
+    output_stream = StringIO()
+    TableRenderer(output_stream, 'md', fixed_width=4).render(df)
+    rows = output_stream.getvalue().splitlines()
+    assert rows[2] == '| 333333333333 |  0.5 |'
+    assert rows[3] == '| 1234567 | 1.23457e+06 |'
@@ -1,14 +1,16 @@
 # Import the ValidateCsv class from the file mime_type_csv.py
 from mime_type_csv import ValidateCsv
 
-# Import the mimetypes module for handling MIME types
-import mimetypes
+# Import the FileTypeDetector class for detecting the file format from its content
+from mime_type_detector import FileTypeDetector
 
 
 def is_valid_mime_type(suffix: str, input_file: str) -> bool:
     """
     Checks whether the given file with a specific extension or MIME type is valid.
 
+    The MIME type is determined from the content of the file, not from its name.
+
     Args:
         suffix (str): The file extension or MIME type.
         input_file (str): The path to the input file.
@@ -17,13 +19,16 @@ def is_valid_mime_type(suffix: str, input_file: str) -> bool:
         bool: True if the file is valid, False otherwise.
 
     Raises:
-        Exception: If the file suffix is invalid.
+        ValueError: If the file suffix is invalid, a line of a CSV file has a wrong number of columns
+            or a quote of a CSV file is not closed.
     """
     # Dictionary defining allowed MIME types for each file suffix
     allowed_mime_type = {
         ".json": [
                 "text/json",  # Deprecated
                 "application/json"],  # Preferred for mimetypes
+        ".jsonl": ["application/x-ndjson"],  # Newline-delimited JSON
+        ".ndjson": ["application/x-ndjson"],  # Newline-delimited JSON
         ".xml": ["application/xml", 
                 "text/xml"],  # Preferred for mimetypes
         ".xlsx": ["application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"],  # Preferred for mimetypes
@@ -33,31 +38,33 @@ def is_valid_mime_type(suffix: str, input_file: str) -> bool:
     if suffix == '.csv':
         # Create a ValidateCsv object and initialize it with the input file path
         csv_match = ValidateCsv(input_file)
-        
-        # Call the validate_csv() method to check the CSV file format
-        validate = csv_match.validate_csv()
-        
-        # Call the check_csv_line() method to verify the number of columns in each row
-        line_check = csv_match.check_csv_line()
-        
-        # Check if both validations (format and column count) are successful
-        if validate and line_check:
+
+        # Call the validate_csv() method to check the CSV signature and the number of columns in each row
+        if csv_match.validate_csv():
             return True  # If both conditions are met, return True
-        else:
-            return False  # If at least one of the conditions is not met, return False
+
+        # Report a quoted field that takes the rest of the file
+        if csv_match.unclosed_quote_line is not None:
+            raise ValueError(f"Invalid CSV file: the quote opened on line {csv_match.unclosed_quote_line} is not closed.")
+
+        # Report the first line whose number of columns differs from the first line
+        if csv_match.invalid_line is not None:
+            raise ValueError(
+                f"Invalid CSV file: line {csv_match.invalid_line} has {csv_match.invalid_column_count} "
+                f"columns, expected {csv_match.expected_column_count}."
+            )
+        return False  # If at least one of the conditions is not met, return False
 
     elif suffix in allowed_mime_type:
-        # Guessing the MIME type of the input file
-        mime_type = mimetypes.guess_type(input_file)[0]
-        
-        # Extracting key-value pairs from the allowed_mime_type dictionary where the suffix matches
-        key_value = [key_value for key_value in allowed_mime_type.items() if suffix in key_value]
-        
-        # Extracting values (MIME types) associated with the key (suffix)
-        value = [value for value in key_value[0][1] if value == mime_type]
-        
-        # Checking if the guessed MIME type matches any of the allowed MIME types
-        if value[0] == mime_type:
+        # Reading the beginning of the file and finding the matcher registered for the suffix
+        detector = FileTypeDetector(input_file)
+        matcher = detector.matcher_for(suffix)
+
+        # The extension already says JSON Lines, so a single record or a long first record is accepted
+        match_options = {'labeled': True} if matcher is not None and matcher.extension() == 'jsonl' else {}
+
+        # Checking if the file content matches the suffix and its MIME type is allowed
+        if matcher is not None and matcher.match(detector.read_head(), **match_options) and matcher.mime() in allowed_mime_type[suffix]:
             return True  # If the MIME type is valid, return True
         else:
             return False  # If the MIME type is not valid, return False
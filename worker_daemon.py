@@ -0,0 +1,739 @@
+# Import classes for loading, converting and exporting data
+from convert_data_manager import DataManager, Converter, ExportData
+
+# Import the BufferManager class to hold the converted data, one per worker thread
+from io_buffer import BufferManager
+
+# Import the codec_from_suffix function for compressing the output by its extension
+from compressed_io import codec_from_suffix
+
+# Import the warm_up function for importing the libraries before the first job
+from lazy_import import warm_up
+
+# Import the ThreadPoolExecutor class for running the jobs in warm worker threads
+from concurrent.futures import ThreadPoolExecutor
+
+# Import modules for parsing command line arguments, the job queues, threads and logging
+import argparse
+import glob
+import json
+import logging
+import os
+import queue
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+
+
+class SpoolQueue:
+    """
+    The SpoolQueue class reads jobs from JSON files in a spool directory.
+
+    A job is claimed by moving its file from incoming/ to processing/, which is atomic,
+    so several workers can share one spool directory. Finished jobs are moved to done/
+    or failed/ together with their result.
+
+    Args:
+        spool_dir (str): The spool directory.
+        poll_interval (float): Seconds between two looks into an empty incoming/ directory.
+    """
+
+    def __init__(self, spool_dir: str, poll_interval: float = 0.5) -> None:
+        """
+        Initializes the SpoolQueue class with the spool directory, creating its subdirectories.
+
+        Args:
+            spool_dir (str): The spool directory.
+            poll_interval (float): Seconds between two looks into an empty incoming/ directory.
+        """
+        self.spool_dir = spool_dir
+        self.poll_interval = poll_interval
+        for name in ('incoming', 'processing', 'done', 'failed'):
+            os.makedirs(os.path.join(spool_dir, name), exist_ok=True)
+
+    def submit(self, job: dict) -> str:
+        """
+        Adds a job to the spool directory.
+
+        Args:
+            job (dict): The job with the keys input_file, output_format and output_file.
+
+        Returns:
+            str: The id of the job.
+        """
+        job_id = job.get('id') or f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        path = os.path.join(self.spool_dir, 'incoming', f"{job_id}.json")
+        # Written under a hidden name first, so the worker never reads a partial job
+        temp_path = os.path.join(self.spool_dir, 'incoming', f".{job_id}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({**job, 'id': job_id}, f)
+        os.replace(temp_path, path)
+        return job_id
+
+    def recover(self) -> int:
+        """
+        Moves the jobs left in processing/ by a stopped worker back to incoming/.
+
+        Returns:
+            int: Number of recovered jobs.
+        """
+        paths = glob.glob(os.path.join(self.spool_dir, 'processing', '*.json'))
+        for path in paths:
+            os.replace(path, os.path.join(self.spool_dir, 'incoming', os.path.basename(path)))
+        return len(paths)
+
+    def get(self, timeout: float) -> dict | None:
+        """
+        Claims the oldest job.
+
+        Args:
+            timeout (float): Seconds to wait for a job.
+
+        Returns:
+            dict or None: The job, None if no job arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for path in sorted(glob.glob(os.path.join(self.spool_dir, 'incoming', '*.json'))):
+                processing_path = os.path.join(self.spool_dir, 'processing', os.path.basename(path))
+                try:
+                    os.rename(path, processing_path)
+                except FileNotFoundError:
+                    # Claimed by another worker
+                    continue
+                with open(processing_path, encoding='utf-8') as f:
+                    try:
+                        job = json.load(f)
+                    except ValueError as e:
+                        job = {'error': f"Invalid job file: {e}"}
+                job['_spool_name'] = os.path.basename(path)
+                return job
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def complete(self, job: dict, result: dict) -> None:
+        """
+        Moves the job to done/ or failed/ together with its result.
+
+        Args:
+            job (dict): The job returned by get().
+            result (dict): The result of the job.
+        """
+        name = job.pop('_spool_name')
+        directory = 'done' if result['status'] == 'ok' else 'failed'
+        with open(os.path.join(self.spool_dir, directory, name), 'w', encoding='utf-8') as f:
+            json.dump({**job, 'result': result}, f, indent=2)
+        os.remove(os.path.join(self.spool_dir, 'processing', name))
+
+    def close(self) -> None:
+        """
+        Does nothing, the spool directory stays for the next worker.
+        """
+
+
+class SqliteQueue:
+    """
+    The SqliteQueue class reads jobs from a table of a SQLite database.
+
+    A job is claimed by changing its status from queued to running in an immediate
+    transaction, so several workers can share one database. The result is stored in
+    the same row.
+
+    Args:
+        database (str): Path to the SQLite database, created if it does not exist.
+        poll_interval (float): Seconds between two queries of an empty queue.
+    """
+
+    # Table of the jobs
+    schema = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            input_file TEXT NOT NULL,
+            output_format TEXT NOT NULL,
+            output_file TEXT NOT NULL,
+            options TEXT NOT NULL DEFAULT '{}',
+            status TEXT NOT NULL DEFAULT 'queued',
+            rows INTEGER,
+            error TEXT,
+            created REAL,
+            started REAL,
+            finished REAL
+        )
+    """
+
+    def __init__(self, database: str, poll_interval: float = 0.5) -> None:
+        """
+        Initializes the SqliteQueue class with the database, creating the jobs table.
+
+        Args:
+            database (str): Path to the SQLite database.
+            poll_interval (float): Seconds between two queries of an empty queue.
+        """
+        self.poll_interval = poll_interval
+        # The connection is shared by the worker threads, the lock serializes its use
+        self.connection = sqlite3.connect(database, timeout=30, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock:
+            self.connection.execute(self.schema)
+
+    def submit(self, job: dict) -> int:
+        """
+        Adds a job to the jobs table.
+
+        Args:
+            job (dict): The job with the keys input_file, output_format and output_file, the
+                other keys are stored as its options.
+
+        Returns:
+            int: The id of the job.
+        """
+        options = {key: value for key, value in job.items() if key not in ('input_file', 'output_format', 'output_file')}
+        with self.lock:
+            cursor = self.connection.execute(
+                "INSERT INTO jobs (input_file, output_format, output_file, options, created) VALUES (?, ?, ?, ?, ?)",
+                (job['input_file'], job['output_format'], job['output_file'], json.dumps(options), time.time()),
+            )
+        return cursor.lastrowid
+
+    def recover(self) -> int:
+        """
+        Queues the jobs left running by a stopped worker again.
+
+        Returns:
+            int: Number of recovered jobs.
+        """
+        with self.lock:
+            cursor = self.connection.execute("UPDATE jobs SET status = 'queued', started = NULL WHERE status = 'running'")
+        return cursor.rowcount
+
+    def claim(self) -> dict | None:
+        """
+        Claims the oldest queued job.
+
+        Returns:
+            dict or None: The job, None if no job is queued.
+        """
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.connection.execute(
+                    "SELECT id, input_file, output_format, output_file, options FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self.connection.execute("UPDATE jobs SET status = 'running', started = ? WHERE id = ?", (time.time(), row[0]))
+                self.connection.execute("COMMIT")
+            except sqlite3.Error:
+                self.connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job_id, input_file, output_format, output_file, options = row
+        return {**json.loads(options), 'id': job_id, 'input_file': input_file, 'output_format': output_format, 'output_file': output_file}
+
+    def get(self, timeout: float) -> dict | None:
+        """
+        Claims the oldest queued job, waiting for one if the queue is empty.
+
+        Args:
+            timeout (float): Seconds to wait for a job.
+
+        Returns:
+            dict or None: The job, None if no job arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.claim()
+            if job is not None or time.monotonic() >= deadline:
+                return job
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def complete(self, job: dict, result: dict) -> None:
+        """
+        Stores the result of the job in its row.
+
+        Args:
+            job (dict): The job returned by get().
+            result (dict): The result of the job.
+        """
+        status = 'done' if result['status'] == 'ok' else 'failed'
+        with self.lock:
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, rows = ?, error = ?, finished = ? WHERE id = ?",
+                (status, result['rows'], result['error'], time.time(), job['id']),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class SocketQueue:
+    """
+    The SocketQueue class receives jobs over a Unix domain socket.
+
+    Every line a client sends is one job in JSON, the result is sent back on the same
+    connection as one line of JSON. The received jobs wait in a bounded queue. When it
+    is full, the connection is not read until a job is taken, so the clients are slowed
+    down instead of the worker running out of memory.
+
+    Args:
+        socket_path (str): Path to the Unix domain socket.
+        max_pending (int): Number of received jobs waiting for a worker.
+    """
+
+    def __init__(self, socket_path: str, max_pending: int = 16) -> None:
+        """
+        Initializes the SocketQueue class, listening on the socket.
+
+        Args:
+            socket_path (str): Path to the Unix domain socket, replaced if it exists.
+            max_pending (int): Number of received jobs waiting for a worker.
+        """
+        self.socket_path = socket_path
+        self.jobs = queue.Queue(maxsize=max_pending)
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(socket_path)
+        self.server.listen()
+        threading.Thread(target=self._accept, name='converter-socket-accept', daemon=True).start()
+
+    def _accept(self) -> None:
+        """
+        Accepts connections and reads the jobs of each one in its own thread.
+        """
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                # The server socket was closed
+                return
+            threading.Thread(target=self._read_jobs, args=(connection,), daemon=True).start()
+
+    def _read_jobs(self, connection: socket.socket) -> None:
+        """
+        Reads the jobs of one connection, one JSON object per line.
+
+        Args:
+            connection (socket.socket): The client connection.
+        """
+        # Number of jobs of the connection whose result was not sent yet
+        state = {'connection': connection, 'condition': threading.Condition(), 'pending': 0}
+        with connection, connection.makefile('r', encoding='utf-8') as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    job = json.loads(line)
+                except ValueError as e:
+                    job = {'error': f"Invalid job: {e}"}
+                job['_connection'] = state
+                with state['condition']:
+                    state['pending'] += 1
+                # Blocks while the queue is full, which stops reading from the client
+                self.jobs.put(job)
+            # Keeps the connection open until the results of all its jobs are sent
+            with state['condition']:
+                state['condition'].wait_for(lambda: state['pending'] == 0)
+
+    def get(self, timeout: float) -> dict | None:
+        """
+        Takes the next received job.
+
+        Args:
+            timeout (float): Seconds to wait for a job.
+
+        Returns:
+            dict or None: The job, None if no job arrived in time.
+        """
+        try:
+            return self.jobs.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def complete(self, job: dict, result: dict) -> None:
+        """
+        Sends the result to the client that sent the job.
+
+        Args:
+            job (dict): The job returned by get().
+            result (dict): The result of the job.
+        """
+        state = job.pop('_connection')
+        with state['condition']:
+            try:
+                state['connection'].sendall((json.dumps(result) + '\n').encode('utf-8'))
+            except OSError:
+                # The client has disconnected, the result is only logged
+                pass
+            state['pending'] -= 1
+            state['condition'].notify_all()
+
+    def close(self) -> None:
+        """
+        Stops listening and removes the socket file.
+        """
+        self.server.close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def send_job(socket_path: str, job: dict, timeout: float | None = None) -> dict:
+    """
+    Sends a job to a worker listening on a Unix domain socket and waits for its result.
+
+    Args:
+        socket_path (str): Path to the Unix domain socket.
+        job (dict): The job with the keys input_file, output_format and output_file.
+        timeout (float, optional): Seconds to wait for the result, no timeout if None.
+
+    Returns:
+        dict: The result of the job.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall((json.dumps(job) + '\n').encode('utf-8'))
+        with client.makefile('r', encoding='utf-8') as lines:
+            return json.loads(lines.readline())
+
+
+class ConversionWorker:
+    """
+    The ConversionWorker class runs conversion jobs from a job queue in a long-running process.
+
+    The libraries are imported once and every worker thread keeps its BufferManager,
+    which is reset and reused for the next job. A job is claimed from the queue only
+    when fewer than max_pending jobs are in progress, so the jobs the worker cannot
+    handle yet stay in the queue for other workers.
+
+    A job is a dict with the keys input_file, output_format and output_file and the
+    optional keys columns, compact, fixed_width and chunksize. Output files ending with .gz,
+    .bz2 or .zst are compressed. With chunksize, the input is streamed to the output file
+    with ExportData.export_chunks().
+
+    Args:
+        job_queue: SpoolQueue, SqliteQueue or SocketQueue.
+        concurrency (int): Number of worker threads.
+        max_pending (int, optional): Maximum number of claimed jobs, concurrency if None.
+        poll_interval (float): Seconds to wait for a job before checking whether to stop.
+    """
+
+    def __init__(self, job_queue, concurrency: int = 2, max_pending: int | None = None, poll_interval: float = 0.5) -> None:
+        """
+        Initializes the ConversionWorker class with the job queue and the concurrency limits.
+
+        Args:
+            job_queue: SpoolQueue, SqliteQueue or SocketQueue.
+            concurrency (int): Number of worker threads.
+            max_pending (int, optional): Maximum number of claimed jobs, concurrency if None.
+            poll_interval (float): Seconds to wait for a job before checking whether to stop.
+        """
+        self.job_queue = job_queue
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='converter-worker')
+        self.slots = threading.BoundedSemaphore(max_pending or concurrency)
+        self.poll_interval = poll_interval
+        self.local = threading.local()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.stats = {'done': 0, 'failed': 0}
+        self.logger = logging.getLogger('converter.worker')
+
+    @staticmethod
+    def warm_up(formats: list[str] | None = None) -> None:
+        """
+        Imports pandas and the libraries of the given formats before the first job.
+
+        Args:
+            formats (list[str], optional): Input and output formats, e.g. ['xlsx', 'xml'].
+        """
+        warm_up(formats)
+
+    def buffer_manager(self) -> BufferManager:
+        """
+        Returns the BufferManager of the current worker thread, created on its first job.
+
+        Returns:
+            BufferManager: The buffer manager, emptied for the next job.
+        """
+        if not hasattr(self.local, 'buffer_manager'):
+            self.local.buffer_manager = BufferManager()
+        self.local.buffer_manager.reset()
+        return self.local.buffer_manager
+
+    def run_job(self, job: dict) -> dict:
+        """
+        Runs one job.
+
+        Every error is caught and returned in the result, so one failed job does not stop the worker.
+
+        Args:
+            job (dict): The job.
+
+        Returns:
+            dict: Result of the job with the keys id, status, rows, output_file, seconds and error.
+        """
+        start = time.perf_counter()
+        result = {'id': job.get('id'), 'status': 'failed', 'rows': 0, 'output_file': job.get('output_file'), 'seconds': 0.0, 'error': None}
+
+        try:
+            if job.get('error'):
+                raise ValueError(job['error'])
+            missing = [key for key in ('input_file', 'output_format', 'output_file') if not job.get(key)]
+            if missing:
+                raise ValueError(f"The job has no {', '.join(missing)}.")
+
+            if os.path.dirname(job['output_file']):
+                os.makedirs(os.path.dirname(job['output_file']), exist_ok=True)
+            if job.get('chunksize'):
+                result['rows'] = self.stream_job(job)
+            else:
+                result['rows'] = self.convert_job(job)
+            result['status'] = 'ok'
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    def convert_job(self, job: dict) -> int:
+        """
+        Loads the input file, converts it in the reused buffers and writes the output file.
+
+        The output file is written through a temporary file, so it is never seen half written.
+
+        Args:
+            job (dict): The job.
+
+        Returns:
+            int: Number of converted rows.
+
+        Raises:
+            ValueError: If the input file could not be loaded or converted.
+        """
+        df_load_data = DataManager(job['input_file'], columns=job.get('columns')).load_data()
+        if df_load_data is None:
+            raise ValueError(f"The input file could not be loaded: {job['input_file']}")
+
+        file_converter = Converter(df_load_data, job['output_format'], buffer_manager=self.buffer_manager(),
+                                   compact=job.get('compact', False), compression=codec_from_suffix(job['output_file']),
+                                   fixed_width=job.get('fixed_width'))
+        file_converter.convert_data()
+        data = file_converter.read_bytes()
+        if not data:
+            raise ValueError(f"The input file could not be converted to {job['output_format']}: {job['input_file']}")
+
+        temp_path = f"{job['output_file']}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as output_file:
+                output_file.write(data)
+            os.replace(temp_path, job['output_file'])
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return len(df_load_data)
+
+    @staticmethod
+    def stream_job(job: dict) -> int:
+        """
+        Streams the input file to the output file chunk by chunk.
+
+        The chunks are written to a temporary file, which replaces the output file only
+        when the whole input was read, same as in convert_job().
+
+        Args:
+            job (dict): The job with chunksize.
+
+        Returns:
+            int: Number of converted rows.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+            ValueError: If the input file could not be loaded or the output file was not written.
+        """
+        rows = 0
+        # export_chunks() only prints the errors it catches, the load error and the end of the chunks are kept here
+        load_errors = []
+        finished = False
+
+        def counted(chunks):
+            nonlocal rows, finished
+            try:
+                for df_chunk in chunks:
+                    rows += len(df_chunk)
+                    yield df_chunk
+            except Exception as e:
+                load_errors.append(e)
+                raise
+            finished = True
+
+        temp_path = f"{job['output_file']}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            file_data_manager = DataManager(job['input_file'], chunksize=job['chunksize'], columns=job.get('columns'))
+            ExportData(None, job['output_format'], temp_path, compact=job.get('compact', False),
+                       compression=codec_from_suffix(job['output_file']), fixed_width=job.get('fixed_width')).export_chunks(counted(file_data_manager.iter_chunks()))
+            if load_errors:
+                raise load_errors[0]
+            # An export error stops reading the chunks before the last one
+            if not finished or not os.path.exists(temp_path):
+                raise ValueError(f"The input file could not be converted to {job['output_format']}: {job['input_file']}")
+            os.replace(temp_path, job['output_file'])
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return rows
+
+    def _finish(self, job: dict, future) -> None:
+        """
+        Reports the result of a finished job to the queue and frees its slot.
+
+        Args:
+            job (dict): The job.
+            future: The future of run_job().
+        """
+        try:
+            result = future.result()
+            self.job_queue.complete(job, result)
+            with self.lock:
+                self.stats['done' if result['status'] == 'ok' else 'failed'] += 1
+            if result['status'] == 'ok':
+                self.logger.info("job=%s status=ok rows=%s seconds=%.4f", result['id'], result['rows'], result['seconds'])
+            else:
+                self.logger.warning("job=%s status=failed error=%s", result['id'], result['error'])
+        except Exception:
+            self.logger.exception("job=%s could not be completed", job.get('id'))
+        finally:
+            with self.lock:
+                self.pending -= 1
+            self.slots.release()
+
+    def serve(self, once: bool = False) -> dict:
+        """
+        Claims and runs jobs until stop() is called.
+
+        Args:
+            once (bool): Stop when the queue is empty and all claimed jobs are finished.
+
+        Returns:
+            dict: Number of done and failed jobs.
+        """
+        try:
+            while not self.stop_event.is_set():
+                # Waits for a free slot before claiming the next job
+                if not self.slots.acquire(timeout=self.poll_interval):
+                    continue
+                job = self.job_queue.get(self.poll_interval)
+                if job is None:
+                    self.slots.release()
+                    with self.lock:
+                        idle = self.pending == 0
+                    if once and idle:
+                        break
+                    continue
+                with self.lock:
+                    self.pending += 1
+                future = self.executor.submit(self.run_job, job)
+                future.add_done_callback(lambda future, job=job: self._finish(job, future))
+        finally:
+            # Finishes the claimed jobs before returning
+            self.executor.shutdown(wait=True)
+        return dict(self.stats)
+
+    def stop(self) -> None:
+        """
+        Stops claiming jobs, the claimed jobs are finished by serve().
+        """
+        self.stop_event.set()
+
+
+def open_queue(queue_type: str, location: str, max_pending: int, poll_interval: float):
+    """
+    Opens the job queue of the given type.
+
+    Args:
+        queue_type (str): 'spool', 'sqlite' or 'socket'.
+        location (str): The spool directory, the database or the socket path.
+        max_pending (int): Number of received jobs waiting for a worker, only used by the socket queue.
+        poll_interval (float): Seconds between two looks into an empty queue.
+
+    Returns:
+        SpoolQueue, SqliteQueue or SocketQueue: The job queue.
+    """
+    match queue_type:
+        case 'spool':
+            return SpoolQueue(location, poll_interval)
+        case 'sqlite':
+            return SqliteQueue(location, poll_interval)
+        case 'socket':
+            return SocketQueue(location, max_pending)
+        case _:
+            raise ValueError(f"Invalid queue type: {queue_type}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the worker, or submits one job, from the command line.
+
+    Args:
+        argv (list[str], optional): Command line arguments, sys.argv if None.
+
+    Returns:
+        int: Exit code, 0 if the worker stopped normally or the job was submitted, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(description="Run conversion jobs from a local queue in a long-running worker.")
+    parser.add_argument('queue_type', choices=('spool', 'sqlite', 'socket'), help="Type of the job queue.")
+    parser.add_argument('location', help="Spool directory, SQLite database or Unix socket path.")
+    parser.add_argument('-c', '--concurrency', type=int, default=2, help="Number of worker threads.")
+    parser.add_argument('--max-pending', type=int, help="Maximum number of claimed jobs, the concurrency by default.")
+    parser.add_argument('--poll-interval', type=float, default=0.5, help="Seconds between two looks into an empty queue.")
+    parser.add_argument('--warm-up', nargs='*', default=[], metavar='FORMAT', help="Import the libraries of these formats before the first job.")
+    parser.add_argument('--recover', action='store_true', help="Queue the jobs left running by a stopped worker again.")
+    parser.add_argument('--once', action='store_true', help="Stop when the queue is empty.")
+    parser.add_argument('--submit', nargs=3, metavar=('INPUT_FILE', 'OUTPUT_FORMAT', 'OUTPUT_FILE'), help="Add one job to the queue and exit.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+
+    if args.submit:
+        job = dict(zip(('input_file', 'output_format', 'output_file'), args.submit))
+        if args.queue_type == 'socket':
+            result = send_job(args.location, job)
+            print(json.dumps(result))
+            return 0 if result['status'] == 'ok' else 1
+        job_queue = open_queue(args.queue_type, args.location, 0, args.poll_interval)
+        print(f"Submitted job {job_queue.submit(job)}")
+        job_queue.close()
+        return 0
+
+    max_pending = args.max_pending or args.concurrency
+    job_queue = open_queue(args.queue_type, args.location, max_pending, args.poll_interval)
+    if args.recover and hasattr(job_queue, 'recover'):
+        print(f"Recovered {job_queue.recover()} jobs")
+
+    ConversionWorker.warm_up(args.warm_up)
+    worker = ConversionWorker(job_queue, args.concurrency, max_pending, args.poll_interval)
+
+    # Finishes the claimed jobs and exits on SIGTERM or Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+
+    try:
+        stats = worker.serve(once=args.once)
+    finally:
+        job_queue.close()
+    print(f"{stats['done']} jobs done, {stats['failed']} failed")
+    return 0
+
+
+# Execute code only when script is run directly, not imported as a module
+if __name__ == '__main__':
+    sys.exit(main())
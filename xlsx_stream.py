@@ -0,0 +1,221 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the contextmanager decorator for opening the workbooks
+from contextlib import contextmanager
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import openpyxl for streaming XLSX files, on first use
+openpyxl = lazy_import('openpyxl')
+
+
+@contextmanager
+def open_workbook(input_file, data_only: bool = False):
+    """
+    Opens an XLSX workbook in read-only mode and closes it afterwards.
+
+    A path is opened as a binary file object first, because openpyxl refuses paths
+    without an XLSX extension, while the content of the file decides the format here.
+
+    Args:
+        input_file: Path to the XLSX file or a binary file object.
+        data_only (bool): Read the cached values of formulas instead of the formulas.
+
+    Yields:
+        The read-only workbook.
+    """
+    if isinstance(input_file, (str, bytes)) or hasattr(input_file, '__fspath__'):
+        with open(input_file, 'rb') as file:
+            with open_workbook(file, data_only) as workbook:
+                yield workbook
+        return
+    workbook = openpyxl.load_workbook(input_file, read_only=True, data_only=data_only)
+    try:
+        yield workbook
+    finally:
+        workbook.close()
+
+
+def sheet_names(input_file) -> list[str]:
+    """
+    Returns the names of the sheets of an XLSX file.
+
+    Args:
+        input_file: Path to the XLSX file or a binary file object.
+
+    Returns:
+        list[str]: Names of the sheets in the workbook order.
+    """
+    with open_workbook(input_file) as workbook:
+        return workbook.sheetnames
+
+
+def iter_xlsx_chunks(input_file, chunksize: int, sheet_name: str | int = 0, columns: list[str] | None = None):
+    """
+    Reads one sheet of an XLSX file in chunks of chunksize rows.
+
+    The workbook is opened in read-only mode, which streams the rows from the file
+    instead of building the whole workbook in memory. The first row is the header.
+    Empty rows between data rows are kept as rows of missing values, empty rows
+    after the last data row are dropped, the same as in pd.read_excel().
+
+    Args:
+        input_file: Path to the XLSX file or a binary file object.
+        chunksize (int): Number of rows per chunk.
+        sheet_name (str | int): Name or index of the sheet, the first sheet by default.
+        columns (list[str], optional): Columns to read, the other cells are dropped as each row is read.
+
+    Yields:
+        pd.DataFrame: The next chunk of rows.
+
+    Raises:
+        ValueError: If the sheet or a selected column does not exist.
+    """
+    with open_workbook(input_file, data_only=True) as workbook:
+        if isinstance(sheet_name, int):
+            if not 0 <= sheet_name < len(workbook.sheetnames):
+                raise ValueError(f"Worksheet index {sheet_name} is invalid, {len(workbook.sheetnames)} worksheets found.")
+            worksheet = workbook.worksheets[sheet_name]
+        elif sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+        else:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found.")
+
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        # Columns without a name are named the same way as in pd.read_excel()
+        header = [f"Unnamed: {index}" if name is None else name for index, name in enumerate(header)]
+
+        # Positions of the selected columns in the rows
+        if columns:
+            missing = [column for column in columns if column not in header]
+            if missing:
+                raise ValueError(f"Unknown columns: {', '.join(map(str, missing))}")
+            indexes = [header.index(column) for column in columns]
+        else:
+            columns = header
+            indexes = None
+
+        chunk = []
+        # Number of empty rows seen since the last data row, added once another data row follows
+        blank_rows = 0
+        for row in rows:
+            if all(value is None for value in row):
+                blank_rows += 1
+                continue
+            if indexes is not None:
+                row = tuple(row[index] if index < len(row) else None for index in indexes)
+            for _ in range(blank_rows):
+                chunk.append((None,) * len(columns))
+                if len(chunk) >= chunksize:
+                    yield pd.DataFrame(chunk, columns=columns)
+                    chunk = []
+            blank_rows = 0
+            chunk.append(row)
+            if len(chunk) >= chunksize:
+                yield pd.DataFrame(chunk, columns=columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns)
+
+
+def read_xlsx(input_file, sheet_name: str | int = 0, chunksize: int = 100_000, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Reads one sheet of an XLSX file with the read-only streaming reader.
+
+    Args:
+        input_file: Path to the XLSX file or a binary file object.
+        sheet_name (str | int): Name or index of the sheet, the first sheet by default.
+        chunksize (int): Number of rows read at once.
+        columns (list[str], optional): Columns to read, all columns if None.
+
+    Returns:
+        pd.DataFrame: The data of the sheet.
+    """
+    chunks = list(iter_xlsx_chunks(input_file, chunksize, sheet_name, columns))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+class XlsxStreamWriter:
+    """
+    The XlsxStreamWriter class writes DataFrame chunks to an XLSX file with constant memory.
+
+    The workbook is created in write-only mode, which writes every appended row out
+    instead of keeping the whole sheet in memory.
+
+    Args:
+        output_file: Path to the XLSX file or a binary buffer, e.g. BytesIO.
+        sheet_name (str): Name of the sheet.
+    """
+
+    def __init__(self, output_file, sheet_name: str = 'Sheet1') -> None:
+        """
+        Initializes the XlsxStreamWriter class with the output file and sheet name.
+
+        Args:
+            output_file: Path to the XLSX file or a binary buffer.
+            sheet_name (str): Name of the sheet.
+        """
+        self.output_file = output_file
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet(sheet_name)
+        self.header_written = False
+        # Columns of the first chunk, the later chunks are written in the same order
+        self.columns = None
+
+    def write_chunk(self, df_chunk: pd.DataFrame) -> None:
+        """
+        Appends the rows of the chunk to the sheet.
+
+        Args:
+            df_chunk (pd.DataFrame): The chunk of data to be written.
+
+        Raises:
+            ValueError: If the chunk has a column the first chunk did not have.
+        """
+        if not self.header_written:
+            self.worksheet.append([str(column) for column in df_chunk.columns])
+            self.header_written = True
+            self.columns = list(df_chunk.columns)
+        elif list(df_chunk.columns) != self.columns:
+            # Columns the chunk lacks are added with missing values, same as in ChunkWriter.align()
+            new_columns = [column for column in df_chunk.columns if column not in self.columns]
+            if new_columns:
+                raise ValueError(f"Columns not in the header of the first chunk: {', '.join(map(str, new_columns))}")
+            df_chunk = df_chunk.reindex(columns=self.columns)
+
+        # Missing values are written as empty cells
+        df_values = df_chunk.astype(object).where(df_chunk.notna(), None)
+        for row in df_values.itertuples(index=False, name=None):
+            self.worksheet.append(row)
+
+    def close(self) -> None:
+        """
+        Saves the workbook to the output file.
+        """
+        self.workbook.save(self.output_file)
+
+
+def write_xlsx(df_load_data: pd.DataFrame, output_file, sheet_name: str = 'Sheet1', chunksize: int = 100_000) -> None:
+    """
+    Writes a DataFrame to an XLSX file with the constant-memory writer.
+
+    Args:
+        df_load_data (pd.DataFrame): Pandas DataFrame to be written.
+        output_file: Path to the XLSX file or a binary buffer.
+        sheet_name (str): Name of the sheet.
+        chunksize (int): Number of rows converted at once.
+    """
+    xlsx_writer = XlsxStreamWriter(output_file, sheet_name)
+    for start in range(0, max(len(df_load_data), 1), chunksize):
+        xlsx_writer.write_chunk(df_load_data.iloc[start:start + chunksize])
+    xlsx_writer.close()
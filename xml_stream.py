@@ -0,0 +1,100 @@
+# Postpone the evaluation of annotations, so the pandas types in them do not import pandas
+from __future__ import annotations
+
+# Import the lazy_import function for importing heavy libraries on first use
+from lazy_import import lazy_import
+
+# Import pandas library for data manipulation, on first use
+pd = lazy_import('pandas')
+
+# Import the iterparse function for reading XML documents element by element
+from xml.etree.ElementTree import iterparse
+
+
+def local_name(tag: str) -> str:
+    """
+    Removes the namespace from an element or attribute name.
+
+    Args:
+        tag (str): The name, e.g. '{http://example.com}row'.
+
+    Returns:
+        str: The name without the namespace, e.g. 'row'.
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+def infer_types(df_chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the columns in which every value is a number to a numeric type.
+
+    Args:
+        df_chunk (pd.DataFrame): Chunk with string values.
+
+    Returns:
+        pd.DataFrame: The chunk with numeric columns converted.
+    """
+    for column in df_chunk.columns:
+        converted = pd.to_numeric(df_chunk[column], errors='coerce')
+        if converted.notna().sum() == df_chunk[column].notna().sum():
+            df_chunk[column] = converted
+    return df_chunk
+
+
+def iter_xml_chunks(input_file, chunksize: int, row_tag: str | None = None):
+    """
+    Reads an XML document in chunks of chunksize rows.
+
+    Every child element of the root element is one row, its attributes and the text of
+    its child elements are the columns, the same as in pd.read_xml(). Each row element
+    is cleared as soon as it is read, so the memory use does not depend on the size of
+    the document.
+
+    Every chunk has the columns of the rows read before it in the order they first
+    appeared, so a chunk whose elements lack a column still has it as missing values.
+
+    Args:
+        input_file: Path to the XML file or a binary file object.
+        chunksize (int): Number of rows per chunk.
+        row_tag (str, optional): Name of the row elements, every child of the root element if None.
+
+    Yields:
+        pd.DataFrame: The next chunk of rows.
+    """
+    rows = []
+    # Columns of all rows read so far, in the order they first appeared
+    columns = {}
+    depth = 0
+    root = None
+
+    for event, element in iterparse(input_file, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+
+        depth -= 1
+        # Only the direct children of the root element are rows
+        if depth != 1:
+            continue
+        if row_tag is not None and local_name(element.tag) != row_tag:
+            root.clear()
+            continue
+
+        row = {local_name(name): value for name, value in element.attrib.items()}
+        for child in element:
+            text = child.text.strip() if child.text else ''
+            row[local_name(child.tag)] = text if text else None
+        rows.append(row)
+        columns.update(dict.fromkeys(row))
+
+        # Drops the rows already read from the tree
+        root.clear()
+
+        if len(rows) >= chunksize:
+            yield infer_types(pd.DataFrame(rows, columns=list(columns)))
+            rows = []
+
+    if rows:
+        yield infer_types(pd.DataFrame(rows, columns=list(columns)))